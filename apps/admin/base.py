@@ -1,5 +1,7 @@
 from sqladmin import ModelView, Admin
 from sqladmin.authentication import AuthenticationBackend
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import joinedload
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 from jose import jwt
@@ -8,7 +10,7 @@ from datetime import timedelta
 from core.config import settings
 from core.security import create_access_token
 from models.user import User, AccountDeletionRequest
-from models.profile import StudentVerification
+from models.profile import Profile, StudentVerification, UserUniversity
 from models.system import Report, Contact
 from models.utility import Tag, Topic
 from models.meeting import Meeting, Review
@@ -124,6 +126,29 @@ class StudentVerificationAdmin(BaseAdmin, model=StudentVerification):
         "education_status",
     ]
 
+    def _status_filter(self, request: Request, stmt: Select) -> Select:
+        # ?status=PENDING 이면 (verification_status, created_time) index로 조회
+        verification_status = request.query_params.get("status")
+        if verification_status:
+            stmt = stmt.where(
+                StudentVerification.verification_status == verification_status
+            )
+        return stmt
+
+    def list_query(self, request: Request) -> Select:
+        # user_name / university 등 표시 컬럼을 row마다 lazy load 하지 않도록
+        stmt = select(StudentVerification).options(
+            joinedload(StudentVerification.profile).joinedload(Profile.user),
+            joinedload(StudentVerification.profile)
+            .joinedload(Profile.user_university)
+            .joinedload(UserUniversity.university),
+        )
+        return self._status_filter(request, stmt)
+
+    def count_query(self, request: Request) -> Select:
+        stmt = select(func.count(StudentVerification.id))
+        return self._status_filter(request, stmt)
+
 
 class MeetingAdmin(BaseAdmin, model=Meeting):
     column_default_sort = ("created_time", True)
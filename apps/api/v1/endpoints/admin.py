@@ -4,7 +4,9 @@ from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 
 import crud
+from core.security import get_admin
 from database.session import get_db
+from database.pool import pool_metrics_snapshot
 from schemas.profile import StudentVerificationUpdate, ReultStatusEnum
 
 router = APIRouter()
@@ -128,3 +130,24 @@ def send_alarm_to_users_without_meetings(
 ):
     is_complete = crud.admin_alarm.to_user_without_meetings(db=db)
     return RedirectResponse(url="/admin/user/list", status_code=303)
+
+
+@router.post("/admin/user/{user_id}/revoke-tokens")
+def revoke_user_tokens(
+    user_id: int, db: Session = Depends(get_db), username: str = Depends(get_admin)
+):
+    """
+    유저에게 발급된 모든 토큰 폐기 (강제 로그아웃)
+    """
+    user = crud.user.revoke_tokens(db=db, user_id=user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"detail": "Tokens revoked"}
+
+
+@router.get("/admin/metrics/db-pool")
+def read_db_pool_metrics(username: str = Depends(get_admin)):
+    """
+    DB 커넥션 풀 상태 (checkout 수, overflow 사용량, checkout 대기 시간 히스토그램)
+    """
+    return pool_metrics_snapshot()
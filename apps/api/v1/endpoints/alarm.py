@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 import crud
 from core.security import oauth2_scheme
-from database.session import get_db
+from database.session import get_db, get_read_db
 from schemas import alarm as alarm_schemas
 from models import user as user_models
 from models import alarm as alarm_models
@@ -16,7 +16,7 @@ router = APIRouter()
 @router.get("/alarms/{user_id}", response_model=alarm_schemas.AlarmListResponse)
 def get_all_alarms_by_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 10,
     token: Annotated[str, Depends(oauth2_scheme)] = None,
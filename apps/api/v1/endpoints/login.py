@@ -24,20 +24,39 @@ from schemas.user import (
     UserUniversityCreate,
     UserNationalityCreate,
     ConfirmPassword,
+    UserPrincipal,
 )
 from models.user import User
 from core.security import (
     get_current_token,
+    get_current_user,
     create_access_token,
     create_refresh_token,
     create_tokens_for_user,
+    build_token_data,
 )
+from core import token_store
+from core.rate_limit import check_rate_limit
 from database.session import get_db
 from core.config import settings
 
 router = APIRouter()
 
 
+def check_certificate_rate_limit(email: str):
+    """
+    인증번호 발송 요청 제한 (이메일별)
+
+    이메일은 요청 body에 있으므로 미들웨어가 아닌 핸들러에서 확인하고,
+    같은 경로의 IP별 제한은 RateLimitMiddleware(RATE_LIMIT_RULES)에서 먼저 처리.
+    Redis 동기 호출이므로 이 함수를 부르는 핸들러는 def로 선언할 것.
+    """
+    window = settings.EMAIL_CODE_RATE_WINDOW_SECONDS
+    check_rate_limit(
+        "certificate:email", email, settings.EMAIL_CODE_PER_EMAIL_LIMIT, window
+    )
+
+
 @router.post("/register", response_model=Dict[str, Any])
 def register_user(
     user_in: UserRegister,
@@ -113,14 +132,7 @@ def login_for_openapi(
         )
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    if user.email:
-        token_data = {"sub": user.email, "auth_method": "email"}
-    else:
-        token_data = {
-            "sub": user.sns_id,
-            "sns_type": user.sns_type,
-            "auth_method": "sns",
-        }
+    token_data = build_token_data(user)
 
     access_token = create_access_token(
         data=token_data, expires_delta=access_token_expires
@@ -177,7 +189,9 @@ def login_for_access_token(login_obj: UserLogin, db: Session = Depends(get_db)):
     # 비밀번호 검증
     ## 일반 로그인
     if login_obj.password and user.password:
-        if not crud.verify_password(login_obj.password, user.password):
+        if not crud.user.verify_and_rehash(
+            db=db, user=user, password=login_obj.password
+        ):
             raise HTTPException(status_code=400, detail="Incorrect credentials")
     ## SNS 로그인
     elif login_obj.sns_type and login_obj.sns_id:
@@ -193,14 +207,7 @@ def login_for_access_token(login_obj: UserLogin, db: Session = Depends(get_db)):
 
     # 토큰 생성 및 반환
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    if user.email:
-        token_data = {"sub": user.email, "auth_method": "email"}
-    else:
-        token_data = {
-            "sub": user.sns_id,
-            "sns_type": user.sns_type,
-            "auth_method": "sns",
-        }
+    token_data = build_token_data(user)
 
     access_token = create_access_token(
         data=token_data, expires_delta=access_token_expires
@@ -215,21 +222,22 @@ def login_for_access_token(login_obj: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/token/refresh")
-async def refresh_token(
+def refresh_token(
     token: str = Depends(get_current_token), db: Session = Depends(get_db)
 ):
     """
     기존 토큰을 새로고침합니다.
 
+    refresh 토큰은 사용할 때마다 새 토큰으로 교체(rotation)되며,
+    이미 사용된 refresh 토큰을 다시 쓰면 같은 로그인에서 발급된 토큰이 모두 폐기됩니다.
+    (DB / Redis 조회가 모두 동기 호출이므로 threadpool에서 실행되도록 def로 선언)
+
     인자:
     - token (str): 현재 refresh_token.
 
     반환값:
-    - Token: 새로고침된 토큰.
+    - Token: 새로고침된 access_token과 새 refresh_token.
     """
-    payload = jwt.decode(
-        token, settings.REFRESH_SECRET_KEY, algorithms=[settings.ALGORITHM]
-    )
     try:
         payload = jwt.decode(
             token, settings.REFRESH_SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -251,85 +259,83 @@ async def refresh_token(
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        # 비밀번호 변경 등으로 token_version이 올라간 이후의 refresh 토큰 거부
+        if "ver" in payload and payload["ver"] != (user.token_version or 0):
+            raise HTTPException(
+                status_code=401,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
     except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except JWTError as e:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    if user.email:
-        token_data = {"sub": user.email, "auth_method": "email"}
+    token_data = build_token_data(user)
+    family = payload.get("fam")
+    if family:
+        try:
+            jti = token_store.rotate(user.id, family, payload.get("jti"))
+        except token_store.RefreshTokenError as e:
+            raise HTTPException(
+                status_code=401,
+                detail=e.detail,
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        new_refresh_token = create_refresh_token(
+            data={**token_data, "fam": family, "jti": jti}
+        )
     else:
-        token_data = {
-            "sub": user.sns_id,
-            "sns_type": user.sns_type,
-            "auth_method": "sns",
-        }
+        # family가 없는 이전 형식의 토큰은 새 family로 전환
+        new_refresh_token = create_refresh_token(data=token_data)
 
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data=token_data, expires_delta=access_token_expires
     )
-    return {"access_token": access_token, "token_type": "bearer"}
+    return {
+        "access_token": access_token,
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer",
+    }
 
 
-@router.get("/token/validate")
-def validate_token(
-    token: str = Depends(get_current_token), db: Session = Depends(get_db)
-):
+@router.post("/logout")
+def logout(token: str = Depends(get_current_token)):
     """
-    제공된 토큰을 검증합니다.
+    refresh 토큰을 폐기합니다. (같은 로그인에서 발급된 refresh 토큰 모두)
 
     인자:
-    - token (str): 'Bearer [토큰]' 형식의 인증 헤더.
-
-    반환값:
-    - dict: 토큰의 검증 상태.
+    - token (str): 현재 refresh_token.
     """
-
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            token,
+            settings.REFRESH_SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"verify_exp": False},
         )
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Could not validate credentials")
 
-        auth_method = payload.get("auth_method")
+    token_store.revoke_family(payload.get("fam"))
+    return {"detail": "Logged out"}
 
-        if auth_method == "email":
-            email = payload.get("sub")
-            if email is None:
-                credentials_exception = HTTPException(
-                    status_code=401,
-                    detail="Could not validate credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-                raise credentials_exception
-            user = crud.user.get_by_email(db=db, email=email)
-        elif auth_method == "sns":
-            sns_id = payload.get("sub")
-            sns_type = payload.get("sns_type")
-            if sns_id is None:
-                credentials_exception = HTTPException(
-                    status_code=401,
-                    detail="Could not validate credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            user = crud.user.get_by_sns(db=db, sns_id=sns_id, sns_type=sns_type)
-        else:
-            raise HTTPException(status_code=400, detail="Unknown auth_method")
 
-        if user is None:
-            raise HTTPException(
-                status_code=401,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+@router.get("/token/validate")
+def validate_token(current_user: UserPrincipal = Depends(get_current_user)):
+    """
+    제공된 토큰을 검증합니다.
 
-    except JWTError:
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    principal 캐시로 검증하므로 캐시 hit이면 유저를 조회하지 않습니다.
+    탈퇴한 유저, 비밀번호 변경 전에 발급된 토큰은 401을 반환합니다.
+
+    인자:
+    - token (str): 'Bearer [토큰]' 형식의 인증 헤더.
 
+    반환값:
+    - dict: 토큰의 검증 상태.
+    """
     # 토큰이 유효하면 아래 메시지 반환
     return {"detail": "Token is valid"}
 
@@ -396,6 +402,13 @@ def change_password(
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        # 이미 비밀번호가 바뀐 뒤(token_version 증가)의 토큰 거부
+        if "ver" in payload and payload["ver"] != (user.token_version or 0):
+            raise HTTPException(
+                status_code=401,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
 
     except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
@@ -405,7 +418,13 @@ def change_password(
     user_in = PasswordUpdate(password=password_data.new_password)
     updated_user = crud.user.update(db=db, db_obj=user, obj_in=user_in)
 
-    return {"detail": "Password changed successfully"}
+    # 기존 토큰은 token_version 증가로 무효화되므로 새 토큰을 함께 반환
+    new_tokens = create_tokens_for_user(user=updated_user)
+    return {
+        "detail": "Password changed successfully",
+        "access_token": new_tokens["token"],
+        "refresh_token": new_tokens["refresh_token"],
+    }
 
 
 @router.post("/check-email")
@@ -438,7 +457,7 @@ def check_mail_exists(email: str, db: Session = Depends(get_db)):
 
 
 @router.post("/change-password/certificate")
-async def certificate_email(
+def certificate_email(
     cert_in: EmailCertificationIn, db: Session = Depends(get_db)
 ):
     """
@@ -454,6 +473,9 @@ async def certificate_email(
     if not "@" in cert_in.email:
         raise HTTPException(status_code=409, detail="This is not Email Form.")
 
+    # 가입 여부 조회 전에 제한해서 제한된 요청이 DB 조회 / 가입 여부 확인에 쓰이지 않게 함
+    check_certificate_rate_limit(cert_in.email)
+
     check_user = crud.user.get_by_email(db=db, email=cert_in.email)
     if not check_user:
         raise HTTPException(status_code=409, detail="User Not Found")
@@ -466,7 +488,9 @@ async def certificate_email(
     # DB에 인증 데이터 저장
     try:
         certi = crud.user.create_email_certification(db=db, obj_in=user_cert)
-        if crud.send_email(certification, cert_in.email):
+        if crud.send_email(
+            certification, cert_in.email, language_code=cert_in.language_code
+        ):
             return {
                 "result": "success",
                 "email": cert_in.email,
@@ -495,12 +519,12 @@ async def certificate_check_change_pw(
     user_cert = crud.user.get_email_certification(
         db, email=cert_check.email, certification=str(cert_check.certification)
     )
-    if user_cert:
-
+    user = crud.user.get_by_email(db=db, email=cert_check.email) if user_cert else None
+    if user:
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        token_data = {"sub": cert_check.email, "auth_method": "email"}
+        # uid/ver를 담아 비밀번호 변경 후에는 이 토큰도 거부되도록
         access_token = create_access_token(
-            data=token_data, expires_delta=access_token_expires
+            data=build_token_data(user), expires_delta=access_token_expires
         )
         # db.delete(user_cert)
         # db.commit()
@@ -509,7 +533,7 @@ async def certificate_check_change_pw(
 
 
 @router.post("/certificate")
-async def certificate_email(
+def certificate_email(
     cert_in: EmailCertificationIn, db: Session = Depends(get_db)
 ):
     """
@@ -525,6 +549,8 @@ async def certificate_email(
     if not "@" in cert_in.email:
         raise HTTPException(status_code=409, detail="This is not Email Form.")
 
+    check_certificate_rate_limit(cert_in.email)
+
     check_user = crud.user.get_by_email(db=db, email=cert_in.email)
     if check_user:
         raise HTTPException(status_code=409, detail="Email already registered.")
@@ -537,7 +563,9 @@ async def certificate_email(
     # DB에 인증 데이터 저장
     try:
         certi = crud.user.create_email_certification(db=db, obj_in=user_cert)
-        if crud.send_email(certification, cert_in.email):
+        if crud.send_email(
+            certification, cert_in.email, language_code=cert_in.language_code
+        ):
             return {
                 "result": "success",
                 "email": cert_in.email,
@@ -4,8 +4,8 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 import crud
-from core.security import oauth2_scheme
-from database.session import get_db
+from core.security import oauth2_scheme, get_current_user
+from database.session import get_db, get_read_db
 from schemas.meeting import (
     MeetingResponse,
     MeetingCreate,
@@ -28,6 +28,7 @@ from schemas.meeting import (
 from models.meeting import Meeting, MeetingUser, Review
 from models.user import User
 from schemas.enum import CreatorNationalityEnum
+from schemas.user import UserPrincipal
 from log import log_error
 
 router = APIRouter()
@@ -244,16 +245,28 @@ def get_meetings_by_user_university(
     user_id: int,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db),
-    token: Annotated[str, Depends(oauth2_scheme)] = None,
+    db: Session = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
     """
     특정 유저의 학교에서 모집중인 모임 조회
+
+    본인 조회면 principal의 학교를 사용하므로 유저 / 학교를 다시 조회하지 않는다.
     """
-    check_obj = crud.get_object_or_404(db=db, model=User, obj_id=user_id)
+    university_id = None
+    if current_user.id == user_id:
+        if current_user.university_id is None:
+            raise HTTPException(status_code=400, detail="University is not exists")
+        university_id = current_user.university_id
+    else:
+        check_obj = crud.get_object_or_404(db=db, model=User, obj_id=user_id)
     try:
         meetings, total_count = crud.meeting.get_meetings_by_university(
-            db=db, user_id=user_id, skip=skip, limit=limit
+            db=db,
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            university_id=university_id,
         )
     except HTTPException as e:
         raise e
@@ -267,7 +280,7 @@ def get_meetings_by_user_university(
 @router.get("/meeting/{meeting_id}", response_model=MeetingDetailResponse)
 def get_meeting_detail(
     meeting_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -300,7 +313,8 @@ def get_meeting_detail(
 
     - **languages**: 모임과 연결된 언어 목록.
 
-    - **users_languages** : 모임에 참가한 유저들의 언어 목록(level 포함)
+    - **users_languages** : 모임 언어 중 참가자(모임장 + 승인된 유저)가
+      사용할 수 있는 언어 목록 (모임 언어 순서, level 없음)
 
     반환값:
         위의 세부 정보를 포함한 특정 모임의 상세 정보
@@ -308,7 +322,9 @@ def get_meeting_detail(
     check_obj = crud.get_object_or_404(db=db, model=Meeting, obj_id=meeting_id)
 
     try:
-        meeting = crud.meeting.get(db=db, id=meeting_id)
+        meeting = crud.meeting.get(
+            db=db, id=meeting_id, load_for=MeetingDetailResponse
+        )
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -356,7 +372,7 @@ def update_meeting(
 def get_meeting(
     user_id: int = None,
     is_public: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     order_by: MeetingOrderingEnum = MeetingOrderingEnum.CREATED_TIME,
     skip: int = 0,
     limit: int = 10,
@@ -448,7 +464,7 @@ def get_meeting(
 @router.get("/meeting/reviews/{user_id}", response_model=ReviewListReponse)
 def get_meeting_all_review(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 10,
     token: Annotated[str, Depends(oauth2_scheme)] = None,
@@ -534,7 +550,7 @@ def delete_review(
 
 
 @router.get("/review/{review_id}", response_model=ReviewResponse)
-def get_review(review_id: int, db: Session = Depends(get_db)):
+def get_review(review_id: int, db: Session = Depends(get_read_db)):
     check_obj = crud.get_object_or_404(db=db, model=Review, obj_id=review_id)
     try:
         obj = crud.review.get(db=db, id=review_id)
@@ -15,6 +15,7 @@ from fastapi import (
     Path,
     Query,
     Request,
+    Response,
     status,
 )
 from pydantic.networks import EmailStr
@@ -22,7 +23,7 @@ from sqlalchemy.orm import Session
 
 import crud
 from core.security import oauth2_scheme
-from database.session import get_db
+from database.session import get_db, get_read_db
 from core.config import settings
 from schemas.profile import (
     ProfileResponse,
@@ -32,6 +33,7 @@ from schemas.profile import (
     ProfileRegister,
     StudentVerificationBase,
     StudentVerificationCreate,
+    StudentVerificationQueueResponse,
 )
 from schemas.enum import MyMeetingEnum, MeetingOrderingEnum, ReultStatusEnum
 from schemas.meeting import MeetingListResponse
@@ -39,11 +41,13 @@ from log import log_error
 
 router = APIRouter()
 
+NICK_NAME_SPECIAL_CHARACTERS = re.compile(r"[~!@#$%^&*()_+{}[\]:;<>,.?~]")
+
 
 @router.get("/profile/photos")
 def get_profile_photos(
-    user_ids: List[str] = Query(None),
-    db: Session = Depends(get_db),
+    user_ids: List[int] = Query([]),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -51,27 +55,7 @@ def get_profile_photos(
 
     - ex) /profiles/photos?user_ids=1&user_ids=2&user_ids=3
     """
-    return_list = []
-    for id in user_ids:
-        national_list = []
-        user = crud.user.get(db=db, id=id)
-        if not user:
-            continue
-        profile = crud.profile.get_by_user_id(db=db, user_id=id)
-        nationalites = crud.user.read_nationalities(db=db, user_id=id)
-        if nationalites:
-            for nan in nationalites:
-                nationality = crud.utility.get(db=db, nationality_id=nan.nationality_id)
-                national_list.append(nationality.to_dict())
-
-        photo_dict = {
-            "user_id": int(id),
-            "profile_photo": profile.profile_photo if profile else None,
-            "nick_name": profile.nick_name if profile else None,
-            "nationalities": national_list,
-        }
-        return_list.append(photo_dict)
-    return return_list
+    return crud.profile.get_profile_cards(db=db, user_ids=user_ids)
 
 
 @router.post("/profile/photo")
@@ -103,9 +87,9 @@ def update_profile_photo(
 
 
 @router.get("/profile/nick-name")
-async def check_nick_name(
+def check_nick_name(
     nick_name: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -124,7 +108,7 @@ async def check_nick_name(
 
     # 닉네임 유효성 검사 (특수문자 포함 여부 및 예약어 사용 여부)
     if (
-        re.search(r"[~!@#$%^&*()_+{}[\]:;<>,.?~]", nick_name)
+        NICK_NAME_SPECIAL_CHARACTERS.search(nick_name)
         or "admin" in nick_name.lower()
         or "관리자" in nick_name.lower()
     ):
@@ -133,8 +117,7 @@ async def check_nick_name(
             detail="Nick_name contains special characters or restricted keywords.",
         )
 
-    exists_nick = crud.profile.get_by_nick_name(db=db, nick_name=nick_name)
-    if exists_nick:
+    if crud.profile.is_nick_name_taken(db=db, nick_name=nick_name):
         raise HTTPException(status_code=409, detail="nick_name already used")
 
     return {"status": "Nick_name is available."}
@@ -157,11 +140,13 @@ def get_random_image():
 @router.get("/profile/random-nickname")
 def get_random_nickname_with_extenal(
     os_lang: str = "kr",
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
-
-    return {"kr_nick_name": "", "en_nick_name": ""}
+    """
+    사용 가능한 랜덤 닉네임 (os_lang과 관계없이 kr_nick_name, en_nick_name 모두 반환)
+    """
+    return crud.profile.get_random_nick_name(db=db)
 
 
 @router.post("/student-card", response_model=StudentVerificationBase)
@@ -234,22 +219,38 @@ def read_student_varification(
     return db_obj
 
 
-@router.get("/student-cards", response_model=List[StudentVerificationBase])
+@router.get("/student-cards", response_model=List[StudentVerificationQueueResponse])
 def read_student_cards(
-    db: Session = Depends(get_db),
+    response: Response,
+    status: ReultStatusEnum = None,
+    limit: int = Query(None, ge=1, le=100),
+    cursor: str = None,
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
-    학생증 인증을 대기 중인 목록을 반환합니다.
+    학생증 인증 목록을 오래 기다린 순서로 반환합니다.
+
+    limit을 지정하면 한 페이지씩 조회하고, 다음 페이지 cursor는
+    X-Next-Cursor 헤더, 전체 개수는 X-Total-Count 헤더로 반환합니다.
+    (limit이 없으면 이전과 같이 전체 목록)
 
     **인자:**
+    - status (ReultStatusEnum): 인증 상태, 없으면 전체 (심사 대기열은 PENDING).
+    - limit (int): 한 페이지 개수.
+    - cursor (str): 이전 응답의 X-Next-Cursor, 지정하면 다음 페이지 조회.
     - db (Session): 데이터베이스 세션.
 
     **반환값:**
-    - List[StudentVerificationBase]: 학생증 인증 대기 중인 목록.
+    - List[StudentVerificationQueueResponse]: 학생증 인증 목록.
     """
-    obj_list = crud.profile.list_verification(db=db)
-    return obj_list
+    student_cards, total_count, next_cursor = crud.profile.list_verification(
+        db=db, status=status, limit=limit, cursor=cursor
+    )
+    response.headers["X-Total-Count"] = str(total_count)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return student_cards
 
 
 @router.delete("/profile/user/{user_id}")
@@ -297,7 +298,7 @@ async def delete_profile_photo(
 @router.get("/profile/{user_id}", response_model=ProfileResponse)
 def get_profile_by_user_id(
     user_id: int = Path(..., title="The ID of the user"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -310,7 +311,9 @@ def get_profile_by_user_id(
     반환값:
     - ProfileBase: 지정된 user_id에 해당하는 사용자의 프로필 정보.
     """
-    db_profile = crud.profile.get_by_user_id(db, user_id=user_id)
+    db_profile = crud.profile.get_by_user_id(
+        db, user_id=user_id, load_for=ProfileResponse
+    )
     if not db_profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     return db_profile
@@ -416,27 +419,27 @@ def update_profile(
     """
     new_profile = None
     # 프로필 존재 확인
-    existing_profile = crud.profile.get(db=db, id=profile_id)
+    existing_profile = crud.profile.get(
+        db=db, id=profile_id, load_for=ProfileResponse
+    )
     if not existing_profile:
         raise HTTPException(status_code=404, detail="Profile not found")
 
     new_nickname = profile_in.nick_name
     if new_nickname:
-        if re.search(r"[~!@#$%^&*()_+{}[\]:;<>,.?~]", new_nickname):
+        if NICK_NAME_SPECIAL_CHARACTERS.search(new_nickname):
             raise HTTPException(
                 status_code=400, detail="Nick_name contains special characters."
             )
-        check_exists_nickname = crud.profile.get_by_nick_name(
-            db=db, nick_name=new_nickname
-        )
-        if check_exists_nickname:
-            raise HTTPException(status_code=409, detail="nick_name already used")
 
+    # 닉네임 중복은 unique index로 확인 (crud.profile.update에서 409)
     try:
         new_profile = crud.profile.update(
             db=db, db_obj=existing_profile, obj_in=profile_in
         )
         return new_profile
+    except HTTPException:
+        raise
     except Exception as e:
         log_error(e)
         raise HTTPException(status_code=500, detail="Error updating profile")
@@ -447,9 +450,10 @@ def get_user_meetings(
     user_id: int,
     order_by: MeetingOrderingEnum = None,
     status: MyMeetingEnum = MyMeetingEnum.APPROVE.value,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: int = 10,
+    cursor: str = None,
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -459,12 +463,23 @@ def get_user_meetings(
         - APPROVE : 승인 완료된 모임(현재 참여중인 모임)
         - Pending : 승인 대기중 모임
         - PAST : 과거 참여했던 모임
+    - **cursor** : 이전 응답의 next_cursor, 지정하면 skip 대신 다음 페이지 조회
     """
     user = crud.user.get(db=db, id=user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="user not found")
 
-    meetings, total_count = crud.profile.get_user_all_meetings(
-        db=db, order_by=order_by, user_id=user_id, status=status, skip=skip, limit=limit
+    meetings, total_count, next_cursor = crud.profile.get_user_all_meetings(
+        db=db,
+        order_by=order_by,
+        user_id=user_id,
+        status=status,
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
     )
-    return {"meetings": meetings, "total_count": total_count}
+    return {
+        "meetings": meetings,
+        "total_count": total_count,
+        "next_cursor": next_cursor,
+    }
@@ -34,20 +34,24 @@ router = APIRouter()
 
 
 @router.get("/users/me", response_model=UserResponse)
-async def read_current_user(
+def read_current_user(
     current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
     현재 사용자의 정보를 반환합니다.
 
     **인자:**
-    - current_user (User): 현재 인증된 사용자.
+    - current_user (UserPrincipal): 현재 인증된 사용자.
 
     **반환값:**
     - dict: 인증된 사용자의 정보.
     """
-    return current_user
+    user = crud.user.get(db=db, id=current_user.id, load_for=UserResponse)
+    if user is None:
+        raise HTTPException(status_code=404, detail="Users not found")
+    return user
 
 
 @router.get("/users", response_model=UserListResponse)
@@ -92,7 +96,7 @@ def read_user(
 
     * 조회된 사용자의 정보
     """
-    users = crud.user.get(db=db, id=user_id)
+    users = crud.user.get(db=db, id=user_id, load_for=UserResponse)
     if users is None:
         raise HTTPException(status_code=404, detail="Users not found")
     return users
@@ -7,7 +7,7 @@ from sqlalchemy import or_, asc, desc
 import crud
 from core.security import oauth2_scheme
 from log import log_error
-from database.session import get_db
+from database.session import get_db, get_read_db
 from schemas.utility import (
     LanguageBase,
     UniversityBase,
@@ -26,7 +26,7 @@ router = APIRouter()
 def get_languages(
     os_language: OsLanguage = None,
     search: str = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: Optional[int] = None,
     token: Annotated[str, Depends(oauth2_scheme)] = None,
@@ -78,7 +78,7 @@ def get_languages(
 def get_universities(
     os_language: OsLanguage = None,
     search: str = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: Optional[int] = None,
 ):
@@ -106,7 +106,7 @@ def get_universities(
 def get_countries(
     os_language: OsLanguage = None,
     search: str = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = 0,
     limit: Optional[int] = None,
     token: Annotated[str, Depends(oauth2_scheme)] = None,
@@ -140,7 +140,7 @@ def get_countries(
 def read_tags(
     is_custom: bool = None,
     is_home: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
@@ -158,7 +158,7 @@ def read_tags(
 @router.get("/topics", response_model=List[TopicResponse])
 def read_topics(
     is_custom: bool = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     token: Annotated[str, Depends(oauth2_scheme)] = None,
 ):
     """
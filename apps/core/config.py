@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +14,33 @@ class Setting(BaseSettings):
     POSTGRES_HOST: str
     DB_ROOT_PASSWORD: str
     TEST_DB: str
+    # 읽기 전용 Replica (미설정 시 Primary 하나만 사용)
+    POSTGRES_REPLICA_HOST: Optional[str] = None
+    # 쓰기 요청 이후 해당 유저의 읽기를 Primary로 고정하는 시간(초)
+    READ_YOUR_WRITES_SECONDS: int = 5
+    # 모임 참가 승인 시 row lock 대기 최대 시간(ms)
+    JOIN_APPROVE_LOCK_TIMEOUT_MS: int = 3000
+
+    ## DB Timeout
+    # 기본 statement_timeout / 커넥션 풀 checkout 대기 시간(ms)
+    DB_STATEMENT_TIMEOUT_MS: int = 15000
+    DB_POOL_TIMEOUT_MS: int = 10000
+    # 경로 prefix별 타임아웃, 가장 길게 일치하는 prefix 적용
+    DB_ROUTE_TIMEOUTS: Dict[str, Dict[str, int]] = {
+        "/v1/meetings": {"statement_timeout_ms": 5000, "pool_timeout_ms": 3000},
+        "/v1/languages": {"statement_timeout_ms": 3000, "pool_timeout_ms": 3000},
+        "/v1/universty": {"statement_timeout_ms": 3000, "pool_timeout_ms": 3000},
+        "/v1/nationality": {"statement_timeout_ms": 3000, "pool_timeout_ms": 3000},
+        # sqladmin UI와 /v1/admin API (통계 / 토큰 폐기 등 관리자 작업)
+        "/admin": {"statement_timeout_ms": 60000, "pool_timeout_ms": 10000},
+        "/v1/admin": {"statement_timeout_ms": 60000, "pool_timeout_ms": 10000},
+    }
+
+    ## Query Counter
+    # 한 요청에서 같은 형태의 쿼리가 이 횟수를 넘으면 N+1 경고
+    QUERY_REPEAT_THRESHOLD: int = 10
+    # True면 경고 대신 예외 발생 (테스트용)
+    QUERY_COUNTER_STRICT: bool = False
     CORS_ORIGINS: str
 
     NICKNAME_API: str
@@ -28,12 +55,74 @@ class Setting(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: int
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     ALGORITHM: str
+    ## Password Hashing
+    # bcrypt cost factor, 변경 시 다음 로그인에서 자동으로 재해싱
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # 해싱 전용 스레드 수 / 추가 대기 가능한 작업 수 (초과 시 503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 16
+    PASSWORD_HASH_TIMEOUT_SECONDS: int = 10
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+    ## Email Certification
+    EMAIL_CODE_TTL_SECONDS: int = 300
+    # 틀린 인증번호 입력 허용 횟수, 초과 시 인증번호 삭제
+    EMAIL_CODE_MAX_ATTEMPTS: int = 5
+    # 인증번호 발송 제한 (window 초 동안 이메일별 최대 요청 수)
+    # IP별 제한은 RATE_LIMIT_RULES의 /v1/certificate 규칙
+    EMAIL_CODE_RATE_WINDOW_SECONDS: int = 600
+    EMAIL_CODE_PER_EMAIL_LIMIT: int = 5
+    ## Rate Limit
+    RATE_LIMIT_ENABLED: bool = True
+    # "METHOD 경로"별 token bucket
+    # rate: 초당 충전되는 요청 수, burst: 연속으로 허용하는 요청 수, key: ip | user
+    RATE_LIMIT_RULES: Dict[str, Dict[str, Any]] = {
+        "POST /v1/login": {"rate": 0.2, "burst": 10, "key": "ip"},
+        "POST /v1/token": {"rate": 0.2, "burst": 10, "key": "ip"},
+        "POST /v1/certificate": {"rate": 0.05, "burst": 5, "key": "ip"},
+        "POST /v1/change-password/certificate": {
+            "rate": 0.05,
+            "burst": 5,
+            "key": "ip",
+        },
+        "GET /v1/profile/nick-name": {"rate": 2, "burst": 20, "key": "user"},
+        "POST /v1/meeting/join/request": {"rate": 0.5, "burst": 10, "key": "user"},
+        "POST /v1/chat/alarm": {"rate": 2, "burst": 30, "key": "user"},
+    }
+    # Redis 장애 시 사용하는 프로세스 내 버킷 수 / Redis 재시도 간격
+    RATE_LIMIT_LOCAL_BUCKETS: int = 10000
+    RATE_LIMIT_REDIS_RETRY_SECONDS: int = 5
+    # X-Real-IP 헤더를 믿을 프록시(nginx) 주소 / 대역
+    # 기본값은 docker bridge 네트워크, 백엔드 포트를 직접 노출하면 nginx 주소로 좁힐 것
+    TRUSTED_PROXIES: List[str] = ["127.0.0.1/32", "172.16.0.0/12"]
+    # 인증 유저 principal 캐시 (Redis / 프로세스 내 LRU)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 300
+    PRINCIPAL_LOCAL_CACHE_TTL_SECONDS: int = 10
+    PRINCIPAL_LOCAL_CACHE_SIZE: int = 1024
+    # /profile/photos 유저별 profile card 캐시
+    PROFILE_CARD_CACHE_TTL_SECONDS: int = 600
+    # 닉네임 사용 여부 확인 시 Redis set 사용 (False면 항상 DB index 조회)
+    NICK_NAME_INDEX_ENABLED: bool = True
+    # 미리 검증해서 언어별로 채워두는 랜덤 닉네임 수 / 채우는 주기
+    NICK_NAME_POOL_SIZE: int = 200
+    NICK_NAME_POOL_REFILL_SECONDS: int = 60
+    # pool에서 꺼낸 닉네임을 다시 채우지 않는 시간 (가입 화면에서 쓰는 동안)
+    NICK_NAME_POOL_ISSUED_TTL_SECONDS: int = 3600
+    # 유저별 내 모임 목록 캐시 (DEADLINE_SOON은 현재 시간 기준이라 짧게)
+    USER_MEETINGS_CACHE_TTL_SECONDS: int = 60
 
     ## SMTP
     SMTP_SERVER: str
     SMTP_PORT: int
     SMTP_USER: str
     SMTP_PASSWORD: str
+    # 로컬 테스트용 SMTP 서버처럼 STARTTLS를 지원하지 않는 경우 False
+    SMTP_USE_TLS: bool = True
+    # 메일 발송 워커(=유지하는 SMTP 연결) 수, 큐 크기, 재시도
+    MAIL_WORKERS: int = 2
+    MAIL_QUEUE_SIZE: int = 1000
+    MAIL_MAX_RETRIES: int = 3
+    MAIL_RETRY_BACKOFF_SECONDS: float = 1.0
+    MAIL_IDLE_TIMEOUT_SECONDS: float = 60.0
     S3_URL: str
 
     AWS_ACCESS_KEY_ID: str
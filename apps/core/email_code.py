@@ -0,0 +1,81 @@
+"""
+이메일 인증번호 저장소 (Redis)
+
+- email_code:{email} 해시에 code / attempts 저장, 5분 TTL로 자동 만료
+- 틀린 번호를 EMAIL_CODE_MAX_ATTEMPTS 번 넘게 입력하면 인증번호 삭제
+- Redis 장애 시 None을 반환하고, 호출하는 쪽(crud.user)에서 EmailCertification 테이블 사용
+"""
+from typing import Optional
+
+from core.config import settings
+from core.redis_driver import redis_driver
+from log import log_error
+
+EMAIL_CODE_NAME_SPACE = "email_code"
+
+CODE_MATCHED = 1
+CODE_MISMATCHED = 0
+CODE_NOT_FOUND = -1
+
+# 일치하면 1, 불일치면 attempts 증가(초과 시 삭제) 후 0, 없으면 -1
+_CHECK_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return -1
+end
+if code == ARGV[1] then
+    return 1
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+_check_script = None
+
+
+def _code_key(email: str) -> str:
+    return f"{EMAIL_CODE_NAME_SPACE}:{email}"
+
+
+def save_code(email: str, code: str) -> bool:
+    """
+    인증번호 저장 (같은 이메일의 이전 인증번호는 덮어씀), Redis 장애 시 False
+    """
+    key = _code_key(email)
+    try:
+        pipe = redis_driver.redis_client.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping={"code": str(code), "attempts": 0})
+        pipe.expire(key, settings.EMAIL_CODE_TTL_SECONDS)
+        pipe.execute()
+        return True
+    except Exception as e:
+        log_error(f"email code store failed: {e}")
+        return False
+
+
+def check_code(email: str, code: str) -> Optional[int]:
+    """
+    CODE_MATCHED / CODE_MISMATCHED / CODE_NOT_FOUND, Redis 장애 시 None
+    """
+    global _check_script
+
+    try:
+        if _check_script is None:
+            _check_script = redis_driver.redis_client.register_script(_CHECK_SCRIPT)
+        return _check_script(
+            keys=[_code_key(email)],
+            args=[str(code), settings.EMAIL_CODE_MAX_ATTEMPTS],
+        )
+    except Exception as e:
+        log_error(f"email code check failed: {e}")
+        return None
+
+
+def delete_code(email: str) -> None:
+    try:
+        redis_driver.redis_client.delete(_code_key(email))
+    except Exception as e:
+        log_error(f"email code delete failed: {e}")
@@ -0,0 +1,80 @@
+"""
+비밀번호 해싱 전용 executor
+
+bcrypt는 의도적으로 느린 해시라서 요청 threadpool에서 바로 실행하면
+로그인/회원가입이 몰릴 때 threadpool을 모두 점유해 일반 GET 요청까지 밀린다.
+
+- 해싱은 PASSWORD_HASH_WORKERS 개의 전용 스레드에서만 실행
+- 실행 중 + 대기 중인 작업이 PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE 를
+  넘으면 바로 503을 반환해서 요청 스레드가 대기열에 쌓이지 않게 함
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from core.config import settings
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+_slots = threading.BoundedSemaphore(
+    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+def _busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry",
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
+
+
+def run_hashing(func: Callable, *args):
+    """
+    해싱 함수를 전용 executor에서 실행하고 결과를 기다림
+
+    대기열이 가득 찼거나 PASSWORD_HASH_TIMEOUT_SECONDS 안에 끝나지 않으면 503
+    """
+    if not _slots.acquire(blocking=False):
+        raise _busy_exception()
+
+    try:
+        future = _executor.submit(func, *args)
+    except Exception:
+        _slots.release()
+        raise
+    future.add_done_callback(lambda _: _slots.release())
+
+    try:
+        return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+    except TimeoutError:
+        raise _busy_exception()
+
+
+def hash_password(password: str) -> str:
+    return run_hashing(pwd_context.hash, password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return run_hashing(pwd_context.verify, plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    검증 결과와, cost factor(rounds)가 바뀌었으면 새 해시를 함께 반환
+    """
+    return run_hashing(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
@@ -0,0 +1,190 @@
+"""
+SMTP 메일 발송 서비스
+
+요청 처리 중에 SMTP 연결 / STARTTLS / 로그인을 매번 하지 않도록
+
+- 메일은 큐에 넣고 바로 반환 (send 성공 여부를 기다리지 않음)
+- 워커 스레드마다 인증된 SMTP 연결 하나를 유지하며 재사용 (워커 수 = 연결 풀 크기)
+- 연결이 끊기거나 일시적인 오류면 재연결 후 MAIL_MAX_RETRIES 번까지 재시도
+- MAIL_IDLE_TIMEOUT_SECONDS 동안 보낼 메일이 없으면 연결 종료
+"""
+import queue
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import List, Optional
+
+from core.config import settings
+from log import log_error
+
+
+@dataclass
+class MailMessage:
+    receiver: str
+    subject: str
+    html: str
+    attempts: int = 0
+
+
+class MailSender:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        use_tls: bool = True,
+        workers: int = 2,
+        queue_size: int = 1000,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.idle_timeout = idle_timeout
+
+        self.queue: "queue.Queue[Optional[MailMessage]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self.sent_count = 0
+        self.failed_count = 0
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run, name=f"mail-sender-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        큐에 남은 메일을 모두 처리한 뒤 워커 종료
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self.queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def flush(self):
+        """
+        큐에 들어간 메일이 모두 처리될 때까지 대기 (테스트/벤치마크용)
+        """
+        self.queue.join()
+
+    def enqueue(self, receiver: str, subject: str, html: str) -> bool:
+        """
+        발송 큐에 추가, 큐가 가득 차면 False
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(MailMessage(receiver, subject, html))
+            return True
+        except queue.Full:
+            log_error(f"mail queue is full, dropped mail to {receiver}")
+            return False
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.use_tls:
+            server.starttls()
+        if self.user:
+            server.login(self.user, self.password)
+        return server
+
+    def _close(self, server: Optional[smtplib.SMTP]):
+        if server is None:
+            return
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _build(self, message: MailMessage) -> str:
+        msg = MIMEMultipart()
+        msg["From"] = self.user
+        msg["To"] = message.receiver
+        msg["Subject"] = message.subject
+        msg.attach(MIMEText(message.html, "html"))
+        return msg.as_string()
+
+    def _run(self):
+        server = None
+        while True:
+            try:
+                message = self.queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                self._close(server)
+                server = None
+                continue
+
+            if message is None:
+                self.queue.task_done()
+                self._close(server)
+                return
+
+            server = self._deliver(server, message)
+            self.queue.task_done()
+
+    def _deliver(
+        self, server: Optional[smtplib.SMTP], message: MailMessage
+    ) -> Optional[smtplib.SMTP]:
+        body = self._build(message)
+        while True:
+            message.attempts += 1
+            try:
+                if server is None:
+                    server = self._connect()
+                server.sendmail(self.user, message.receiver, body)
+                with self._lock:
+                    self.sent_count += 1
+                return server
+            except smtplib.SMTPRecipientsRefused as e:
+                # 주소 문제는 재시도해도 실패
+                log_error(f"mail to {message.receiver} refused: {e}")
+                with self._lock:
+                    self.failed_count += 1
+                return server
+            except (smtplib.SMTPException, OSError) as e:
+                self._close(server)
+                server = None
+                if message.attempts > self.max_retries:
+                    log_error(
+                        f"mail to {message.receiver} failed after "
+                        f"{message.attempts} attempts: {e}"
+                    )
+                    with self._lock:
+                        self.failed_count += 1
+                    return None
+                time.sleep(self.retry_backoff * message.attempts)
+
+
+mail_sender = MailSender(
+    host=settings.SMTP_SERVER,
+    port=settings.SMTP_PORT,
+    user=settings.SMTP_USER,
+    password=settings.SMTP_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    workers=settings.MAIL_WORKERS,
+    queue_size=settings.MAIL_QUEUE_SIZE,
+    max_retries=settings.MAIL_MAX_RETRIES,
+    retry_backoff=settings.MAIL_RETRY_BACKOFF_SECONDS,
+    idle_timeout=settings.MAIL_IDLE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,113 @@
+"""
+닉네임 사용 여부 Redis set
+
+/profile/nick-name 은 입력할 때마다 호출되므로 DB 조회 전에 Redis set으로 판단한다.
+
+- nick_names       : 사용 중인 닉네임(소문자) set
+- nick_names:ready : set이 DB 기준으로 다시 만들어진 뒤에만 존재하는 표시
+
+ready 표시가 있고 set에 없으면 DB 조회 없이 사용 가능으로 응답하고,
+set에 있으면 lower(nick_name) unique index로 한 번 더 확인한다.
+프로필 생성/수정/삭제 시 set을 갱신하고, 주기적으로 DB 기준으로 다시 만든다.
+(관리자 화면 수정 등으로 어긋나도 저장 시 unique index가 중복을 막음)
+
+다시 만드는 동안 추가된 닉네임이 교체로 사라지지 않도록, 추가 / 삭제는
+임시 set(nick_names:build)에도 함께 반영하고 임시 set은 DB 조회 전에 비운다.
+"""
+from typing import Callable, Iterable, Optional
+
+from core.config import settings
+from core.redis_driver import redis_driver
+
+NICK_NAME_SET = "nick_names"
+NICK_NAME_READY = "nick_names:ready"
+_BUILD_SET = "nick_names:build"
+_REBUILD_LOCK = "nick_names:rebuild_lock"
+_REBUILD_LOCK_SECONDS = 600
+_BATCH_SIZE = 1000
+
+
+def normalize_nick_name(nick_name: str) -> str:
+    # lower(nick_name) unique index와 같은 기준
+    return nick_name.lower()
+
+
+def nick_name_in_set(nick_name: str) -> Optional[bool]:
+    """
+    set 기준 사용 여부, set이 준비되지 않았거나 Redis 장애면 None
+    """
+    if not settings.NICK_NAME_INDEX_ENABLED:
+        return None
+    try:
+        pipe = redis_driver.redis_client.pipeline(transaction=False)
+        pipe.exists(NICK_NAME_READY)
+        pipe.sismember(NICK_NAME_SET, normalize_nick_name(nick_name))
+        ready, is_member = pipe.execute()
+    except Exception:
+        return None
+    if not ready:
+        return None
+    return bool(is_member)
+
+
+def add_nick_names(*nick_names) -> None:
+    names = [normalize_nick_name(name) for name in nick_names if name]
+    if not names:
+        return
+    try:
+        pipe = redis_driver.redis_client.pipeline(transaction=False)
+        pipe.sadd(NICK_NAME_SET, *names)
+        pipe.sadd(_BUILD_SET, *names)
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def remove_nick_names(*nick_names) -> None:
+    names = [normalize_nick_name(name) for name in nick_names if name]
+    if not names:
+        return
+    try:
+        pipe = redis_driver.redis_client.pipeline(transaction=False)
+        pipe.srem(NICK_NAME_SET, *names)
+        pipe.srem(_BUILD_SET, *names)
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def rebuild_nick_names(load_nick_names: Callable[[], Iterable[str]]) -> int:
+    """
+    임시 set에 모두 넣은 뒤 RENAME으로 교체하고 ready 표시
+
+    - 임시 set을 비운 뒤에 load_nick_names()로 DB를 조회해야
+      그 사이에 add_nick_names로 들어온 닉네임이 빠지지 않음
+    - 여러 워커가 동시에 실행하면 하나만 다시 만들고 나머지는 -1 반환
+    """
+    client = redis_driver.redis_client
+    if not client.set(_REBUILD_LOCK, 1, nx=True, ex=_REBUILD_LOCK_SECONDS):
+        return -1
+    try:
+        client.delete(_BUILD_SET)
+        batch = []
+        for name in load_nick_names():
+            if not name:
+                continue
+            batch.append(normalize_nick_name(name))
+            if len(batch) >= _BATCH_SIZE:
+                client.sadd(_BUILD_SET, *batch)
+                batch = []
+        if batch:
+            client.sadd(_BUILD_SET, *batch)
+
+        pipe = client.pipeline()
+        pipe.scard(_BUILD_SET)
+        pipe.rename(_BUILD_SET, NICK_NAME_SET)
+        pipe.set(NICK_NAME_READY, 1)
+        count, renamed, _ = pipe.execute(raise_on_error=False)
+        if isinstance(renamed, Exception):
+            # 임시 set이 없음 = DB에도, 그 사이 추가된 닉네임도 없음
+            client.delete(NICK_NAME_SET)
+        return count
+    finally:
+        client.delete(_REBUILD_LOCK)
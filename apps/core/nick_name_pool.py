@@ -0,0 +1,154 @@
+"""
+랜덤 닉네임 생성 / 미리 검증된 닉네임 pool
+
+외부 API 대신 형용사 + 명사 + 두 자리 숫자 조합으로 생성한다.
+(한국어: "행복한고양이42", 영어: "HappyCat42", 특수문자 없음)
+
+scheduler가 DB에서 사용 중이 아닌 것으로 확인된 닉네임을 언어별 Redis set에
+NICK_NAME_POOL_SIZE 개까지 채워두고, 요청에서는 SPOP 한 번으로 꺼낸다.
+pool이 비었거나 Redis 장애 시에는 요청에서 직접 생성 후 DB로 확인한다.
+
+- 여러 워커가 동시에 채워도 Lua 스크립트 안에서 크기를 확인하므로 상한을 넘지 않음
+- set이라 같은 닉네임이 pool에 두 번 들어가지 않고, SPOP은 한 요청에만 돌려줌
+- 꺼낸 닉네임은 NICK_NAME_POOL_ISSUED_TTL_SECONDS 동안 issued 표시를 남겨
+  아직 저장되지 않았어도 다시 pool에 들어가지 않음
+(그래도 다른 유저가 먼저 사용한 경우는 저장 시 unique index가 막음)
+"""
+import random
+from typing import Dict, List, Optional
+
+from core.config import settings
+from core.redis_driver import redis_driver
+
+NICK_NAME_POOL_NAME_SPACE = "nick_name_pool"
+ISSUED_NAME_SPACE = "nick_name_pool:issued"
+LANGUAGES = ("kr", "en")
+
+# 남은 자리(cap - SCARD)만큼, 최근에 꺼내지 않은 닉네임만 추가하고 추가한 개수 반환
+_PUSH_SCRIPT = """
+local room = tonumber(ARGV[1]) - redis.call('SCARD', KEYS[1])
+local added = 0
+for i = 3, #ARGV do
+    if added >= room then
+        break
+    end
+    if redis.call('EXISTS', ARGV[2] .. ARGV[i]) == 0 then
+        added = added + redis.call('SADD', KEYS[1], ARGV[i])
+    end
+end
+return added
+"""
+
+# 언어별 pool에서 하나씩 꺼내고 issued 표시
+_POP_SCRIPT = """
+local names = {}
+for i, key in ipairs(KEYS) do
+    local name = redis.call('SPOP', key)
+    if name then
+        redis.call('SET', ARGV[1] .. name, 1, 'EX', ARGV[2])
+        names[i] = name
+    else
+        names[i] = false
+    end
+end
+return names
+"""
+_push_script = None
+_pop_script = None
+
+# (형용사, 명사) 단어 목록, 40 x 40 x 90 = 언어별 144,000개 조합
+_WORDS = {
+    "kr": (
+        (
+            "행복한 용감한 귀여운 졸린 배고픈 신나는 조용한 반짝이는 수줍은 씩씩한 "
+            "느긋한 명랑한 다정한 똑똑한 날쌘 엉뚱한 상냥한 부지런한 포근한 당당한 "
+            "깜찍한 자유로운 든든한 유쾌한 친절한 단단한 말랑한 푸른 하얀 노란 "
+            "작은 커다란 재빠른 차분한 우아한 멋진 따뜻한 향기로운 꿈꾸는 노래하는"
+        ).split(),
+        (
+            "고양이 강아지 토끼 다람쥐 판다 펭귄 여우 곰 호랑이 사자 "
+            "부엉이 고래 돌고래 수달 햄스터 거북이 코끼리 기린 오리 참새 "
+            "나무 구름 별 바다 달 사과 복숭아 감자 고구마 만두 "
+            "호두 도토리 감귤 딸기 여행자 탐험가 선인장 해바라기 코알라 너구리"
+        ).split(),
+    ),
+    "en": (
+        (
+            "Happy Brave Cute Sleepy Hungry Jolly Quiet Shiny Shy Bold "
+            "Lazy Cheerful Kind Clever Swift Quirky Gentle Busy Cozy Proud "
+            "Tiny Free Sturdy Merry Friendly Calm Fluffy Blue White Golden "
+            "Little Mighty Lucky Witty Sunny Breezy Curious Humble Graceful Cool"
+        ).split(),
+        (
+            "Cat Puppy Rabbit Squirrel Panda Penguin Fox Bear Tiger Lion "
+            "Owl Whale Dolphin Otter Hamster Turtle Elephant Giraffe Duck Sparrow "
+            "Tree Cloud Star Ocean Moon Apple Peach Potato Dumpling Walnut "
+            "Acorn Tangerine Strawberry Traveler Explorer Cactus Sunflower Koala "
+            "Badger Raccoon"
+        ).split(),
+    ),
+}
+
+
+def generate_nick_name(lang: str) -> str:
+    adjectives, nouns = _WORDS[lang]
+    return f"{random.choice(adjectives)}{random.choice(nouns)}{random.randint(10, 99)}"
+
+
+def generate_nick_names(lang: str, count: int) -> List[str]:
+    """
+    중복 없는 후보 count 개
+    """
+    names = set()
+    while len(names) < count:
+        names.add(generate_nick_name(lang))
+    return list(names)
+
+
+def _pool_key(lang: str) -> str:
+    return f"{NICK_NAME_POOL_NAME_SPACE}:{lang}"
+
+
+def _issued_prefix() -> str:
+    return f"{ISSUED_NAME_SPACE}:"
+
+
+def pop_nick_names() -> Dict[str, Optional[str]]:
+    """
+    언어별 pool에서 하나씩 꺼냄, 비었거나 Redis 장애면 None
+    """
+    global _pop_script
+
+    try:
+        if _pop_script is None:
+            _pop_script = redis_driver.redis_client.register_script(_POP_SCRIPT)
+        values = _pop_script(
+            keys=[_pool_key(lang) for lang in LANGUAGES],
+            args=[_issued_prefix(), settings.NICK_NAME_POOL_ISSUED_TTL_SECONDS],
+        )
+    except Exception:
+        return {lang: None for lang in LANGUAGES}
+    return {
+        lang: value.decode() if value is not None else None
+        for lang, value in zip(LANGUAGES, values)
+    }
+
+
+def pool_sizes() -> Dict[str, int]:
+    pipe = redis_driver.redis_client.pipeline(transaction=False)
+    for lang in LANGUAGES:
+        pipe.scard(_pool_key(lang))
+    return dict(zip(LANGUAGES, pipe.execute()))
+
+
+def push_nick_names(lang: str, names: List[str], cap: int) -> int:
+    """
+    pool이 cap 개가 될 때까지만 추가, 추가한 개수 반환
+    """
+    global _push_script
+
+    if not names:
+        return 0
+    if _push_script is None:
+        _push_script = redis_driver.redis_client.register_script(_PUSH_SCRIPT)
+    return _push_script(keys=[_pool_key(lang)], args=[cap, _issued_prefix(), *names])
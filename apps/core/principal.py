@@ -0,0 +1,119 @@
+"""
+인증된 유저 principal 2단계 캐시
+
+1. 프로세스 내 TTL LRU (짧은 TTL, 다른 워커의 무효화는 TTL 동안 늦게 반영)
+2. Redis (워커 간 공유, 무효화 즉시 반영)
+
+캐시 키는 토큰의 인증 정보(uid, email 또는 sns_type + sns_id)로 만들고,
+유저 정보가 바뀌는 곳에서 invalidate_principal(user)로 두 단계를 모두 비운다.
+Redis 장애 시에는 캐시를 건너뛰고 DB 조회로 동작한다.
+
+id/활성/관리자/학교만 필요한 핸들러(/token/validate, 내 학교 모임 목록)는
+principal만 사용하므로 캐시 hit이면 유저 조회 없이 처리된다.
+/users/me는 응답에 프로필 전체가 필요하므로 principal의 id로 한 번 조회한다.
+"""
+import threading
+from typing import List, Optional
+
+from cachetools import TTLCache
+
+from core.config import settings
+from core.redis_driver import redis_driver
+from schemas.user import UserPrincipal
+
+PRINCIPAL_NAME_SPACE = "principal"
+
+_local_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_LOCAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_LOCAL_CACHE_TTL_SECONDS,
+)
+# sync dependency는 threadpool에서 실행되므로 lock 필요
+_local_lock = threading.Lock()
+
+
+def principal_key(
+    auth_method: str, sub: Optional[str], sns_type: Optional[str] = None
+) -> str:
+    """
+    auth_method: "id"(uid 클레임), "email", "sns"
+    """
+    if auth_method == "sns":
+        return f"{PRINCIPAL_NAME_SPACE}:sns:{sns_type}:{sub}"
+    return f"{PRINCIPAL_NAME_SPACE}:{auth_method}:{sub}"
+
+
+def user_principal_keys(user) -> List[str]:
+    """
+    유저로 발급될 수 있는 토큰의 캐시 키 목록
+    """
+    keys = [principal_key("id", user.id)]
+    if user.email:
+        keys.append(principal_key("email", user.email))
+    if user.sns_id:
+        keys.append(principal_key("sns", user.sns_id, user.sns_type))
+    return keys
+
+
+def get_principal(key: str) -> Optional[UserPrincipal]:
+    with _local_lock:
+        principal = _local_cache.get(key)
+    if principal is not None:
+        return principal
+
+    try:
+        if not redis_driver.is_cached(key):
+            return None
+        principal = UserPrincipal(**redis_driver.get_value(key))
+    except Exception:
+        return None
+
+    with _local_lock:
+        _local_cache[key] = principal
+    return principal
+
+
+def set_principal(key: str, principal: UserPrincipal) -> None:
+    with _local_lock:
+        _local_cache[key] = principal
+
+    try:
+        redis_driver.set_value(
+            key,
+            principal.model_dump_json(),
+            expire_time=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+
+
+def invalidate_principal(*users) -> None:
+    """
+    유저 정보(활성/관리자/학교/token_version 등)가 바뀐 뒤 호출
+    """
+    invalidate_principal_keys(
+        [key for user in users if user for key in user_principal_keys(user)]
+    )
+
+
+def invalidate_principal_keys(keys: List[str]) -> None:
+    if not keys:
+        return
+
+    with _local_lock:
+        for key in keys:
+            _local_cache.pop(key, None)
+
+    try:
+        redis_driver.delete_keys(keys)
+    except Exception:
+        pass
+
+
+def clear_principal_cache() -> None:
+    with _local_lock:
+        _local_cache.clear()
+
+    try:
+        redis_driver.delete_keys(redis_driver.find_by_name_space(PRINCIPAL_NAME_SPACE))
+    except Exception:
+        pass
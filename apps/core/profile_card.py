@@ -0,0 +1,76 @@
+"""
+유저별 profile card(사진, 닉네임, 국적) Redis 캐시
+
+채팅 화면에서 멤버 목록 전체로 /profile/photos를 호출하므로
+요청한 id들을 MGET 한 번으로 조회하고, 없는 것만 DB에서 읽어 채운다.
+
+프로필(생성/수정/사진/삭제) 또는 국적이 바뀌는 곳에서
+invalidate_profile_cards(user_id)로 삭제한다.
+Redis 장애 시에는 캐시를 건너뛰고 DB 조회로 동작한다.
+"""
+import json
+from typing import Any, Dict, Iterable
+
+from core.config import settings
+from core.redis_driver import redis_driver
+
+PROFILE_CARD_NAME_SPACE = "profile_card"
+
+
+def profile_card_key(user_id: int) -> str:
+    return f"{PROFILE_CARD_NAME_SPACE}:{user_id}"
+
+
+def get_profile_cards(user_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    캐시에 있는 card만 {user_id: card}로 반환
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    try:
+        values = redis_driver.redis_client.mget(
+            [profile_card_key(user_id) for user_id in user_ids]
+        )
+    except Exception:
+        return {}
+    return {
+        user_id: json.loads(value)
+        for user_id, value in zip(user_ids, values)
+        if value is not None
+    }
+
+
+def set_profile_cards(cards: Dict[int, Dict[str, Any]]) -> None:
+    if not cards:
+        return
+    try:
+        pipe = redis_driver.redis_client.pipeline(transaction=False)
+        for user_id, card in cards.items():
+            pipe.set(
+                profile_card_key(user_id),
+                json.dumps(card),
+                ex=settings.PROFILE_CARD_CACHE_TTL_SECONDS,
+            )
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def invalidate_profile_cards(*user_ids) -> None:
+    keys = [profile_card_key(user_id) for user_id in user_ids if user_id is not None]
+    if not keys:
+        return
+    try:
+        redis_driver.redis_client.delete(*keys)
+    except Exception:
+        pass
+
+
+def clear_profile_card_cache() -> None:
+    try:
+        redis_driver.delete_keys(
+            redis_driver.find_by_name_space(PROFILE_CARD_NAME_SPACE)
+        )
+    except Exception:
+        pass
@@ -0,0 +1,252 @@
+"""
+Redis 기반 요청 횟수 제한 (token bucket)
+
+rate_limit:{scope}:{identifier} 해시에 남은 토큰 수와 마지막 갱신 시각을 저장하고,
+Lua 스크립트 하나로 충전 + 차감을 원자적으로 처리한다.
+버킷이 비면 429(Retry-After: 토큰 하나가 충전될 때까지의 시간)를 반환한다.
+
+- 경로별 제한은 RATE_LIMIT_RULES("METHOD 경로" -> rate/burst/key)로 설정,
+  key가 user면 토큰의 유저 id, 없거나 ip면 클라이언트 IP 기준
+- Redis 장애 시에는 프로세스 내 버킷으로 제한 (서버별로 따로 계산됨),
+  RATE_LIMIT_REDIS_RETRY_SECONDS 동안은 Redis 재연결을 시도하지 않음
+
+제한은 두 곳에서 건다.
+- IP / 유저별: RateLimitMiddleware가 throttle_request로 처리,
+  요청 body를 읽지 않고 경로와 헤더만으로 판단해서 핸들러 / DB 전에 429
+- 요청 body 값별(인증번호 발송의 이메일 등): 핸들러가 body를 파싱한 뒤
+  check_rate_limit로 처리 (login.check_certificate_rate_limit)
+Redis 호출이 동기이므로 미들웨어는 threadpool에서 실행하고,
+check_rate_limit를 쓰는 핸들러는 async def가 아닌 def로 선언한다.
+"""
+import ipaddress
+import math
+import threading
+import time
+from dataclasses import dataclass
+from ipaddress import IPv4Network, IPv6Network
+from typing import Dict, List, Optional, Tuple, Union
+
+from cachetools import LRUCache
+from fastapi import HTTPException, Request, status
+from jose import JWTError, jwt
+
+from core.config import settings
+from core.redis_driver import redis_driver
+from log import log_error
+
+RATE_LIMIT_NAME_SPACE = "rate_limit"
+
+# 버킷 충전 후 토큰 하나 차감, 부족하면 충전까지 남은 시간(ms) 반환
+# now는 서버에서 넘겨줌 (Redis 6에서 TIME 사용 시 replicate_commands 필요)
+_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate / 1000)
+local retry_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_ms = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate))
+return retry_ms
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    # 초당 충전되는 토큰 수 / 버킷 크기(연속으로 허용하는 요청 수)
+    rate: float
+    burst: int
+    key: str = "ip"
+
+
+class TokenBucketLimiter:
+    def __init__(self, local_size: int, redis_retry_seconds: float):
+        self.redis_retry_seconds = redis_retry_seconds
+        self._script = None
+        self._redis_down_until = 0.0
+        self._local: LRUCache = LRUCache(maxsize=local_size)
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rate: float, burst: int) -> int:
+        """
+        토큰 하나 사용, 허용되면 0 / 초과면 Retry-After 초
+        """
+        now_ms = int(time.time() * 1000)
+        retry_ms = self._hit_redis(key, rate, burst, now_ms)
+        if retry_ms is None:
+            retry_ms = self._hit_local(key, rate, burst, now_ms)
+        if retry_ms <= 0:
+            return 0
+        return max(1, math.ceil(retry_ms / 1000))
+
+    def _hit_redis(
+        self, key: str, rate: float, burst: int, now_ms: int
+    ) -> Optional[int]:
+        client = redis_driver.redis_client
+        if client is None or time.monotonic() < self._redis_down_until:
+            return None
+        try:
+            if self._script is None:
+                self._script = client.register_script(_BUCKET_SCRIPT)
+            return int(
+                self._script(
+                    keys=[f"{RATE_LIMIT_NAME_SPACE}:{key}"],
+                    args=[rate, burst, now_ms],
+                )
+            )
+        except Exception as e:
+            log_error(f"rate limit falls back to local buckets: {e}")
+            self._redis_down_until = time.monotonic() + self.redis_retry_seconds
+            return None
+
+    def _hit_local(self, key: str, rate: float, burst: int, now_ms: int) -> int:
+        with self._lock:
+            tokens, ts = self._local.get(key, (float(burst), now_ms))
+            tokens = min(burst, tokens + max(0, now_ms - ts) * rate / 1000)
+            retry_ms = 0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_ms = math.ceil((1 - tokens) * 1000 / rate)
+            self._local[key] = (tokens, now_ms)
+        return retry_ms
+
+    def clear(self):
+        """
+        프로세스 내 버킷 / Redis 버킷 모두 삭제 (테스트용)
+        """
+        with self._lock:
+            self._local.clear()
+        self._redis_down_until = 0.0
+        try:
+            client = redis_driver.redis_client
+            keys = list(client.scan_iter(match=f"{RATE_LIMIT_NAME_SPACE}:*"))
+            if keys:
+                client.delete(*keys)
+        except Exception:
+            pass
+
+
+rate_limiter = TokenBucketLimiter(
+    local_size=settings.RATE_LIMIT_LOCAL_BUCKETS,
+    redis_retry_seconds=settings.RATE_LIMIT_REDIS_RETRY_SECONDS,
+)
+
+
+def load_rules() -> Dict[Tuple[str, str], RateLimitRule]:
+    rules = {}
+    for route, rule in settings.RATE_LIMIT_RULES.items():
+        method, path = route.split(" ", 1)
+        rules[(method.upper(), path)] = RateLimitRule(**rule)
+    return rules
+
+
+rate_limit_rules = load_rules()
+
+
+def _load_trusted_proxies() -> List[Union[IPv4Network, IPv6Network]]:
+    return [
+        ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES
+    ]
+
+
+trusted_proxies = _load_trusted_proxies()
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted_proxies)
+
+
+def client_ip(request: Request) -> str:
+    """
+    직접 연결한 주소, TRUSTED_PROXIES(nginx)를 거친 요청만 X-Real-IP 사용
+
+    프록시를 거치지 않은 요청의 X-Real-IP는 클라이언트가 임의로 넣을 수 있으므로 무시
+    """
+    host = request.client.host if request.client else None
+    if host is None:
+        return "unknown"
+    real_ip = request.headers.get("X-Real-IP")
+    if real_ip and _is_trusted_proxy(host):
+        return real_ip
+    return host
+
+
+def _request_user(request: Request) -> Optional[str]:
+    """
+    서명이 유효한 access 토큰의 유저 id(없으면 sub), 위조된 토큰으로 제한을 피하지 못하게 검증
+    """
+    authorization = request.headers.get("Authorization")
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    try:
+        payload = jwt.decode(
+            authorization[len("Bearer ") :],
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+    except JWTError:
+        return None
+    subject = payload.get("uid", payload.get("sub"))
+    return str(subject) if subject is not None else None
+
+
+def rate_limit_rule(request: Request) -> Optional[RateLimitRule]:
+    """
+    요청 경로에 설정된 제한, 없거나 제한이 꺼져 있으면 None
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    return rate_limit_rules.get((request.method, request.url.path))
+
+
+def throttle_request(request: Request) -> int:
+    """
+    요청 경로에 제한이 설정되어 있으면 토큰 사용, 허용되면 0 / 초과면 Retry-After 초
+
+    Redis를 동기로 호출하므로 이벤트 루프에서는 run_in_threadpool로 실행
+    """
+    rule = rate_limit_rule(request)
+    if rule is None:
+        return 0
+
+    identifier = None
+    if rule.key == "user":
+        user = _request_user(request)
+        if user is not None:
+            identifier = f"user:{user}"
+    if identifier is None:
+        identifier = f"ip:{client_ip(request)}"
+    return rate_limiter.hit(
+        f"{request.method}:{request.url.path}:{identifier}", rule.rate, rule.burst
+    )
+
+
+def check_rate_limit(scope: str, identifier: str, limit: int, window: int) -> None:
+    """
+    window(초) 동안 limit 회를 넘으면 429 HTTPException
+
+    limit 크기의 버킷이 window 동안 다시 가득 차도록 충전
+    """
+    retry_after = rate_limiter.hit(f"{scope}:{identifier}", limit / window, limit)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -16,9 +16,11 @@ from sqlalchemy.orm import Session
 
 import crud
 from database.session import get_db
-from schemas.user import Token, TokenData
+from schemas.user import Token, TokenData, UserPrincipal
 from models.user import User
 from core.config import settings
+from core.principal import principal_key, get_principal, set_principal
+from core import token_store
 
 security = HTTPBasic()
 bearer_security = HTTPBearer()
@@ -60,9 +62,15 @@ def create_refresh_token(data: dict):
 
     Returns:
     - 생성된 JWT 리프레시 토큰 문자열.
+
+    uid가 있으면 새 rotation family를 만들어 fam/jti 클레임을 추가한다.
+    (rotation 시에는 fam/jti가 담긴 data를 넘겨받음)
     """
     ...
     to_encode = data.copy()
+    if "uid" in to_encode and "fam" not in to_encode:
+        family, jti = token_store.issue(to_encode["uid"])
+        to_encode.update({"fam": family, "jti": jti})
     expire = datetime.utcnow() + timedelta(
         minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES
     )
@@ -122,17 +130,34 @@ def get_current_token(authorization: str = Header(...)) -> str:
     return token
 
 
+def _load_principal(db: Session, user: User) -> UserPrincipal:
+    user_university = crud.user.get_university(db=db, user_id=user.id)
+    return UserPrincipal(
+        id=user.id,
+        is_active=bool(user.is_active),
+        is_admin=bool(user.is_admin),
+        university_id=user_university.university_id if user_university else None,
+        token_version=user.token_version or 0,
+    )
+
+
 def get_current_user(
     token: str = Depends(get_current_token), db: Session = Depends(get_db)
-):
+) -> UserPrincipal:
     """
     현재의 JWT 토큰을 사용하여 사용자 정보를 검색한다.
 
+    - uid/ver 클레임이 있는 토큰: 서명/만료 검증 후 캐시된 token_version과 비교,
+      캐시에 없을 때만 id로 DB 조회
+    - 이전 형식(sub만 있는) 토큰: email/sns로 조회, 만료될 때까지 그대로 허용
+
+    principal 캐시(프로세스 내 LRU -> Redis)에 있으면 DB 조회 없이 반환한다.
+
     Args:
     - token: 검증할 JWT 토큰.
 
     Returns:
-    - 검증된 사용자의 정보를 포함하는 User 객체.
+    - 검증된 사용자의 id, 활성/관리자 여부, 학교를 담은 UserPrincipal.
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -144,28 +169,56 @@ def get_current_user(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         auth_method = payload.get("auth_method")
-
-        if auth_method == "email":
-            email = payload.get("sub")
-            user = crud.user.get_by_email(db=db, email=email)
-        elif auth_method == "sns":
-            sns_id = payload.get("sub")
-            sns_type = payload.get("sns_type")
-            user = crud.user.get_by_sns(db=db, sns_id=sns_id, sns_type=sns_type)
-        else:
+        if auth_method not in ("email", "sns"):
             raise HTTPException(status_code=400, detail="Unknown auth_method")
 
-        if user is None:
-            raise HTTPException(
-                status_code=401,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
+        user_id = payload.get("uid")
+        if user_id is not None:
+            cache_key = principal_key("id", user_id)
+        else:
+            cache_key = principal_key(
+                auth_method, payload.get("sub"), payload.get("sns_type")
             )
+
+        principal = get_principal(cache_key)
+        if principal is None:
+            if user_id is not None:
+                user = crud.user.get(db=db, id=user_id)
+            elif auth_method == "email":
+                email = payload.get("sub")
+                user = crud.user.get_by_email(db=db, email=email)
+            else:
+                sns_id = payload.get("sub")
+                sns_type = payload.get("sns_type")
+                user = crud.user.get_by_sns(db=db, sns_id=sns_id, sns_type=sns_type)
+
+            if user is None:
+                raise HTTPException(
+                    status_code=401,
+                    detail="User not found",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            principal = _load_principal(db, user)
+            set_principal(cache_key, principal)
     except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except JWTError:
         raise HTTPException(status_code=401, detail="Could not validate credentials")
-    return user
+
+    # 탈퇴한 유저는 만료 전 토큰(이전 형식 포함)으로도 인증 불가
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=401,
+            detail="Inactive user",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if user_id is not None and payload.get("ver") != principal.token_version:
+        raise HTTPException(
+            status_code=401,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
 
 
 def get_admin(credentials: Annotated[HTTPBasicCredentials, Depends(security)]):
@@ -180,18 +233,13 @@ def get_admin(credentials: Annotated[HTTPBasicCredentials, Depends(security)]):
     return credentials.username
 
 
-def create_tokens_for_user(user: User) -> Dict[str, Any]:
+def build_token_data(user: User) -> Dict[str, Any]:
     """
-    주어진 사용자에 대해 액세스 토큰과 리프레시 토큰을 생성하고 반환합니다.
+    토큰에 담을 클레임 생성
 
-    Args:
-        user (User): 토큰을 생성할 사용자 객체.
-
-    Returns:
-        Dict[str, Any]: 생성된 토큰과 사용자 정보를 포함하는 딕셔너리.
+    sub/auth_method(/sns_type)는 이전 형식과의 호환을 위해 유지하고,
+    uid(유저 id)와 ver(token_version)를 추가한다.
     """
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
     if user.email:
         token_data = {"sub": user.email, "auth_method": "email"}
     else:
@@ -200,6 +248,22 @@ def create_tokens_for_user(user: User) -> Dict[str, Any]:
             "sns_type": user.sns_type,
             "auth_method": "sns",
         }
+    token_data.update({"uid": user.id, "ver": user.token_version or 0})
+    return token_data
+
+
+def create_tokens_for_user(user: User) -> Dict[str, Any]:
+    """
+    주어진 사용자에 대해 액세스 토큰과 리프레시 토큰을 생성하고 반환합니다.
+
+    Args:
+        user (User): 토큰을 생성할 사용자 객체.
+
+    Returns:
+        Dict[str, Any]: 생성된 토큰과 사용자 정보를 포함하는 딕셔너리.
+    """
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    token_data = build_token_data(user)
 
     access_token = create_access_token(
         data=token_data, expires_delta=access_token_expires
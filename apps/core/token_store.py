@@ -0,0 +1,151 @@
+"""
+Refresh 토큰 rotation / 폐기 저장소 (Redis)
+
+로그인마다 하나의 토큰 family(fam)를 만들고, refresh 할 때마다 family의
+현재 jti를 새 값으로 교체(rotation)한다. 이미 교체된 jti로 다시 refresh 하면
+탈취된 토큰의 재사용으로 보고 family 전체를 폐기한다.
+
+키 구조 (모두 refresh 토큰 수명만큼 TTL)
+- rt:fam:{fam}  -> 현재 jti 문자열 하나 (토큰별 키를 만들지 않음),
+                   폐기된 family는 REVOKED 표시로 남김
+- rt:user:{uid} -> 유저의 family id set, 유저 단위 폐기에 사용
+
+Redis 장애 시에는 서명/만료/token_version 검증만으로 동작한다(fail-open).
+장애 중에 발급되어 저장되지 못한 family(또는 Redis 데이터 유실)는 키가 없으므로,
+키가 없으면 폐기가 아니라 저장되지 않은 family로 보고 토큰의 jti로 다시 등록한다.
+폐기는 삭제 대신 REVOKED 표시를 남기므로 다시 등록되지 않는다.
+(유저 단위 폐기는 token_version 증가와 함께 일어나므로 set에 없는 family도 거부됨)
+"""
+import uuid
+from typing import Optional, Tuple
+
+from core.config import settings
+from core.redis_driver import redis_driver
+from log import log_error
+
+FAMILY_NAME_SPACE = "rt:fam"
+USER_NAME_SPACE = "rt:user"
+
+REVOKED = "REVOKED"
+
+ROTATE_SEEDED = 2
+ROTATE_OK = 1
+ROTATE_REUSED = 0
+ROTATE_REVOKED = -1
+
+# 현재 jti와 일치할 때만 교체, 불일치(재사용)면 family 폐기
+# family 키가 없으면(저장되지 못한 family) 새 jti로 등록
+_ROTATE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    redis.call('SADD', KEYS[2], ARGV[4])
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+    return 2
+end
+if current == ARGV[5] then
+    return -1
+end
+if current ~= ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[5], 'EX', ARGV[3])
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return 1
+"""
+_rotate_script = None
+
+
+class RefreshTokenError(Exception):
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+def _ttl_seconds() -> int:
+    return settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
+
+
+def _family_key(family: str) -> str:
+    return f"{FAMILY_NAME_SPACE}:{family}"
+
+
+def _user_key(user_id: int) -> str:
+    return f"{USER_NAME_SPACE}:{user_id}"
+
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def issue(user_id: int) -> Tuple[str, str]:
+    """
+    새 family 생성, (family, jti) 반환
+    """
+    family, jti = _new_id(), _new_id()
+    ttl = _ttl_seconds()
+    try:
+        pipe = redis_driver.redis_client.pipeline()
+        pipe.set(_family_key(family), jti, ex=ttl)
+        pipe.sadd(_user_key(user_id), family)
+        pipe.expire(_user_key(user_id), ttl)
+        pipe.execute()
+    except Exception as e:
+        log_error(f"refresh token family store failed: {e}")
+    return family, jti
+
+
+def rotate(user_id: int, family: str, jti: str) -> str:
+    """
+    family의 현재 jti가 일치하면 새 jti로 교체하고 반환
+
+    - 폐기된 family: RefreshTokenError("Token has been revoked")
+    - 이미 교체된 jti 재사용: family 폐기 후 RefreshTokenError
+    - 저장되지 않은 family: 새 jti로 등록 후 반환
+    """
+    global _rotate_script
+
+    new_jti = _new_id()
+    try:
+        if _rotate_script is None:
+            _rotate_script = redis_driver.redis_client.register_script(_ROTATE_SCRIPT)
+        result = _rotate_script(
+            keys=[_family_key(family), _user_key(user_id)],
+            args=[jti, new_jti, _ttl_seconds(), family, REVOKED],
+        )
+    except Exception as e:
+        log_error(f"refresh token rotation skipped: {e}")
+        # 저장소에 반영되지 않았으므로 기존 jti 유지
+        return jti
+
+    if result == ROTATE_REVOKED:
+        raise RefreshTokenError("Token has been revoked")
+    if result == ROTATE_REUSED:
+        raise RefreshTokenError("Refresh token reuse detected")
+    return new_jti
+
+
+def revoke_family(family: Optional[str]) -> None:
+    if not family:
+        return
+    try:
+        redis_driver.redis_client.set(_family_key(family), REVOKED, ex=_ttl_seconds())
+    except Exception as e:
+        log_error(f"refresh token family revoke failed: {e}")
+
+
+def revoke_user(user_id: int) -> None:
+    """
+    유저의 모든 refresh 토큰 family 폐기
+    """
+    try:
+        client = redis_driver.redis_client
+        families = client.smembers(_user_key(user_id))
+        pipe = client.pipeline()
+        for family in families:
+            pipe.set(_family_key(family.decode()), REVOKED, ex=_ttl_seconds())
+        pipe.delete(_user_key(user_id))
+        pipe.execute()
+    except Exception as e:
+        log_error(f"refresh token user revoke failed: {e}")
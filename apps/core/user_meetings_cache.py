@@ -0,0 +1,134 @@
+"""
+유저별 "내 모임" 목록 Redis 캐시 (버전 방식 무효화)
+
+목록 조회 결과(모임 id 순서, total_count, next_cursor)만 저장하고
+모임 내용은 매번 DB에서 id로 다시 읽는다.
+
+- 데이터 키: user_meetings:{user_id}:{version}:{조회 조건 hash}
+- 버전 키:   user_meetings:{user_id}:version
+  MeetingUser / Review / 모임 상태(is_active, meeting_time)가 바뀌면
+  관련 유저의 버전을 올려서 이전 버전의 데이터 키를 모두 무효화 (TTL로 정리)
+
+ORM flush로 바뀌는 경우는 세션 이벤트에서 자동으로 처리하고,
+bulk UPDATE/DELETE를 쓰는 곳은 bump_user_meetings를 직접 호출한다.
+Redis 장애 시에는 캐시를 건너뛰고 DB 조회로 동작한다.
+"""
+import json
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.redis_driver import redis_driver
+from models.meeting import Meeting, MeetingUser, Review
+
+USER_MEETINGS_NAME_SPACE = "user_meetings"
+_CHANGED_USERS = "user_meetings_changed"
+
+
+def _version_key(user_id: int) -> str:
+    return f"{USER_MEETINGS_NAME_SPACE}:{user_id}:version"
+
+
+def _data_key(user_id: int, version: int, **params) -> str:
+    return redis_driver.generate_cache_key(
+        f"{USER_MEETINGS_NAME_SPACE}:{user_id}:{version}", **params
+    )
+
+
+def get_user_meetings(user_id: int, **params) -> Optional[Dict[str, Any]]:
+    try:
+        client = redis_driver.redis_client
+        version = int(client.get(_version_key(user_id)) or 0)
+        value = client.get(_data_key(user_id, version, **params))
+    except Exception:
+        return None
+    return json.loads(value) if value is not None else None
+
+
+def set_user_meetings(user_id: int, result: Dict[str, Any], **params) -> None:
+    try:
+        client = redis_driver.redis_client
+        version = int(client.get(_version_key(user_id)) or 0)
+        client.set(
+            _data_key(user_id, version, **params),
+            json.dumps(result),
+            ex=settings.USER_MEETINGS_CACHE_TTL_SECONDS,
+        )
+    except Exception:
+        pass
+
+
+def bump_user_meetings(*user_ids) -> None:
+    """
+    유저들의 캐시 버전 증가 (이전 결과 무효화)
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    try:
+        pipe = redis_driver.redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.incr(_version_key(user_id))
+            # 캐시 데이터보다 오래 유지되면 충분
+            pipe.expire(
+                _version_key(user_id), settings.USER_MEETINGS_CACHE_TTL_SECONDS * 2
+            )
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def clear_user_meetings_cache() -> None:
+    try:
+        redis_driver.delete_keys(
+            redis_driver.find_by_name_space(USER_MEETINGS_NAME_SPACE)
+        )
+    except Exception:
+        pass
+
+
+def _meeting_state_changed(meeting: Meeting) -> bool:
+    attrs = inspect(meeting).attrs
+    return (
+        attrs.is_active.history.has_changes()
+        or attrs.meeting_time.history.has_changes()
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    changed: Set[int] = session.info.setdefault(_CHANGED_USERS, set())
+    meeting_ids = []
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, MeetingUser):
+            changed.add(obj.user_id)
+        elif isinstance(obj, Review):
+            changed.add(obj.creator_id)
+        elif isinstance(obj, Meeting):
+            changed.add(obj.creator_id)
+            if obj in session.dirty and _meeting_state_changed(obj):
+                meeting_ids.append(obj.id)
+
+    if meeting_ids:
+        # 종료/시간 변경된 모임은 참가자 목록도 바뀜
+        changed.update(
+            session.connection().scalars(
+                select(MeetingUser.user_id).where(
+                    MeetingUser.meeting_id.in_(meeting_ids)
+                )
+            )
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_users(session):
+    changed = session.info.pop(_CHANGED_USERS, None)
+    if changed:
+        bump_user_meetings(*changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop(_CHANGED_USERS, None)
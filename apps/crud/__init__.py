@@ -15,10 +15,11 @@ from .chat import chat
 from .meeting import meeting, review
 from .system import system, report, ban, notice, contact
 from .alarm import alarm, admin_alarm
+from .base import select_by_id
 
 
 def get_object_or_404(db: Session, model, obj_id: int):
-    obj = db.query(model).filter(model.id == obj_id).first()
+    obj = db.scalars(select_by_id(model), {"id": obj_id}).first()
     if not obj:
         raise HTTPException(
             status_code=404, detail=f"{model.__name__} with id {obj_id} is not found"
@@ -1,6 +1,7 @@
 from firebase_admin import messaging
 
 from firebase_admin import firestore
+from sqlalchemy import select, func, bindparam
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from firebase_admin.exceptions import InvalidArgumentError
@@ -14,6 +15,23 @@ from schemas import alarm as alarm_schema
 from core.config import settings
 from log import log_error
 
+# 알림 목록/읽음 처리 조회 - statement 를 모듈 로드 시 한 번만 생성
+ALARM_BY_ID = (
+    select(alarm_model.Alarm)
+    .where(alarm_model.Alarm.id == bindparam("alarm_id"))
+    .limit(1)
+)
+ALARMS_BY_USER = (
+    select(alarm_model.Alarm)
+    .where(alarm_model.Alarm.user_id == bindparam("user_id"))
+    .order_by(alarm_model.Alarm.is_read, alarm_model.Alarm.created_time.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+ALARM_COUNT_BY_USER = select(func.count(alarm_model.Alarm.id)).where(
+    alarm_model.Alarm.user_id == bindparam("user_id")
+)
+
 
 def send_fcm_notification(
     title: str,
@@ -75,9 +93,7 @@ class Alarm(
     CRUDBase[alarm_model.Alarm, alarm_schema.AlarmCreate, alarm_schema.AlarmCreate]
 ):
     def read_alarm(self, db: Session, alarm_id):
-        alarm_obj = (
-            db.query(alarm_model.Alarm).filter(alarm_model.Alarm.id == alarm_id).first()
-        )
+        alarm_obj = db.scalars(ALARM_BY_ID, {"alarm_id": alarm_id}).first()
         alarm_obj.is_read = True
         db.commit()
         return alarm_obj
@@ -393,13 +409,11 @@ class Alarm(
     def get_multi_with_user_id(
         self, db: Session, user_id: int, skip: int = 0, limit: int = 10
     ) -> List[alarm_model.Alarm]:
-        query = (
-            db.query(alarm_model.Alarm)
-            .filter(alarm_model.Alarm.user_id == user_id)
-            .order_by(alarm_model.Alarm.is_read, alarm_model.Alarm.created_time.desc())
-        )
-        total_count = query.count()
-        return query.offset(skip).limit(limit).all(), total_count
+        total_count = db.scalar(ALARM_COUNT_BY_USER, {"user_id": user_id})
+        alarms = db.scalars(
+            ALARMS_BY_USER, {"user_id": user_id, "skip": skip, "limit": limit}
+        ).all()
+        return alarms, total_count
 
     def delete_alarms(self, db: Session, user_id: int):
         query = (
@@ -1,16 +1,73 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import base64
+import json
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import insert, update, delete, func, select, bindparam
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from models.base import ModelBase
+from crud.eager import load_options
 
 ModelType = TypeVar("ModelType", bound=ModelBase)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def select_by_id(model: Type[ModelType], load_for: Optional[Type[BaseModel]] = None):
+    """
+    `model.id == :id` 조회 statement 를 (모델, 응답 스키마) 조합마다 한 번만 생성
+
+    호출마다 query 체인을 새로 만들지 않고 같은 statement 객체를 재사용하므로
+    SQLAlchemy compiled cache 조회까지의 Python 오버헤드가 줄어든다.
+    """
+    return (
+        select(model)
+        .options(*load_options(model, load_for))
+        .where(model.id == bindparam("id"))
+        .limit(1)
+    )
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    keyset 페이지네이션의 마지막 row 정렬 값을 cursor 문자열로 변환
+    """
+    raw = json.dumps(jsonable_encoder(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    encode_cursor로 만든 값 목록 복원, 형식이 다르면 400
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
@@ -23,8 +80,13 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+    def get(
+        self, db: Session, id: Any, load_for: Optional[Type[BaseModel]] = None
+    ) -> Optional[ModelType]:
+        """
+        load_for: 응답 스키마를 넘기면 스키마가 직렬화하는 관계를 eager loading
+        """
+        return db.scalars(select_by_id(self.model, load_for), {"id": id}).first()
 
     def get_multi(
         self, db: Session, *, skip: int = 0, limit: int = 100
@@ -47,22 +109,238 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        obj_data = db_obj.to_dict()
+        db_obj, _ = self.update_with_count(db, db_obj=db_obj, obj_in=obj_in)
+        return db_obj
+
+    def update_with_count(
+        self,
+        db: Session,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> Tuple[ModelType, int]:
+        """
+        변경된 컬럼만 UPDATE ... RETURNING 한번으로 반영하고 (객체, 수정된 row 수) 반환
+
+        - 변경된 컬럼이 없으면 DB에 쓰지 않고 commit도 하지 않음
+        - RETURNING 결과로 객체를 채우므로 commit 후 refresh SELECT가 필요 없음
+        """
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True, exclude_none=True)
 
+        column_keys = set(sa_inspect(self.model).column_attrs.keys())
+        changed = {}
         for field, value in update_data.items():
-            if hasattr(db_obj, field):
+            if field in column_keys:
+                if getattr(db_obj, field) != value:
+                    changed[field] = value
+            elif hasattr(db_obj, field):
+                # 컬럼이 아닌 속성은 기존처럼 ORM flush에 맡김
                 setattr(db_obj, field, value)
-            db.add(db_obj)
+
+        if not changed:
+            if db.dirty or db.new or db.deleted:
+                db.commit()
+            return db_obj, 0
+
+        table = self.model.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == db_obj.id)
+            .values(**changed)
+            .returning(*table.columns)
+        )
+        row = db.execute(stmt).mappings().first()
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
+
+        if row is None:
+            return db_obj, 0
+
+        for key, value in row.items():
+            set_committed_value(db_obj, key, value)
+        return db_obj, 1
 
     def remove(self, db: Session, *, id: int) -> ModelType:
         obj = db.get(self.model, id)
         db.delete(obj)
         db.commit()
         return obj
+
+    def _to_rows(
+        self, objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        schema / dict 리스트를 테이블 컬럼만 남긴 dict 리스트로 변환
+        """
+        columns = self.model.__table__.columns.keys()
+        rows = []
+        for obj_in in objs_in:
+            data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+            rows.append({key: value for key, value in data.items() if key in columns})
+        return rows
+
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        returning: bool = False,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        여러 row를 하나의 INSERT로 생성
+
+        - returning=True 이면 생성된 객체 리스트 반환 (INSERT ... RETURNING)
+        - commit=False 이면 호출한 쪽의 트랜잭션에 포함
+        """
+        rows = self._to_rows(objs_in)
+        if not rows:
+            return []
+
+        stmt = insert(self.model)
+        if returning:
+            objs = db.scalars(stmt.returning(self.model), rows).all()
+        else:
+            db.execute(stmt, rows)
+            objs = []
+
+        if commit:
+            db.commit()
+        return objs
+
+    def upsert_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        index_elements: List[str],
+        update_fields: Optional[List[str]] = None,
+        returning: bool = False,
+        commit: bool = True,
+    ) -> List[ModelType]:
+        """
+        INSERT ... ON CONFLICT (index_elements) DO UPDATE 로 여러 row를 한번에 저장
+
+        - index_elements 에는 unique 제약조건이 걸린 컬럼을 지정
+        - update_fields 미지정 시 index_elements, id 외 전달된 컬럼 모두 갱신
+        - 갱신할 컬럼이 없으면 DO NOTHING
+        """
+        rows = self._to_rows(objs_in)
+        if not rows:
+            return []
+
+        if update_fields is None:
+            update_fields = [
+                key for key in rows[0] if key not in index_elements and key != "id"
+            ]
+
+        stmt = pg_insert(self.model).values(rows)
+        if update_fields:
+            set_ = {field: stmt.excluded[field] for field in update_fields}
+            set_["modified_time"] = func.now()
+            stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+        if returning:
+            objs = db.scalars(
+                select(self.model).from_statement(stmt.returning(self.model)),
+                execution_options={"populate_existing": True},
+            ).all()
+        else:
+            db.execute(stmt)
+            objs = []
+
+        if commit:
+            db.commit()
+        return objs
+
+    def update_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[Dict[str, Any]],
+        commit: bool = True,
+    ) -> int:
+        """
+        id가 포함된 dict 리스트로 row마다 다른 값을 하나의 executemany UPDATE로 수정
+
+        - 세션에 로드된 객체에는 반영되지 않으므로 commit(expire) 후 다시 읽어야 함
+        - 수정 요청한 row 수 반환
+        """
+        rows = [dict(row) for row in objs_in]
+        if not rows:
+            return 0
+
+        db.execute(update(self.model), rows)
+
+        if commit:
+            db.commit()
+        return len(rows)
+
+    def update_where(
+        self,
+        db: Session,
+        *where: Any,
+        values: Dict[str, Any],
+        returning: bool = False,
+        commit: bool = True,
+    ) -> Union[int, List[ModelType]]:
+        """
+        조건에 맞는 row를 하나의 UPDATE로 수정
+
+        - returning=False 이면 수정된 row 수, True 이면 수정된 객체 리스트 반환
+        """
+        if not where:
+            raise ValueError("update_where requires at least one condition")
+
+        stmt = update(self.model).where(*where).values(**values)
+        if returning:
+            result = db.scalars(
+                stmt.returning(self.model),
+                execution_options={"synchronize_session": "fetch"},
+            ).all()
+        else:
+            result = db.execute(
+                stmt, execution_options={"synchronize_session": "fetch"}
+            ).rowcount
+
+        if commit:
+            db.commit()
+        return result
+
+    def delete_where(
+        self,
+        db: Session,
+        *where: Any,
+        returning: bool = False,
+        commit: bool = True,
+    ) -> Union[int, List[ModelType]]:
+        """
+        조건에 맞는 row를 하나의 DELETE로 삭제
+
+        - returning=False 이면 삭제된 row 수, True 이면 삭제된 객체 리스트 반환
+        """
+        if not where:
+            raise ValueError("delete_where requires at least one condition")
+
+        stmt = delete(self.model).where(*where)
+        if returning:
+            result = db.scalars(
+                stmt.returning(self.model),
+                execution_options={"synchronize_session": "fetch"},
+            ).all()
+            # 삭제된 객체는 commit 후 다시 읽을 수 없으므로 세션에서 분리
+            for obj in result:
+                if obj in db:
+                    db.expunge(obj)
+        else:
+            result = db.execute(
+                stmt, execution_options={"synchronize_session": "fetch"}
+            ).rowcount
+
+        if commit:
+            db.commit()
+        return result
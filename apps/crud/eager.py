@@ -0,0 +1,101 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+from models.base import ModelBase
+
+# 순환 관계가 있어도 무한히 내려가지 않도록 제한
+MAX_DEPTH = 6
+
+
+def _schema_of(annotation) -> Optional[Type[BaseModel]]:
+    """
+    Optional[List[Schema]] 같은 타입 힌트에서 Pydantic 모델 추출
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        schema = _schema_of(arg)
+        if schema is not None:
+            return schema
+    return None
+
+
+def _loader(relationship):
+    # 컬렉션은 selectinload(IN 쿼리 1번), 단일 객체는 joinedload
+    return selectinload if relationship.uselist else joinedload
+
+
+def _path_options(model: Type[ModelBase], path: List[str]) -> Optional[_AbstractLoad]:
+    """
+    "profile.user_university.university" 같은 경로를 loader option 체인으로 변환
+    """
+    relationships = inspect(model).relationships
+    name = path[0]
+    if name not in relationships:
+        return None
+    relationship = relationships[name]
+    option = _loader(relationship)(getattr(model, name))
+    if len(path) > 1:
+        child = _path_options(relationship.mapper.class_, path[1:])
+        if child is not None:
+            option = option.options(child)
+    return option
+
+
+def _schema_options(
+    model: Type[ModelBase], schema: Type[BaseModel], depth: int
+) -> List[_AbstractLoad]:
+    if depth > MAX_DEPTH:
+        return []
+
+    relationships = inspect(model).relationships
+    options = []
+    for name, field in schema.model_fields.items():
+        if name not in relationships:
+            continue
+        relationship = relationships[name]
+        option = _loader(relationship)(getattr(model, name))
+
+        nested_schema = _schema_of(field.annotation)
+        if nested_schema is not None:
+            children = _schema_options(
+                relationship.mapper.class_, nested_schema, depth + 1
+            )
+            if children:
+                option = option.options(*children)
+        options.append(option)
+
+    # property / computed_field 에서 접근하는 관계는 스키마에 선언
+    for path in getattr(schema, "orm_eager_load", []):
+        option = _path_options(model, path.split("."))
+        if option is not None:
+            options.append(option)
+    return options
+
+
+@lru_cache(maxsize=None)
+def _cached_options(
+    model: Type[ModelBase], schema: Type[BaseModel]
+) -> Tuple[_AbstractLoad, ...]:
+    return tuple(_schema_options(model, schema, depth=0))
+
+
+def load_options(
+    model: Type[ModelBase], schema: Optional[Type[BaseModel]]
+) -> Tuple[_AbstractLoad, ...]:
+    """
+    response_model 스키마가 직렬화하는 관계를 그대로 eager loading 하는 option 목록
+
+    - 스키마 필드 중 모델의 relationship과 이름이 같은 필드를 따라 내려감
+    - 컬렉션은 selectinload, 단일 객체는 joinedload 사용
+    - 스키마의 orm_eager_load(ClassVar)에 추가 경로 지정 가능 (예: "profile")
+    - (model, schema) 별로 캐시
+    """
+    if schema is None:
+        return ()
+    return _cached_options(model, schema)
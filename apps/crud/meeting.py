@@ -3,12 +3,30 @@ from typing import Any, Dict, Optional, Union, List
 from datetime import datetime, timedelta
 from firebase_admin import firestore
 
-from sqlalchemy import desc, asc, func, extract, and_, or_, not_
+from sqlalchemy import (
+    desc,
+    asc,
+    func,
+    extract,
+    and_,
+    or_,
+    not_,
+    update,
+    delete,
+    insert,
+    select,
+    literal,
+    text,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session, joinedload
+from psycopg2.errors import LockNotAvailable
 from fastapi import HTTPException
 
 from crud.base import CRUDBase
+from crud.eager import load_options
 from core.redis_driver import redis_driver
+from core.user_meetings_cache import bump_user_meetings
 from core.config import settings
 from log import log_error
 import crud
@@ -19,6 +37,7 @@ from models.meeting import (
     MeetingTopic,
     MeetingUser,
     Review,
+    participants_counter_update,
 )
 from models.utility import Tag, Topic, Nationality, Language
 from models.user import User, UserNationality
@@ -197,19 +216,22 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
         language_ids = language_ids or []
 
         items = [
-            (tags_ids, MeetingTag, "tag_id"),
-            (topic_ids, MeetingTopic, "topic_id"),
-            (language_ids, MeetingLanguage, "language_id"),
+            (tags_ids, meeting_tag, "tag_id"),
+            (topic_ids, meeting_topic, "topic_id"),
+            (language_ids, meeting_language, "language_id"),
         ]
 
-        for ids, model, field_name in items:
+        for ids, crud_obj, field_name in items:
             if ids:
-                # 기존 객체들 모두 삭제
-                db.query(model).filter(model.meeting_id == meeting_id).delete()
-                for id in ids:
-                    obj_data = {"meeting_id": meeting_id, field_name: id}
-                    db_obj = model(**obj_data)
-                    db.add(db_obj)
+                # 기존 객체들 모두 삭제 후 한번에 추가
+                crud_obj.delete_where(
+                    db, crud_obj.model.meeting_id == meeting_id, commit=False
+                )
+                crud_obj.create_many(
+                    db=db,
+                    objs_in=[{"meeting_id": meeting_id, field_name: id} for id in ids],
+                    commit=False,
+                )
 
         db.commit()
 
@@ -331,12 +353,22 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
         return query
 
     def get_meetings_by_university(
-        self, db: Session, user_id: int, skip: int, limit: int
+        self,
+        db: Session,
+        user_id: int,
+        skip: int,
+        limit: int,
+        university_id: Optional[int] = None,
     ):
-        university = crud.utility.get_university_by_user(db=db, user_id=user_id)
-        if not university:
-            raise HTTPException(status_code=400, detail="University is not exists")
-        query = db.query(Meeting).filter(Meeting.university_id == university.id)
+        """
+        university_id: 호출한 쪽에서 이미 알고 있으면(principal) 학교 조회 생략
+        """
+        if university_id is None:
+            university = crud.utility.get_university_by_user(db=db, user_id=user_id)
+            if not university:
+                raise HTTPException(status_code=400, detail="University is not exists")
+            university_id = university.id
+        query = db.query(Meeting).filter(Meeting.university_id == university_id)
         query = self.filter_by_ban(db=db, query=query, user_id=user_id)
         total_count = query.count()
         return query.offset(skip).limit(limit).all(), total_count
@@ -376,7 +408,11 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
 
         if redis_driver.is_cached(key=cache_key):
             cached_data = redis_driver.get_value(key=cache_key)
-            return_query = query.filter(Meeting.id.in_(cached_data)).all()
+            return_query = (
+                query.options(*load_options(Meeting, MeetingSummaryResponse))
+                .filter(Meeting.id.in_(cached_data))
+                .all()
+            )
 
             return_query.sort(key=lambda x: cached_data.index(x.id))
 
@@ -434,13 +470,9 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
         if is_count_only:
             return [], total_count
 
-        # n+1 해결 위한 eager loading
+        # n+1 해결 위한 eager loading (응답 스키마 기준)
         meeting_list = (
-            query.options(
-                joinedload(Meeting.meeting_tags).joinedload(MeetingTag.tag),
-                joinedload(Meeting.meeting_topics).joinedload(MeetingTopic.topic),
-                joinedload(Meeting.creator).joinedload(User.profile),
-            )
+            query.options(*load_options(Meeting, MeetingSummaryResponse))
             .offset(skip)
             .limit(limit)
             .all()
@@ -468,34 +500,75 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
         return query.offset(skip).limit(limit).all(), total_count
 
     def join_request_approve(self, db: Session, obj_id: int):
+        """
+        모임 참가 요청 승인
 
-        join_request = (
-            db.query(MeetingUser)
-            .filter(
-                MeetingUser.id == obj_id,
-                MeetingUser.status == ReultStatusEnum.PENDING,
+        - PENDING 요청을 APPROVE로 바꾸는 UPDATE와
+          자리가 남아있을 때만 인원을 늘리는 조건부 UPDATE를 한 트랜잭션에서 실행
+        - meeting row lock으로 동시 승인 시에도 max_participants를 넘지 않음
+        """
+        try:
+            db.execute(
+                text(
+                    f"SET LOCAL lock_timeout = {int(settings.JOIN_APPROVE_LOCK_TIMEOUT_MS)}"
+                )
             )
-            .first()
-        )
-
-        if not join_request:
-            raise HTTPException(status_code=400, detail="Join Request not found")
 
-        join_request.status = ReultStatusEnum.APPROVE.value
+            join_request = db.scalars(
+                update(MeetingUser)
+                .where(
+                    MeetingUser.id == obj_id,
+                    MeetingUser.status == ReultStatusEnum.PENDING.value,
+                )
+                .values(status=ReultStatusEnum.APPROVE.value)
+                .returning(MeetingUser),
+                execution_options={"synchronize_session": False},
+            ).first()
+
+            if not join_request:
+                raise HTTPException(status_code=400, detail="Join Request not found")
+
+            seat = db.execute(
+                participants_counter_update(
+                    user_id=join_request.user_id,
+                    meeting_id=join_request.meeting_id,
+                    delta=1,
+                )
+                .where(Meeting.current_participants < Meeting.max_participants)
+                .returning(Meeting.id)
+            ).first()
 
-        meeting = (
-            db.query(Meeting).filter(Meeting.id == join_request.meeting_id).first()
-        )
+            if not seat:
+                raise HTTPException(status_code=404, detail="It's full of people.")
 
-        if meeting.current_participants >= meeting.max_participants:
-            raise HTTPException(status_code=404, detail="It's full of people.")
+            db.commit()
+            # bulk UPDATE라 세션 이벤트로 잡히지 않음
+            bump_user_meetings(join_request.user_id)
+        except HTTPException:
+            db.rollback()
+            raise
+        except OperationalError as e:
+            db.rollback()
+            # lock_timeout 초과(LockNotAvailable)만 409, 나머지는 그대로
+            if not isinstance(e.orig, LockNotAvailable):
+                raise
+            log_error(e)
+            raise HTTPException(
+                status_code=409, detail="Meeting is busy, please try again."
+            )
 
         return join_request
 
     def join_request_reject(self, db: Session, obj_id: int):
-        join_request = db.query(MeetingUser).filter(MeetingUser.id == obj_id).delete()
+        user_ids = db.scalars(
+            delete(MeetingUser)
+            .where(MeetingUser.id == obj_id)
+            .returning(MeetingUser.user_id),
+            execution_options={"synchronize_session": "fetch"},
+        ).all()
         db.commit()
-        return join_request
+        bump_user_meetings(*user_ids)
+        return len(user_ids)
 
     def join_request(self, db: Session, obj_in: MeetingUserCreate):
         user_id = obj_in.user_id
@@ -513,12 +586,6 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
             if not meeting:
                 raise HTTPException(status_code=400, detail="Meeting is not exists")
 
-            # 참여 가능한 인원 수 확인
-            if meeting.current_participants >= meeting.max_participants:
-                raise HTTPException(
-                    status_code=400, detail="The meeting is already full!"
-                )
-
             existing_request = (
                 db.query(MeetingUser)
                 .filter(
@@ -536,17 +603,40 @@ class CURDMeeting(CRUDBase[Meeting, MeetingCreate, MeetingUpdateIn]):
                     status_code=400, detail="User already joined this meeting!"
                 )
 
-            meeting_user = MeetingUser(
-                user_id=user_id,
-                meeting_id=meeting_id,
-                status=ReultStatusEnum.PENDING.value,
-            )
+            # 참여 가능한 인원 수 확인
+            # 승인과 같은 current < max 조건으로, 자리가 있을 때만 INSERT
+            meeting_user = db.scalars(
+                insert(MeetingUser)
+                .from_select(
+                    ["user_id", "meeting_id", "status"],
+                    select(
+                        literal(user_id),
+                        Meeting.id,
+                        literal(ReultStatusEnum.PENDING.value),
+                    ).where(
+                        Meeting.id == meeting_id,
+                        Meeting.current_participants < Meeting.max_participants,
+                    ),
+                )
+                .returning(MeetingUser)
+            ).first()
 
-            db.add(meeting_user)
+            if not meeting_user:
+                raise HTTPException(
+                    status_code=400, detail="The meeting is already full!"
+                )
             db.commit()
+            # INSERT 문이라 세션 이벤트로 잡히지 않음
+            bump_user_meetings(user_id)
         except HTTPException:
             db.rollback()
             raise
+        except IntegrityError:
+            # 동시에 들어온 중복 요청은 (user_id, meeting_id) unique 제약으로 차단
+            db.rollback()
+            raise HTTPException(
+                status_code=400, detail="User already joined this meeting!"
+            )
         except Exception as e:
             db.rollback()
             log_error(e)
@@ -623,4 +713,7 @@ class CRUDReview(CRUDBase[Review, ReviewCreate, ReviewUpdate]):
 
 
 meeting = CURDMeeting(Meeting)
+meeting_tag = CRUDBase(MeetingTag)
+meeting_topic = CRUDBase(MeetingTopic)
+meeting_language = CRUDBase(MeetingLanguage)
 review = CRUDReview(Review)
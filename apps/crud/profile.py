@@ -1,14 +1,54 @@
-from typing import Any, Dict, Optional, Union, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union, List, Set, Type
 import time, random, string, boto3, requests
+from datetime import datetime
 from botocore.exceptions import NoCredentialsError
 
-from sqlalchemy import func, desc, asc, extract
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import (
+    func,
+    desc,
+    asc,
+    extract,
+    select,
+    bindparam,
+    exists,
+    and_,
+    or_,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, selectinload, joinedload, load_only
 from fastapi import UploadFile, HTTPException
+from fastapi.encoders import jsonable_encoder
 
 from log import log_error
-from crud.base import CRUDBase
+from pydantic import BaseModel
+
+from crud.base import CRUDBase, encode_cursor, decode_cursor
+from crud.eager import load_options
+from database.session import SessionLocal, is_replica_session
 from core.config import settings
+from core.user_meetings_cache import get_user_meetings, set_user_meetings
+from core.nick_name_pool import (
+    generate_nick_names,
+    pool_sizes,
+    pop_nick_names,
+    push_nick_names,
+)
+from core.nick_name_index import (
+    add_nick_names,
+    nick_name_in_set,
+    normalize_nick_name,
+    rebuild_nick_names,
+    remove_nick_names,
+)
+from core.profile_card import (
+    get_profile_cards,
+    set_profile_cards,
+    invalidate_profile_cards,
+)
+from core.principal import invalidate_principal
 from models.profile import (
     Profile,
     AvailableLanguage,
@@ -17,6 +57,7 @@ from models.profile import (
     UserUniversity,
 )
 from models.meeting import Meeting, MeetingUser, Review
+from models.user import User, UserNationality
 from schemas.profile import (
     ProfileCreate,
     ProfileUpdate,
@@ -30,9 +71,31 @@ from schemas.profile import (
     IntroductionIn,
 )
 from schemas.enum import ReultStatusEnum, MyMeetingEnum, MeetingOrderingEnum
+from schemas.meeting import MeetingSummaryResponse
 import crud
 
 
+@lru_cache(maxsize=None)
+def profile_by_user_id(load_for: Optional[Type[BaseModel]] = None):
+    """
+    user_id 로 프로필을 조회하는 statement 를 응답 스키마별로 한 번만 생성
+    """
+    return (
+        select(Profile)
+        .options(*load_options(Profile, load_for))
+        .where(Profile.user_id == bindparam("user_id"))
+        .limit(1)
+    )
+
+
+def is_nick_name_conflict(e: IntegrityError) -> bool:
+    """
+    닉네임 unique index(ix_profile_nick_name_lower) 위반인지 확인
+    """
+    diag = getattr(e.orig, "diag", None)
+    return getattr(diag, "constraint_name", None) == "ix_profile_nick_name_lower"
+
+
 def pre_processing_useruniversity(db: Session):
     # 모든 UserUniversity 인스턴스를 가져오는 것 대신 필요할 때마다 하나씩 가져옵니다.
     all_useruniversity_ids = db.query(UserUniversity.id).all()
@@ -112,8 +175,81 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
                 .first()
             )
 
-    def list_verification(self, db: Session):
-        return db.query(StudentVerification).all()
+    def list_verification(
+        self,
+        db: Session,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """
+        학생증 심사 대기열, (student_cards, total_count, next_cursor) 반환
+
+        - limit이 없으면 cursor 이후 전체를 반환 (next_cursor는 None)
+
+        - 오래 기다린 순서(created_time, id)로 keyset 페이지네이션,
+          created_time이 NULL인 row는 마지막에 id 순
+        - status가 있으면 (verification_status, created_time) index로 조회
+        - 목록에 표시하는 유저 / 학교 정보는 같은 쿼리에서 joinedload
+        """
+        conditions = []
+        if status:
+            conditions.append(StudentVerification.verification_status == status)
+
+        stmt = (
+            select(StudentVerification, func.count().over().label("total_count"))
+            .options(
+                joinedload(StudentVerification.profile).joinedload(Profile.user),
+                joinedload(StudentVerification.profile)
+                .joinedload(Profile.user_university)
+                .joinedload(UserUniversity.university),
+            )
+            .where(*conditions)
+            .order_by(
+                StudentVerification.created_time.asc().nulls_last(),
+                StudentVerification.id,
+            )
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        if cursor:
+            last_created_time, last_id = decode_cursor(cursor, 2)
+            if last_created_time is None:
+                # NULL 구간에서는 id로만 이어서 조회
+                after = and_(
+                    StudentVerification.created_time.is_(None),
+                    StudentVerification.id > last_id,
+                )
+            else:
+                try:
+                    last_created_time = datetime.fromisoformat(last_created_time)
+                except (TypeError, ValueError):
+                    raise HTTPException(status_code=400, detail="Invalid cursor")
+                # NULL은 tuple 비교에서 빠지므로 뒤에 오는 NULL row를 따로 포함
+                after = or_(
+                    tuple_(StudentVerification.created_time, StudentVerification.id)
+                    > tuple_(last_created_time, last_id),
+                    StudentVerification.created_time.is_(None),
+                )
+            stmt = stmt.where(after)
+        rows = db.execute(stmt).all()
+
+        if cursor:
+            # cursor 조건 이후의 count() over()는 남은 개수이므로 따로 count
+            total_count = db.scalar(
+                select(func.count())
+                .select_from(StudentVerification)
+                .where(*conditions)
+            )
+        else:
+            total_count = rows[0].total_count if rows else 0
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            last = rows[limit - 1].StudentVerification
+            next_cursor = encode_cursor(last.created_time, last.id)
+        student_cards = [row.StudentVerification for row in rows[:limit]]
+        return student_cards, total_count, next_cursor
 
     def update_verification(
         self,
@@ -266,10 +402,114 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         return db_obj
 
     def get_by_nick_name(self, db: Session, nick_name: str):
-        return db.query(Profile).filter(Profile.nick_name == nick_name).first()
+        # 대소문자 구분 없이 비교 (lower(nick_name) unique index 사용)
+        return db.scalars(
+            select(Profile)
+            .where(func.lower(Profile.nick_name) == normalize_nick_name(nick_name))
+            .limit(1)
+        ).first()
+
+    def is_nick_name_taken(self, db: Session, nick_name: str) -> bool:
+        """
+        닉네임 사용 여부
+
+        Redis set에 없으면 DB 조회 없이 False,
+        set에 있거나 set을 쓸 수 없으면 unique index로 확인
+        """
+        in_set = nick_name_in_set(nick_name)
+        if in_set is False:
+            return False
+
+        taken = self._nick_name_exists(db, nick_name)
+        if in_set and not taken:
+            # 삭제가 반영되지 않은 닉네임
+            # Replica는 방금 만든 닉네임이 아직 없을 수 있으므로 Primary로 다시 확인
+            if is_replica_session(db):
+                with SessionLocal() as primary:
+                    if self._nick_name_exists(primary, nick_name):
+                        return True
+            remove_nick_names(nick_name)
+        return taken
+
+    def _nick_name_exists(self, db: Session, nick_name: str) -> bool:
+        return db.scalar(
+            select(
+                exists().where(
+                    func.lower(Profile.nick_name) == normalize_nick_name(nick_name)
+                )
+            )
+        )
+
+    def rebuild_nick_name_index(self, db: Session) -> int:
+        """
+        DB의 모든 닉네임으로 Redis set 다시 만들기 (scheduler)
+        """
+        return rebuild_nick_names(
+            lambda: db.scalars(
+                select(Profile.nick_name)
+                .where(Profile.nick_name.isnot(None))
+                .execution_options(yield_per=1000)
+            )
+        )
+
+    def get_by_user_id(
+        self,
+        db: Session,
+        *,
+        user_id: str,
+        load_for: Optional[Type[BaseModel]] = None,
+    ) -> Optional[Profile]:
+        return db.scalars(profile_by_user_id(load_for), {"user_id": user_id}).first()
 
-    def get_by_user_id(self, db: Session, *, user_id: str) -> Optional[Profile]:
-        return db.query(Profile).filter(Profile.user_id == user_id).first()
+    def get_profile_cards(self, db: Session, user_ids: List[int]) -> List[Dict]:
+        """
+        user_ids 순서대로 photo, nick_name, 국적 목록 반환 (없는 유저는 제외)
+
+        캐시에 없는 유저만 한 번에 조회 (유저 수와 관계없이 쿼리 3번)
+        """
+        cards = get_profile_cards(set(user_ids))
+        missing = set(user_ids) - cards.keys()
+        if missing:
+            if is_replica_session(db):
+                # 캐시에 복제 지연 전 카드가 TTL 동안 남지 않도록 Primary에서 조회
+                with SessionLocal() as primary:
+                    loaded = self._load_profile_cards(primary, missing)
+            else:
+                loaded = self._load_profile_cards(db, missing)
+            set_profile_cards(loaded)
+            cards.update(loaded)
+        return [cards[user_id] for user_id in user_ids if user_id in cards]
+
+    def _load_profile_cards(self, db: Session, user_ids: Set[int]) -> Dict[int, Dict]:
+        users = db.scalars(
+            select(User)
+            .options(
+                load_only(User.id),
+                selectinload(User.profile).load_only(
+                    Profile.profile_photo, Profile.nick_name
+                ),
+                selectinload(User.user_nationality).joinedload(
+                    UserNationality.nationality
+                ),
+            )
+            .where(User.id.in_(user_ids))
+        ).all()
+        loaded = {}
+        for user in users:
+            profile = user.profile
+            loaded[user.id] = {
+                "user_id": user.id,
+                "profile_photo": profile.profile_photo if profile else None,
+                "nick_name": profile.nick_name if profile else None,
+                "nationalities": jsonable_encoder(
+                    [
+                        user_nationality.nationality.to_dict()
+                        for user_nationality in user.user_nationality
+                        if user_nationality.nationality
+                    ]
+                ),
+            }
+        return loaded
 
     def create(self, db: Session, *, obj_in: ProfileRegister, user_id: int) -> Profile:
         """
@@ -296,22 +536,32 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
             db.flush()
 
             if available_languages:
-                for ava_lang in available_languages:
-                    ava_lan_obj = AvailableLanguage(
-                        level=ava_lang.level,
-                        language_id=ava_lang.language_id,
-                        profile_id=profile_obj.id,
-                    )
-                    db.add(ava_lan_obj)
+                available_language.create_many(
+                    db=db,
+                    objs_in=[
+                        {
+                            "level": ava_lang.level,
+                            "language_id": ava_lang.language_id,
+                            "profile_id": profile_obj.id,
+                        }
+                        for ava_lang in available_languages
+                    ],
+                    commit=False,
+                )
 
             if Introductions:
-                for intro in Introductions:
-                    intro_obj = Introduction(
-                        keyword=intro.keyword,
-                        context=intro.context,
-                        profile_id=profile_obj.id,
-                    )
-                    db.add(intro_obj)
+                introduction.create_many(
+                    db=db,
+                    objs_in=[
+                        {
+                            "keyword": intro.keyword,
+                            "context": intro.context,
+                            "profile_id": profile_obj.id,
+                        }
+                        for intro in Introductions
+                    ],
+                    commit=False,
+                )
 
             if student_card:
                 student_card_obj = StudentVerification(
@@ -329,10 +579,18 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
                 raise HTTPException(status_code=404, detail="UserUniversity not found")
             db.commit()
 
+        except IntegrityError as e:
+            db.rollback()
+            if is_nick_name_conflict(e):
+                raise HTTPException(status_code=409, detail="nick_name already used")
+            log_error(e)
+            raise e
         except Exception as e:
             db.rollback()
             log_error(e)
             raise e
+        invalidate_profile_cards(user_id)
+        add_nick_names(obj_in.nick_name)
         db.refresh(profile_obj)
         return profile_obj
 
@@ -344,23 +602,23 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         obj_in: Union[ProfileUpdate, Dict[str, Any]],
     ) -> Profile:
         """
-        Update a user's details.
+        Update a user's profile.
+
+        사용 언어 / 자기소개는 db_obj에 로드된 목록과 비교해서 바뀐 것만
+        bulk DELETE / INSERT / UPDATE로 반영하고 한 번에 commit 한다.
+        닉네임 중복은 ix_profile_nick_name_lower 위반(IntegrityError)으로 판단해서 409,
+        다른 IntegrityError는 rollback 후 그대로 raise.
 
         Args:
             db: Database session instance.
-            db_obj: User instance to update.
-            obj_in: User update schema or dict containing updated details.
+            db_obj: Profile instance to update.
+            obj_in: Profile update schema containing updated details.
 
         Returns:
-            Updated User instance.
+            Updated Profile instance.
         """
-        origin_available_languages = db_obj.available_language_list
-        update_available_languages = obj_in.available_languages
-
-        origin_introductions = db_obj.introductions
-        update_introductions = obj_in.introductions
-
         university_info: ProfileUniversityUpdate = obj_in.university_info
+        old_nick_name = db_obj.nick_name
 
         # Update basic profile fields if provided
         if obj_in.nick_name is not None:
@@ -372,69 +630,110 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         if obj_in.is_default_photo is not None:
             db_obj.is_default_photo = obj_in.is_default_photo
 
-        if update_available_languages:
-            existing_language_ids = {
-                lang.language_id for lang in origin_available_languages
-            }
-            new_language_ids = {
-                lang.language_id for lang in update_available_languages or []
-            }
-            for language_id in existing_language_ids - new_language_ids:
-                self.remove_ava_lan(
-                    db=db, language_id=language_id, profile_id=db_obj.id
-                )
+        if obj_in.available_languages:
+            self._sync_available_languages(db, db_obj, obj_in.available_languages)
 
-            for language_data in update_available_languages or []:
-                if language_data.language_id in existing_language_ids:
-                    existing_ava_lang = self.get_ava_lan(
-                        db=db,
-                        language_id=language_data.language_id,
-                        profile_id=db_obj.id,
-                    )
-                    self.update_ava_lan(
-                        db=db, db_obj=existing_ava_lang, obj_in=language_data
-                    )
-                else:
-                    # Add the new language
-                    self.create_ava_lan(
-                        db=db, obj_in=language_data, profile_id=db_obj.id
-                    )
+        if obj_in.introductions:
+            self._sync_introductions(db, db_obj, obj_in.introductions)
 
-        if update_introductions:
-            existing_intros = {intro.keyword: intro for intro in origin_introductions}
-            new_intros = {
-                intro_data.keyword: intro_data
-                for intro_data in update_introductions or []
-            }
+        if university_info and db_obj.user_university:
+            for field, value in university_info.model_dump(
+                exclude_unset=True, exclude_none=True
+            ).items():
+                setattr(db_obj.user_university, field, value)
 
-            for keyword in existing_intros.keys() - new_intros.keys():
-                self.remove_introduction(db=db, keyword=keyword, profile_id=db_obj.id)
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if is_nick_name_conflict(e):
+                raise HTTPException(status_code=409, detail="nick_name already used")
+            raise
+        invalidate_profile_cards(db_obj.user_id)
+        if obj_in.nick_name is not None and obj_in.nick_name != old_nick_name:
+            remove_nick_names(old_nick_name)
+            add_nick_names(obj_in.nick_name)
+        return db_obj
 
-            for keyword, intro_data in new_intros.items():
-                if keyword in existing_intros:
-                    # Update the existing introduction if context has changed
-                    existing_intro = self.get_introduction(
-                        db=db, keyword=keyword, profile_id=db_obj.id
-                    )
-                    if intro_data.context != existing_intro.context:
-                        self.update_introduction(
-                            db=db, db_obj=existing_intro, obj_in=intro_data
-                        )
-                else:
-                    # Add the new introduction
-                    self.create_introduction(
-                        db=db, obj_in=intro_data, profile_id=db_obj.id
-                    )
+    def _sync_available_languages(
+        self, db: Session, db_obj: Profile, languages: List[AvailableLanguageIn]
+    ):
+        """
+        language_id 기준으로 삭제 / 추가 / level 변경 (commit은 update에서)
+        """
+        existing = {lang.language_id: lang for lang in db_obj.available_language_list}
+        requested = {lang.language_id: lang for lang in languages}
+
+        removed_ids = existing.keys() - requested.keys()
+        if removed_ids:
+            available_language.delete_where(
+                db,
+                AvailableLanguage.profile_id == db_obj.id,
+                AvailableLanguage.language_id.in_(removed_ids),
+                commit=False,
+            )
+        available_language.create_many(
+            db=db,
+            objs_in=[
+                {**language.model_dump(), "profile_id": db_obj.id}
+                for language_id, language in requested.items()
+                if language_id not in existing
+            ],
+            commit=False,
+        )
+        available_language.update_many(
+            db=db,
+            objs_in=[
+                {"id": existing[language_id].id, "level": language.level}
+                for language_id, language in requested.items()
+                if language_id in existing
+                and language.level is not None
+                and existing[language_id].level != language.level
+            ],
+            commit=False,
+        )
 
-        if university_info:
-            existing_unviersity = self.get_user_university(db=db, profile_id=db_obj.id)
-            self.update_user_university(
-                db=db, db_obj=existing_unviersity, obj_in=university_info
+    def _sync_introductions(
+        self, db: Session, db_obj: Profile, intros: List[IntroductionIn]
+    ):
+        """
+        keyword 기준으로 삭제 / 추가 / context 변경 (commit은 update에서)
+        """
+        existing = {intro.keyword: intro for intro in db_obj.introductions}
+        requested = {intro.keyword: intro for intro in intros}
+
+        removed_keywords = existing.keys() - requested.keys()
+        if removed_keywords:
+            introduction.delete_where(
+                db,
+                Introduction.profile_id == db_obj.id,
+                Introduction.keyword.in_(removed_keywords),
+                commit=False,
             )
+        introduction.create_many(
+            db=db,
+            objs_in=[
+                {**intro.model_dump(), "profile_id": db_obj.id}
+                for keyword, intro in requested.items()
+                if keyword not in existing
+            ],
+            commit=False,
+        )
+        introduction.update_many(
+            db=db,
+            objs_in=[
+                {"id": existing[keyword].id, "context": intro.context}
+                for keyword, intro in requested.items()
+                if keyword in existing and existing[keyword].context != intro.context
+            ],
+            commit=False,
+        )
 
-        db.commit()
-        # db.refresh(profile)
-        return db_obj
+    def remove(self, db: Session, *, id: int) -> Profile:
+        obj = super().remove(db, id=id)
+        invalidate_profile_cards(obj.user_id)
+        remove_nick_names(obj.nick_name)
+        return obj
 
     def delete_file_from_s3(self, file_url: str) -> None:
         s3_client = get_aws_client()
@@ -464,6 +763,7 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
 
         profile.profile_photo = file_path
         db.commit()
+        invalidate_profile_cards(user_id)
         db.refresh(profile)
         return profile
 
@@ -477,6 +777,7 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
 
         profile.profile_photo = None
         db.commit()
+        invalidate_profile_cards(user_id)
         db.refresh(profile)
         return profile
 
@@ -494,7 +795,39 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
     def update_user_university(
         self, db: Session, db_obj: UserUniversity, obj_in: ProfileUniversityUpdate
     ):
-        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        invalidate_principal(db_obj.user)
+        return db_obj
+
+    def _user_meetings_conditions(self, user_id: int, status: str) -> List:
+        """
+        내 모임 목록 조건 (생성한 모임 + 참가한 모임)
+
+        - APPROVE: 진행 중, 생성했거나 승인된 모임
+        - PENDING: 진행 중, 승인 대기 중인 모임
+        - PAST: 종료, 생성했거나 참가한 모임 중 리뷰를 작성하지 않은 모임
+        """
+        joined = select(MeetingUser.meeting_id).where(MeetingUser.user_id == user_id)
+        if status == MyMeetingEnum.PENDING.value:
+            return [
+                Meeting.is_active == True,
+                Meeting.id.in_(
+                    joined.where(MeetingUser.status == MyMeetingEnum.PENDING.value)
+                ),
+            ]
+
+        if status == MyMeetingEnum.APPROVE.value:
+            joined = joined.where(MeetingUser.status == MyMeetingEnum.APPROVE.value)
+        # 유저의 모임 id만 모아서 비교 (creator_id, meeting_user_uc 인덱스 사용)
+        mine = Meeting.id.in_(
+            union_all(select(Meeting.id).where(Meeting.creator_id == user_id), joined)
+        )
+        if status == MyMeetingEnum.PAST.value:
+            reviewed = exists().where(
+                Review.meeting_id == Meeting.id, Review.creator_id == user_id
+            )
+            return [Meeting.is_active == False, mine, ~reviewed]
+        return [Meeting.is_active == True, mine]
 
     def get_user_all_meetings(
         self,
@@ -504,62 +837,104 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         status: str,
         skip: int,
         limit: int,
-    ) -> List[Meeting]:
-        # 사용자가 생성한 모임 검색
-        created_meetings = db.query(Meeting).filter(Meeting.creator_id == user_id)
+        cursor: Optional[str] = None,
+    ):
+        """
+        내 모임 목록, (meetings, total_count, next_cursor) 반환
 
-        # 사용자가 참여한 모임 검색
-        participated_query = (
-            db.query(Meeting).join(MeetingUser).filter(MeetingUser.user_id == user_id)
+        - 모임 id / 전체 개수는 count() over()로 한 번에 조회하고 유저별로 캐시
+          (캐시는 Primary에서 읽은 결과로만 채움)
+        - cursor가 있으면 skip 대신 (정렬 값, id) keyset 페이지네이션
+        """
+        params = dict(
+            order_by=order_by, status=status, skip=skip, limit=limit, cursor=cursor
         )
-        if status == MyMeetingEnum.APPROVE.value:
-            created_meetings = created_meetings.filter(Meeting.is_active == True)
-            participated_query = participated_query.filter(
-                MeetingUser.status == MyMeetingEnum.APPROVE.value,
-                Meeting.is_active == True,
-            )
-        elif status == MyMeetingEnum.PENDING.value:
-            all_meetings = participated_query.filter(
-                MeetingUser.status == MyMeetingEnum.PENDING.value,
-                Meeting.is_active == True,
-            )
-            total_count = all_meetings.count()
-            return all_meetings.offset(skip).limit(limit).all(), total_count
-        elif status == MyMeetingEnum.PAST.value:
-            user_reviews = aliased(Review)
-            review_subquery = (
-                db.query(user_reviews.meeting_id)
-                .filter(user_reviews.creator_id == user_id)
-                .subquery()
-            )
-
-            created_meetings = created_meetings.filter(
-                Meeting.is_active == False,
-                ~Meeting.id.in_(review_subquery),  # 사용자가 리뷰를 작성한 미팅 제외
+        result = get_user_meetings(user_id, **params)
+        if result is None:
+            result = self._query_user_meetings(db, user_id=user_id, **params)
+            # Replica 결과는 복제 지연 동안 bump 이전 목록일 수 있어 캐시하지 않음
+            if not is_replica_session(db):
+                set_user_meetings(user_id, result, **params)
+
+        ids = result["ids"]
+        meetings = []
+        if ids:
+            meetings = db.scalars(
+                select(Meeting)
+                .options(*load_options(Meeting, MeetingSummaryResponse))
+                .where(Meeting.id.in_(ids))
+            ).all()
+            meetings.sort(key=lambda meeting: ids.index(meeting.id))
+        return meetings, result["total_count"], result["next_cursor"]
+
+    def _query_user_meetings(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        order_by: str,
+        status: str,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+    ) -> Dict[str, Any]:
+        conditions = self._user_meetings_conditions(user_id, status)
+        if order_by == MeetingOrderingEnum.CREATED_TIME:
+            sort_column = Meeting.created_time
+        else:
+            # DEADLINE_SOON: 현재 시간 이후의 모임만, 남은 시간(meeting_time) 순
+            if order_by == MeetingOrderingEnum.DEADLINE_SOON:
+                conditions.append(Meeting.meeting_time > func.now())
+            sort_column = Meeting.meeting_time
+        # NULL은 tuple 비교가 안 되므로 가장 뒤로
+        sort_key = func.coalesce(sort_column, datetime.max)
+
+        ranked = (
+            select(
+                Meeting.id.label("id"),
+                sort_key.label("sort_key"),
+                func.count().over().label("total_count"),
             )
-            participated_query = participated_query.filter(
-                Meeting.is_active == False,
-                ~Meeting.id.in_(review_subquery),  # 사용자가 리뷰를 작성한 미팅 제외
+            .where(*conditions)
+            .subquery()
+        )
+        stmt = (
+            select(ranked)
+            .order_by(ranked.c.sort_key, ranked.c.id)
+            .limit(limit + 1)
+        )
+        if cursor:
+            last_sort_key, last_id = decode_cursor(cursor, 2)
+            try:
+                last_sort_key = datetime.fromisoformat(last_sort_key)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(
+                tuple_(ranked.c.sort_key, ranked.c.id) > tuple_(last_sort_key, last_id)
             )
-
-        all_meetings = created_meetings.union(participated_query)
-        # order_by 매개변수에 따른 정렬 로직 적용
-        if order_by == MeetingOrderingEnum.CREATED_TIME:
-            all_meetings = all_meetings.order_by(asc(Meeting.created_time))
-        elif order_by == MeetingOrderingEnum.DEADLINE_SOON:
-            # 현재 시간 이후의 모임만 선택
-            all_meetings = all_meetings.filter(Meeting.meeting_time > func.now())
-            # meeting_time과 now() 사이의 시간 차이를 초로 계산하여 정렬
-            time_difference_seconds = extract(
-                "epoch", Meeting.meeting_time - func.now()
+        else:
+            stmt = stmt.offset(skip)
+        rows = db.execute(stmt).all()
+
+        if rows:
+            total_count = rows[0].total_count
+        elif cursor or skip:
+            # 마지막 페이지 이후는 window 결과가 없으므로 따로 count
+            total_count = db.scalar(
+                select(func.count()).select_from(Meeting).where(*conditions)
             )
-            all_meetings = all_meetings.order_by(time_difference_seconds)
         else:
-            all_meetings = all_meetings.order_by(asc(Meeting.meeting_time))
-
-        total_count = all_meetings.count()
-
-        return list(all_meetings.offset(skip).limit(limit).all()), total_count
+            total_count = 0
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.sort_key, last.id)
+        return {
+            "ids": [row.id for row in rows[:limit]],
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+        }
 
     def get_with_nick_name(self, db: Session, nick_name: str):
         profile = db.query(Profile).filter(Profile.nick_name == nick_name).first()
@@ -579,34 +954,55 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
             raise HTTPException(status_code=403, detail="Need to student-card verifiy")
         return True
 
-    def get_random_nick_name(self, db: Session, os_lang: str):
-        kr_nick_name, en_nick_name = None
-        if os_lang == "kr":
-            while True:
-                response = requests.get(settings.NICKNAME_API)
-
-                # API 요청이 성공했는지 확인
-                if response.status_code != 200:
-                    # 잠시 후에 다시 시도
-                    time.sleep(3)  # 3초 대기
-                    continue
-
-                data = response.json()
-                kr_nick_name = data.get("words")[0]
-
-                check_exists = self.get_with_nick_name(db=db, nick_name=kr_nick_name)
+    def get_random_nick_name(self, db: Session) -> Dict[str, str]:
+        """
+        한국어 / 영어 랜덤 닉네임
 
-                # 중복되지 않은 닉네임이면 break
-                if check_exists is None:
-                    break
+        scheduler가 채워둔 pool에서 꺼내고, 비어 있으면 직접 생성 후 DB로 확인
+        """
+        nick_names = pop_nick_names()
+        for lang, nick_name in nick_names.items():
+            # pool을 채운 뒤 다른 유저가 사용한 닉네임은 버림
+            if nick_name is not None and nick_name_in_set(nick_name):
+                nick_name = None
+            if nick_name is None:
+                free = self.filter_free_nick_names(db, generate_nick_names(lang, 5))
+                nick_names[lang] = free[0] if free else ""
+        return {"kr_nick_name": nick_names["kr"], "en_nick_name": nick_names["en"]}
+
+    def filter_free_nick_names(self, db: Session, candidates: List[str]) -> List[str]:
+        """
+        후보 중 사용 중이 아닌 닉네임만 (한 번의 IN 조회)
+        """
+        if not candidates:
+            return []
+        taken = set(
+            db.scalars(
+                select(func.lower(Profile.nick_name)).where(
+                    func.lower(Profile.nick_name).in_(
+                        [normalize_nick_name(name) for name in candidates]
+                    )
+                )
+            )
+        )
+        return [name for name in candidates if normalize_nick_name(name) not in taken]
 
-                # 중복된 경우, 잠시 대기 후 다시 시도
-                time.sleep(2)  # 2초 대기
-        elif os_lang == "en":
-            s3_client = get_aws_client()
-            en_nick_name = data.get("en_nick_name")
+    def refill_nick_name_pool(self, db: Session) -> int:
+        """
+        언어별 pool을 NICK_NAME_POOL_SIZE 개까지 채움 (scheduler), 추가한 개수 반환
 
-        return {"kr_nick_name": kr_nick_name, "en_nick_name": en_nick_name}
+        워커마다 동시에 실행되어도 상한은 push_nick_names 안에서 원자적으로 확인
+        """
+        added = 0
+        for lang, size in pool_sizes().items():
+            missing = settings.NICK_NAME_POOL_SIZE - size
+            if missing <= 0:
+                continue
+            free = self.filter_free_nick_names(db, generate_nick_names(lang, missing))
+            added += push_nick_names(lang, free, settings.NICK_NAME_POOL_SIZE)
+        return added
 
 
 profile = CRUDProfile(Profile)
+available_language = CRUDBase(AvailableLanguage)
+introduction = CRUDBase(Introduction)
@@ -1,18 +1,26 @@
+import os
 from typing import Any, Dict, Optional, Union, List
 from pydantic.networks import EmailStr
-import smtplib
-from jinja2 import Environment, FileSystemLoader
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from datetime import datetime, timedelta
 
-from sqlalchemy import exists, or_
+from sqlalchemy import exists, or_, and_, select, bindparam, delete
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload, contains_eager
-from passlib.context import CryptContext
 from fastapi import HTTPException
 
 from log import log_error
 from core.config import settings
+from core import hashing, token_store, email_code
+from core.mail import mail_sender
+from core.profile_card import invalidate_profile_cards
+from core.nick_name_index import remove_nick_names
+from core.user_meetings_cache import bump_user_meetings
+from core.principal import (
+    invalidate_principal,
+    invalidate_principal_keys,
+    user_principal_keys,
+)
 from crud.base import CRUDBase
 import crud
 from crud.profile import save_upload_file, generate_random_string
@@ -22,49 +30,64 @@ from models.user import (
     Consent,
     UserNationality,
     AccountDeletionRequest,
+    korean_nationality_exists,
 )
 from models.meeting import Meeting, MeetingUser, Review
 from models.profile import UserUniversity, Profile, StudentVerification
+from models.utility import Nationality
+from models.system import System
 from schemas import user as user_schmea
 from schemas.enum import ReultStatusEnum
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# 인증 경로에서 매 요청 실행되는 조회 - statement 를 모듈 로드 시 한 번만 생성
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+USER_BY_SNS = (
+    select(User)
+    .where(User.sns_id == bindparam("sns_id"), User.sns_type == bindparam("sns_type"))
+    .limit(1)
+)
+USER_FCM_TOKEN = select(User.fcm_token).where(User.id == bindparam("user_id"))
+
+
+# 템플릿은 프로세스에서 한 번만 파싱하고, 컴파일 결과는 bytecode cache로 재사용
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
+template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+)
+
+# language_code: (템플릿, 제목), 없는 언어는 kr 사용
+EMAIL_TEMPLATES = {
+    "kr": ("email_kr.html", "BISKIT 이메일 인증"),
+    "en": ("email_en.html", "BISKIT Email Certification"),
+}
+
+
+def precompile_email_templates():
+    """
+    서버 시작 시 메일 템플릿을 미리 컴파일
+    """
+    for filename, _ in EMAIL_TEMPLATES.values():
+        template_env.get_template(filename)
 
 
 def render_template(filename: str, **kwargs):
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template(filename)
+    template = template_env.get_template(filename)
     return template.render(**kwargs)
 
 
 def send_email(certification: int, receiver_email: EmailStr, language_code: str = "kr"):
-    if language_code == "kr":
-        body_template = "email_kr.html"
-        SUBJECT = "BISKIT 이메일 인증"
-    else:
-        body_template = "email_kr.html"
-        SUBJECT = "BISKIT Email Certification"
+    body_template, SUBJECT = EMAIL_TEMPLATES.get(language_code, EMAIL_TEMPLATES["kr"])
 
     s3_logo_url = settings.LOGO_URL
     BODY = render_template(
         body_template, certification=certification, s3_logo_url=s3_logo_url
     )
 
-    msg = MIMEMultipart()
-    msg["From"] = settings.SMTP_USER
-    msg["To"] = receiver_email
-    msg["Subject"] = SUBJECT
-    msg.attach(MIMEText(BODY, "html"))
-
-    try:
-        with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.sendmail(settings.SMTP_USER, receiver_email, msg.as_string())
-        return True
-    except Exception as e:
-        log_error(f"Error occurred while sending email: {e}")
-        return False
+    # 큐에 넣고 바로 반환, 실제 발송은 core.mail 워커에서 처리
+    return mail_sender.enqueue(receiver_email, SUBJECT, BODY)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -77,9 +100,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
     - 패스워드가 일치하면 True, 그렇지 않으면 False.
+
+    해싱 전용 executor에서 실행되며, 대기열이 가득 차면 503 HTTPException.
     """
     ...
-    return pwd_context.verify(plain_password, hashed_password)
+    return hashing.verify_password(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -92,7 +117,7 @@ def get_password_hash(password: str) -> str:
     Returns:
     - 해싱된 패스워드 문자열.
     """
-    return pwd_context.hash(password)
+    return hashing.hash_password(password)
 
 
 class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
@@ -142,8 +167,7 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         return deactive_users
 
     def get_user_fcm_token(self, db: Session, user_id):
-        obj = db.query(User).filter(User.id == user_id).first()
-        return obj.fcm_token
+        return db.scalars(USER_FCM_TOKEN, {"user_id": user_id}).first()
 
     def get_all_users(self, db: Session):
         users = db.query(User).filter(User.is_active == True).all()
@@ -176,13 +200,16 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        invalidate_principal(db_obj.user)
         return db_obj
 
     def remove_university(self, db: Session, id: int):
         obj = db.query(UserUniversity).filter(UserUniversity.id == id).first()
         if obj:
+            user = obj.user
             db.delete(obj)
             db.commit()
+            invalidate_principal(user)
             return obj
 
     def update_university(
@@ -195,7 +222,9 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True, exclude_none=True)
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        db_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        invalidate_principal(db_obj.user)
+        return db_obj
 
     def get_nationality(self, db: Session, user_id: int):
         return (
@@ -212,6 +241,8 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
     ):
         db_obj = UserNationality(**obj_in.model_dump())
         db.add(db_obj)
+        db.flush()
+        self.refresh_is_korean(db=db, user_id=db_obj.user_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -230,25 +261,47 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         # 삭제된 nationality_ids 찾기
         to_remove = set(existing_nationality_ids) - set(new_nationality_ids)
         # 새로운 nationality_ids 추가
-        for id in to_add:
-            user_nationality = user_schmea.UserNationalityCreate(
-                nationality_id=id, user_id=user_id
-            )
-            self.create_nationality(db=db, obj_in=user_nationality)
+        user_nationality.create_many(
+            db=db,
+            objs_in=[
+                user_schmea.UserNationalityCreate(nationality_id=id, user_id=user_id)
+                for id in to_add
+            ],
+            commit=False,
+        )
 
         # 삭제된 nationality_ids 제거
-        for nationality_id in to_remove:
-            self.remove_nationality(db=db, nationality_id=nationality_id)
+        if to_remove:
+            user_nationality.delete_where(
+                db,
+                UserNationality.user_id == user_id,
+                UserNationality.nationality_id.in_(to_remove),
+                commit=False,
+            )
+        self.refresh_is_korean(db=db, user_id=user_id)
+        db.commit()
+        invalidate_profile_cards(user_id)
 
-    def remove_nationality(self, db: Session, nationality_id: int):
-        obj = (
-            db.query(UserNationality)
-            .filter(UserNationality.nationality_id == nationality_id)
-            .first()
+    def refresh_is_korean(self, db: Session, user_id: int):
+        """
+        국적 변경 후 User.is_korean 캐시 갱신 (commit은 호출한 쪽에서)
+        """
+        return self.update_where(
+            db,
+            User.id == user_id,
+            values={"is_korean": korean_nationality_exists(user_id)},
+            commit=False,
         )
+
+    def remove_nationality(self, db: Session, id: int):
+        obj = db.query(UserNationality).filter(UserNationality.id == id).first()
         if obj:
+            user_id = obj.user_id
             db.delete(obj)
+            db.flush()
+            self.refresh_is_korean(db=db, user_id=user_id)
             db.commit()
+            invalidate_profile_cards(user_id)
             return obj
 
     def remove_email_certification(
@@ -265,6 +318,7 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
                 .first()
             )
         else:
+            email_code.delete_code(db_obj.email)
             obj = (
                 db.query(EmailCertification)
                 .filter(
@@ -273,8 +327,9 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
                 )
                 .first()
             )
-            db.delete(obj)
-            db.commit()
+            if obj:
+                db.delete(obj)
+                db.commit()
         return obj
 
     def create_email_certification(
@@ -283,6 +338,8 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         """
         Create a new email certification entry.
 
+        Redis에 5분 TTL로 저장하고, Redis 장애 시에만 EmailCertification 테이블에 저장
+
         Args:
             db: Database session instance.
             obj_in: EmailCertificationIn instance containing email and certification.
@@ -290,6 +347,9 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         Returns:
             Created EmailCertificationCheck instance.
         """
+        if email_code.save_code(obj_in.email, obj_in.certification):
+            return obj_in
+
         db_obj = EmailCertification(**obj_in.model_dump())
         db.add(db_obj)
         db.commit()
@@ -300,7 +360,9 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         self, db: Session, *, email: str, certification: str
     ) -> Optional[user_schmea.EmailCertificationCheck]:
         """
-        email_certification 검증(유효기간 지난 객체 삭제)
+        email_certification 검증
+
+        Redis에 없을 때(Redis 장애 중 발급된 인증번호)만 테이블 확인(유효기간 지난 객체 삭제)
 
         Args:
             db: Database session instance.
@@ -310,6 +372,13 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         Returns:
             EmailCertificationCheck instance if found and not expired, else None.
         """
+        result = email_code.check_code(email, certification)
+        if result == email_code.CODE_MATCHED:
+            return user_schmea.EmailCertificationCheck(
+                email=email, certification=certification
+            )
+        if result == email_code.CODE_MISMATCHED:
+            return None
 
         current_time = datetime.now()
         cert = (
@@ -340,15 +409,10 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         Returns:
             User instance if found, else None.
         """
-        return db.query(User).filter(User.email == email).first()
+        return db.scalars(USER_BY_EMAIL, {"email": email}).first()
 
     def get_by_sns(self, db: Session, sns_type: str, sns_id: str):
-        return (
-            db.query(User)
-            .filter(User.sns_id == sns_id)
-            .filter(User.sns_type == sns_type)
-            .first()
-        )
+        return db.scalars(USER_BY_SNS, {"sns_id": sns_id, "sns_type": sns_type}).first()
 
     def get_by_birth(self, db: Session, name: str, birth: str):
         return (
@@ -367,6 +431,7 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
             db.add(user)
             db.commit()
             db.refresh(user)
+            invalidate_principal(user)
         except:
             db.rollback()
             raise
@@ -421,7 +486,16 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["password"] = hashed_password
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+            # 비밀번호가 바뀌면 이전에 발급된 토큰 무효화
+            update_data["token_version"] = (db_obj.token_version or 0) + 1
+
+        # email/sns 정보가 바뀔 수 있으므로 변경 전 키도 함께 무효화
+        previous_keys = user_principal_keys(db_obj)
+        db_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        invalidate_principal_keys(previous_keys + user_principal_keys(db_obj))
+        if "token_version" in update_data:
+            token_store.revoke_user(db_obj.id)
+        return db_obj
 
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         """
@@ -438,10 +512,23 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         user = self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.password):
+        if not self.verify_and_rehash(db, user=user, password=password):
             return None
         return user
 
+    def verify_and_rehash(self, db: Session, *, user: User, password: str) -> bool:
+        """
+        비밀번호 검증 후 cost factor가 바뀐 해시면 새 해시로 교체
+
+        토큰 무효화 없이 해시만 바꾸므로 update()가 아닌 update_where 사용
+        """
+        verified, new_hash = hashing.verify_and_update_password(
+            password, user.password
+        )
+        if verified and new_hash:
+            self.update_where(db, User.id == user.id, values={"password": new_hash})
+        return verified
+
     def is_active(self, user: User) -> bool:
         return user.is_active
 
@@ -469,15 +556,39 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         user = db.query(User).filter(User.id == user_id).first()
         user.is_active = False
         user.deactive_time = datetime.now()
+        user.token_version = (user.token_version or 0) + 1
 
         meeting_user = (
             db.query(MeetingUser).filter(MeetingUser.user_id == user_id).delete()
         )
         reviews = db.query(Review).filter(Review.creator_id == user_id).delete()
 
-        profile = db.query(Profile).filter(Profile.user_id == user_id).delete()
+        nick_names = db.scalars(
+            delete(Profile)
+            .where(Profile.user_id == user_id)
+            .returning(Profile.nick_name)
+        ).all()
+
+        db.commit()
+        invalidate_principal(user)
+        invalidate_profile_cards(user_id)
+        bump_user_meetings(user_id)
+        remove_nick_names(*nick_names)
+        token_store.revoke_user(user_id)
+        return user
+
+    def revoke_tokens(self, db: Session, user_id: int):
+        """
+        유저에게 발급된 access/refresh 토큰 모두 폐기 (관리자 강제 로그아웃 등)
+        """
+        user = self.get(db, id=user_id)
+        if user is None:
+            return None
 
+        user.token_version = (user.token_version or 0) + 1
         db.commit()
+        invalidate_principal(user)
+        token_store.revoke_user(user_id)
         return user
 
     def save_deletion_request(self, db: Session, reason: str):
@@ -491,6 +602,7 @@ class CRUDUser(CRUDBase[User, user_schmea.UserCreate, user_schmea.UserUpdate]):
         user = db.query(User).filter(User.id == user_id).first()
         user.is_admin = True
         db.commit()
+        invalidate_principal(user)
         return user
 
     def read_all_chat_users(self, db: Session, chat_id: str) -> Dict[int, str]:
@@ -524,56 +636,75 @@ class CRUDSignUP:
         self.crud_user = crud_user
 
     def check_exists(self, db: Session, obj_in: user_schmea.UserRegister):
-        # 데이터베이스에서 이메일로 사용자 확인
+        """
+        가입 정보 검증, 테이블마다 한 번의 쿼리로 확인
+
+        - User: email(또는 sns) 중복, 같은 이름+생년월일 중복
+        - University / Nationality: id 존재 여부 (Nationality는 IN 쿼리)
+        """
+        same_person = and_(User.name == obj_in.name, User.birth == obj_in.birth)
         if obj_in.email:
-            user = self.crud_user.get_by_email(db=db, email=obj_in.email)
-            if user:
+            same_account = User.email == obj_in.email
+        elif obj_in.sns_type and obj_in.sns_id:
+            same_account = and_(
+                User.sns_type == obj_in.sns_type, User.sns_id == obj_in.sns_id
+            )
+        else:
+            same_account = None
+
+        conditions = [same_person]
+        if same_account is not None:
+            conditions.append(same_account)
+        users = db.scalars(select(User).where(or_(*conditions))).all()
+
+        # 기존 검사 순서(계정 중복 -> 이름+생년월일 중복) 유지
+        for user in users:
+            if obj_in.email and user.email == obj_in.email:
                 if not user.is_active:
                     raise HTTPException(
                         status_code=403,
                         detail="This account is the account that requested to be deleted.",
                     )
                 raise HTTPException(status_code=409, detail="User already registered.")
-        elif obj_in.sns_type and obj_in.sns_id:
-            user = self.crud_user.get_by_sns(
-                db=db, sns_type=obj_in.sns_type, sns_id=obj_in.sns_id
-            )
-            if user:
+            if (
+                not obj_in.email
+                and obj_in.sns_type
+                and obj_in.sns_id
+                and user.sns_type == obj_in.sns_type
+                and user.sns_id == obj_in.sns_id
+            ):
                 raise HTTPException(status_code=409, detail="User already registered.")
-
-        check_user = self.crud_user.get_by_birth(
-            db=db, name=obj_in.name, birth=obj_in.birth
-        )
-        if check_user:
+        if users:
             raise HTTPException(
                 status_code=409,
                 detail="User with same name and birthdate already registered.",
             )
 
-        user_nationality_obj_list = obj_in.nationality_ids
-
         university = crud.utility.get(db=db, university_id=obj_in.university_id)
         if not university:
             raise HTTPException(status_code=400, detail="University Not Found")
 
-        for id in user_nationality_obj_list:
-            nation = crud.utility.get(db=db, nationality_id=id)
-            if not nation:
+        nationality_ids = set(obj_in.nationality_ids or [])
+        if nationality_ids:
+            found_ids = set(
+                db.scalars(
+                    select(Nationality.id).where(Nationality.id.in_(nationality_ids))
+                ).all()
+            )
+            if found_ids != nationality_ids:
                 raise HTTPException(status_code=400, detail="Nationality Not Found")
 
         return True
 
     def register_user(self, db: Session, obj_in: user_schmea.UserRegister):
-        new_user = None
-        consent_obj = None
-        user_university_obj = None
-        hashed_password = None
-
-        password = obj_in.password
-        user_nationality_obj_list = obj_in.nationality_ids
+        """
+        유저, 국적, 약관 동의, 학교, 시스템 설정을 하나의 트랜잭션 / 한 번의 flush로 저장
 
-        if password:
-            hashed_password = get_password_hash(password)
+        중간에 실패하면 전부 rollback 되어 일부만 생성된 유저가 남지 않는다.
+        """
+        hashed_password = None
+        if obj_in.password:
+            hashed_password = get_password_hash(obj_in.password)
 
         user_in = user_schmea.UserCreate(
             email=obj_in.email,
@@ -585,39 +716,51 @@ class CRUDSignUP:
             sns_id=obj_in.sns_id,
             fcm_token=obj_in.fcm_token,
         )
-
-        new_user = self.crud_user.create(db=db, obj_in=user_in)
-
-        consent_in = user_schmea.ConsentCreate(
-            terms_mandatory=obj_in.terms_mandatory,
-            terms_optional=obj_in.terms_optional,
-            terms_push=obj_in.terms_push,
-            user_id=new_user.id,
+        nationality_ids = list(dict.fromkeys(obj_in.nationality_ids or []))
+
+        new_user = User(**user_in.model_dump())
+        # is_korean은 INSERT 안에서 subquery로 계산 (별도 UPDATE 없음)
+        new_user.is_korean = (
+            select(
+                exists().where(
+                    Nationality.id.in_(nationality_ids), Nationality.code == "kr"
+                )
+            ).scalar_subquery()
+            if nationality_ids
+            else False
         )
-
-        user_university_in = user_schmea.UserUniversityCreate(
+        new_user.user_nationality = [
+            UserNationality(nationality_id=nationality_id)
+            for nationality_id in nationality_ids
+        ]
+        new_user.consents = [
+            Consent(
+                terms_mandatory=obj_in.terms_mandatory,
+                terms_optional=obj_in.terms_optional,
+                terms_push=obj_in.terms_push,
+            )
+        ]
+        user_university = UserUniversity(
             department=obj_in.department,
             education_status=obj_in.education_status,
             university_id=obj_in.university_id,
-            user_id=new_user.id,
+            user=new_user,
         )
+        system = System(user=new_user)
 
-        for id in user_nationality_obj_list:
-            user_nationality_in = user_schmea.UserNationalityCreate(
-                nationality_id=id, user_id=new_user.id
-            )
-            user_nationality_obj = self.crud_user.create_nationality(
-                db=db, obj_in=user_nationality_in
-            )
-
-        consent_obj = self.crud_user.create_consent(db=db, obj_in=consent_in)
-        user_university_obj = self.crud_user.create_university(
-            db=db, obj_in=user_university_in
-        )
-        system = crud.system.create_with_default_value(db=db, user_id=new_user.id)
+        try:
+            db.add_all([new_user, user_university, system])
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(status_code=409, detail="User already registered.")
+        except Exception:
+            db.rollback()
+            raise
         return new_user
 
 
 user = CRUDUser(User)
+user_nationality = CRUDBase(UserNationality)
 signup = CRUDSignUP(user)
 deletion_requests = CRUDDeleteRequests(AccountDeletionRequest)
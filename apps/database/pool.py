@@ -0,0 +1,162 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from core.config import settings
+
+# 현재 요청(route group)에 적용할 타임아웃, None이면 기본값 사용
+statement_timeout_ms: ContextVar[Optional[int]] = ContextVar(
+    "statement_timeout_ms", default=None
+)
+pool_timeout_seconds: ContextVar[Optional[float]] = ContextVar(
+    "pool_timeout_seconds", default=None
+)
+
+# checkout 대기 시간 히스토그램 구간(초)
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 checkout/checkin 횟수와 checkout 대기 시간 히스토그램
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self._lock = threading.Lock()
+
+    def observe_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum += seconds
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def on_checkin(self, *args) -> None:
+        with self._lock:
+            self.checkins += 1
+
+    def snapshot(self, pool: QueuePool) -> Dict[str, Any]:
+        with self._lock:
+            histogram = {
+                f"le_{bound}": count
+                for bound, count in zip(WAIT_BUCKETS, self.wait_buckets)
+            }
+            histogram["le_inf"] = self.wait_buckets[-1]
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow_in_use": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "checkouts_total": self.checkouts,
+                "checkins_total": self.checkins,
+                "checkout_timeouts_total": self.timeouts,
+                "checkout_wait": {
+                    "count": self.wait_count,
+                    "sum_seconds": round(self.wait_sum, 6),
+                    "buckets": histogram,
+                },
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    checkout 대기 시간을 기록하고, route group별 checkout 타임아웃을 적용하는 QueuePool
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    @property
+    def _timeout(self) -> float:
+        override = pool_timeout_seconds.get()
+        return override if override is not None else self._default_timeout
+
+    @_timeout.setter
+    def _timeout(self, value: float) -> None:
+        self._default_timeout = value
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - start, timed_out)
+
+    def recreate(self) -> "TimedQueuePool":
+        pool = super().recreate()
+        pool._default_timeout = self._default_timeout
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            event.listen(pool, "checkout", self.metrics.on_checkout)
+            event.listen(pool, "checkin", self.metrics.on_checkin)
+        return pool
+
+
+_pool_registry: Dict[str, Any] = {}
+
+
+def register_pool_metrics(engine, name: str) -> PoolMetrics:
+    """
+    engine의 풀에 checkout/checkin 이벤트 리스너를 달고 메트릭 수집 시작
+    """
+    metrics = PoolMetrics(name)
+    engine.pool.metrics = metrics
+    event.listen(engine.pool, "checkout", metrics.on_checkout)
+    event.listen(engine.pool, "checkin", metrics.on_checkin)
+    _pool_registry[name] = engine
+    return metrics
+
+
+def pool_metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    return {
+        name: engine.pool.metrics.snapshot(engine.pool)
+        for name, engine in _pool_registry.items()
+        if getattr(engine.pool, "metrics", None) is not None
+    }
+
+
+def resolve_route_timeouts(path: str) -> Tuple[int, float]:
+    """
+    요청 경로에 가장 길게 일치하는 route group의 (statement_timeout ms, pool timeout 초)
+    """
+    statement_ms = settings.DB_STATEMENT_TIMEOUT_MS
+    pool_ms = settings.DB_POOL_TIMEOUT_MS
+    matched: List[str] = [
+        prefix for prefix in settings.DB_ROUTE_TIMEOUTS if path.startswith(prefix)
+    ]
+    if matched:
+        group = settings.DB_ROUTE_TIMEOUTS[max(matched, key=len)]
+        statement_ms = group.get("statement_timeout_ms", statement_ms)
+        pool_ms = group.get("pool_timeout_ms", pool_ms)
+    return statement_ms, pool_ms / 1000
+
+
+@event.listens_for(Session, "after_begin")
+def _set_statement_timeout(session, transaction, connection):
+    timeout = statement_timeout_ms.get()
+    if timeout and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
@@ -0,0 +1,101 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_PARAM_PATTERN = re.compile(r"%\(\w+\)s|\?|\$\d+")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+
+class RepeatedQueryError(AssertionError):
+    """
+    strict 모드에서 같은 형태의 쿼리가 기준 이상 반복될 때 발생 (N+1 의심)
+    """
+
+
+class QueryStats:
+    """
+    요청 하나 동안 실행된 SQL 개수, 총 DB 시간, 쿼리 형태별 반복 횟수
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.shapes: Counter = Counter()
+
+    @staticmethod
+    def shape(statement: str) -> str:
+        """
+        파라미터 값/개수를 지운 쿼리 형태 (IN 목록 길이가 달라도 같은 형태)
+        """
+        shape = _PARAM_PATTERN.sub("?", statement)
+        shape = _IN_LIST_PATTERN.sub("(?)", shape)
+        return _SPACE_PATTERN.sub(" ", shape).strip()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        self.shapes[self.shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        threshold 보다 많이 반복된 쿼리 형태 목록
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+    def assert_no_repeats(self, threshold: int) -> None:
+        repeated = self.repeated(threshold)
+        if repeated:
+            shape, count = repeated[0]
+            raise RepeatedQueryError(
+                f"Query repeated {count} times (threshold {threshold}): {shape}"
+            )
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def get_current_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행되는 SQL을 집계 (요청 미들웨어, 테스트, 벤치마크에서 사용)
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
@@ -1,7 +1,11 @@
-from typing import Generator
+from typing import Generator, Optional
 from sqlalchemy import create_engine, inspect
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from starlette.requests import Request
+from jose import jwt, JWTError
 from core.config import settings
+from core.redis_driver import redis_driver
+from database.pool import TimedQueuePool, register_pool_metrics
 from contextlib import contextmanager
 
 # 환경 변수나 설정에서 정보 가져오기
@@ -10,11 +14,40 @@ DATABASE_URL = f"postgresql+psycopg2://postgres:{settings.DB_ROOT_PASSWORD}@{set
 
 # SQLAlchemy 설정
 engine = create_engine(
-    DATABASE_URL, pool_size=20, max_overflow=40, connect_args={"connect_timeout": 30}
+    DATABASE_URL,
+    poolclass=TimedQueuePool,
+    pool_size=20,
+    max_overflow=40,
+    pool_timeout=settings.DB_POOL_TIMEOUT_MS / 1000,
+    connect_args={"connect_timeout": 30},
 )
+register_pool_metrics(engine, "primary")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 읽기 전용 Replica 설정
+# POSTGRES_REPLICA_HOST가 없으면 Primary engine을 그대로 사용
+# 같은 인스턴스를 가리켜도 되도록 세션 단위로 read only 트랜잭션을 강제
+if settings.POSTGRES_REPLICA_HOST:
+    REPLICA_DATABASE_URL = f"postgresql+psycopg2://postgres:{settings.DB_ROOT_PASSWORD}@{settings.POSTGRES_REPLICA_HOST}:5432/{settings.POSTGRES_DB}"
+    read_engine = create_engine(
+        REPLICA_DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_size=20,
+        max_overflow=40,
+        pool_timeout=settings.DB_POOL_TIMEOUT_MS / 1000,
+        connect_args={
+            "connect_timeout": 30,
+            "options": "-c default_transaction_read_only=on",
+        },
+    )
+    register_pool_metrics(read_engine, "replica")
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+RECENT_WRITE_NAME_SPACE = "recent_write"
+
 
 def get_db() -> Generator:
     """
@@ -25,3 +58,79 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+def _request_subject(request: Request) -> Optional[str]:
+    """
+    Authorization 헤더의 토큰에서 sub 추출 (서명 검증은 하지 않음, 라우팅 용도)
+    """
+    authorization = request.headers.get("Authorization")
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    try:
+        claims = jwt.get_unverified_claims(authorization[len("Bearer ") :])
+    except JWTError:
+        return None
+    return claims.get("sub")
+
+
+def mark_recent_write(request: Request) -> None:
+    """
+    쓰기 요청 이후 READ_YOUR_WRITES_SECONDS 동안 해당 유저의 읽기를 Primary로 보냄
+    """
+    if read_engine is engine:
+        return
+    subject = _request_subject(request)
+    if subject is None:
+        return
+
+    try:
+        redis_driver.set_value(
+            f"{RECENT_WRITE_NAME_SPACE}:{subject}",
+            1,
+            expire_time=settings.READ_YOUR_WRITES_SECONDS,
+        )
+    except Exception:
+        # 표시에 실패해도 요청 자체는 정상 처리
+        pass
+
+
+def _has_recent_write(request: Request) -> bool:
+    subject = _request_subject(request)
+    if subject is None:
+        return False
+
+    try:
+        return redis_driver.is_cached(f"{RECENT_WRITE_NAME_SPACE}:{subject}")
+    except Exception:
+        # Redis 장애 시 stale 데이터를 보여주지 않도록 Primary 사용
+        return True
+
+
+def get_read_db(request: Request) -> Generator:
+    """
+    조회 전용 API에서 사용하는 세션
+
+    - Replica가 설정되어 있으면 Replica에서 읽음
+    - 최근에 쓰기를 한 유저는 Primary에서 읽음 (read-your-writes)
+    """
+    if read_engine is engine or _has_recent_write(request):
+        session_factory = SessionLocal
+    else:
+        session_factory = ReadSessionLocal
+
+    try:
+        db = session_factory()
+        yield db
+    finally:
+        db.close()
+
+
+def is_replica_session(db: Session) -> bool:
+    """
+    Replica에 연결된 세션인지 확인
+
+    Replica는 복제 지연 동안 커밋 전 데이터를 돌려줄 수 있으므로
+    공유 캐시는 Replica에서 읽은 값으로 채우지 않는다.
+    """
+    return read_engine is not engine and db.get_bind() is read_engine
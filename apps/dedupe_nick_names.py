@@ -0,0 +1,61 @@
+"""
+대소문자만 다른 중복 닉네임 정리 (일회성)
+
+ix_profile_nick_name_lower(lower(nick_name) unique index)를 만들기 전에 실행해야 한다.
+중복이 남아 있으면 index 생성(alembic upgrade)이 실패한다.
+
+    cd apps && python dedupe_nick_names.py
+
+같은 lower(nick_name) 중 가장 먼저 만든 프로필(id가 가장 작은)만 그대로 두고,
+나머지는 뒤에 숫자를 붙여 겹치지 않는 닉네임으로 바꾼다.
+(닉네임에 특수문자를 쓸 수 없으므로 숫자만 붙임)
+"""
+from sqlalchemy import func, select
+
+from core.profile_card import invalidate_profile_cards
+from database.session import SessionLocal
+from models.profile import Profile
+
+session = SessionLocal()
+
+try:
+    # 대소문자 비교는 모두 DB의 lower()로 (index와 같은 기준, Python str.lower()와 다를 수 있음)
+    lower_nick_name = func.lower(Profile.nick_name)
+    duplicated = (
+        select(lower_nick_name)
+        .where(Profile.nick_name.isnot(None))
+        .group_by(lower_nick_name)
+        .having(func.count() > 1)
+    )
+    rows = session.execute(
+        select(Profile, lower_nick_name.label("lower_name"))
+        .where(lower_nick_name.in_(duplicated))
+        .order_by(lower_nick_name, Profile.id)
+    ).all()
+
+    used = set(
+        session.scalars(select(lower_nick_name).where(Profile.nick_name.isnot(None)))
+    )
+    kept = set()
+    renamed_user_ids = []
+    for profile, lower_name in rows:
+        if lower_name not in kept:
+            kept.add(lower_name)
+            continue
+
+        # 숫자는 lower()로 바뀌지 않으므로 lower_name 뒤에 붙여서 비교
+        suffix = 1
+        while f"{lower_name}{suffix}" in used:
+            suffix += 1
+        new_nick_name = f"{profile.nick_name}{suffix}"
+        used.add(f"{lower_name}{suffix}")
+        print(f"profile {profile.id}: {profile.nick_name} -> {new_nick_name}")
+        profile.nick_name = new_nick_name
+        renamed_user_ids.append(profile.user_id)
+
+    session.commit()
+    invalidate_profile_cards(*renamed_user_ids)
+    print(f"{len(renamed_user_ids)} nick_name(s) renamed")
+
+finally:
+    session.close()
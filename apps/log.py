@@ -38,6 +38,7 @@ uvicorn_logger = setup_logger(logger_name="uvicorn", level=logging.WARNING)
 scheduler_logger = setup_logger(logger_name="scheduler", level=logging.WARNING)
 alarm_logger = setup_logger(logger_name="alarm", level=logging.WARNING)
 error_log = setup_logger(logger_name="error", level=logging.ERROR)
+query_logger = setup_logger(logger_name="query", level=logging.WARNING)
 
 
 def log_error(exception: Exception, type: str = LogTypeEnum.DEFAULT.value):
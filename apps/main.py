@@ -1,27 +1,44 @@
 import base64, json, time
+from datetime import datetime
 from dotenv import load_dotenv
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
+from starlette.concurrency import run_in_threadpool
 
 from fastapi import FastAPI, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError, OperationalError
+from psycopg2.errors import QueryCanceled
 from fastapi.staticfiles import StaticFiles
 from firebase_admin import credentials, initialize_app
 from fastapi.openapi.docs import get_swagger_ui_html
 from sqladmin import Admin
-from database.session import engine
+from database.session import engine, mark_recent_write
+from database.query_counter import track_queries
+from database.pool import (
+    statement_timeout_ms,
+    pool_timeout_seconds,
+    resolve_route_timeouts,
+)
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from core.config import settings
 from core.security import get_admin
 from core.redis_driver import redis_driver
+from core.rate_limit import rate_limit_rule, throttle_request
+from core.mail import mail_sender
+from crud.user import precompile_email_templates
+from log import query_logger
 from admin.base import register_all, templates_dir, AdminAuth
 from api.v1.router import api_router as v1_router
 from scheduler_module import (
     meeting_active_check,
     user_remove_after_seven,
     meeting_time_alarm,
+    nick_name_index_rebuild,
+    nick_name_pool_refill,
 )
 
 
@@ -71,8 +88,108 @@ class RequestTimeMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    쓰기 요청(GET 외)을 보낸 유저는 일정 시간 동안 Primary DB에서 읽도록 표시
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in self.SAFE_METHODS:
+            mark_recent_write(request)
+        return response
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    요청별 SQL 실행 횟수/시간 집계 및 N+1 의심 쿼리 경고
+
+    - DEBUG 모드에서는 X-DB-Queries, X-DB-Time-Ms 헤더로 반환
+    - QUERY_COUNTER_STRICT 이면 반복 쿼리 발견 시 예외 발생
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        with track_queries() as stats:
+            response = await call_next(request)
+
+        threshold = settings.QUERY_REPEAT_THRESHOLD
+        for shape, count in stats.repeated(threshold):
+            query_logger.warning(
+                f"{request.method} {request.url.path} - query repeated {count} times: {shape}"
+            )
+        if settings.QUERY_COUNTER_STRICT:
+            stats.assert_no_repeats(threshold)
+
+        if settings.DEBUG:
+            response.headers["X-DB-Queries"] = str(stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{stats.total_time * 1000:.2f}"
+        return response
+
+
+class DBTimeoutMiddleware(BaseHTTPMiddleware):
+    """
+    경로 prefix(route group)별 statement_timeout / 커넥션 풀 checkout 타임아웃 적용
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        statement_ms, pool_seconds = resolve_route_timeouts(request.url.path)
+        statement_token = statement_timeout_ms.set(statement_ms)
+        pool_token = pool_timeout_seconds.set(pool_seconds)
+        try:
+            return await call_next(request)
+        finally:
+            statement_timeout_ms.reset(statement_token)
+            pool_timeout_seconds.reset(pool_token)
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    RATE_LIMIT_RULES에 설정된 경로의 요청 제한, 초과 시 뒤 미들웨어/DB를 거치지 않고 429
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if rate_limit_rule(request) is None:
+            return await call_next(request)
+        # 동기 Redis 호출이 이벤트 루프를 막지 않도록 threadpool에서 실행
+        retry_after = await run_in_threadpool(throttle_request, request)
+        if retry_after:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests, please retry later"},
+                headers={"Retry-After": str(retry_after)},
+            )
+        return await call_next(request)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database is busy, please try again."},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(OperationalError)
+async def statement_timeout_handler(request: Request, exc: OperationalError):
+    if not isinstance(exc.orig, QueryCanceled):
+        raise exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database query timed out."},
+        headers={"Retry-After": "1"},
+    )
+
+
 # 미들웨어 추가
 app.add_middleware(RequestTimeMiddleware)
+app.add_middleware(DBTimeoutMiddleware)
+app.add_middleware(QueryCounterMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+# 마지막에 추가한 미들웨어가 가장 먼저 실행됨
+app.add_middleware(RateLimitMiddleware)
 
 
 @app.get("/docs", include_in_schema=False)
@@ -97,12 +214,28 @@ async def start_event():
 
     # redis connect
     redis_driver.connect()
+    # 닉네임 set은 Redis 연결 후 바로 한 번 만들고 주기적으로 다시 생성
+    scheduler.add_job(
+        nick_name_index_rebuild, "interval", hours=6, next_run_time=datetime.now()
+    )
+    scheduler.add_job(
+        nick_name_pool_refill,
+        "interval",
+        seconds=settings.NICK_NAME_POOL_REFILL_SECONDS,
+        next_run_time=datetime.now(),
+    )
+
+    # 메일 발송 워커 시작, 메일 템플릿 미리 컴파일
+    mail_sender.start()
+    precompile_email_templates()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     # 스케줄러 종료
     scheduler.shutdown()
+    # 큐에 남은 메일 발송 후 종료
+    mail_sender.stop(timeout=10)
 
 
 # Set all CORS enabled origins
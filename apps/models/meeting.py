@@ -6,15 +6,20 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     UniqueConstraint,
+    Index,
     event,
+    update,
+    select,
+    case,
+    func,
+    inspect,
 )
-from sqlalchemy.orm import relationship, backref, Session
+from sqlalchemy.orm import relationship, backref, Session, column_property
 from sqlalchemy.ext.hybrid import hybrid_property
 
-from core.config import settings
 from models.base import ModelBase
+from models.user import User, korean_nationality_exists
 from schemas.enum import ReultStatusEnum
-from database.session import SessionLocal
 
 
 class Meeting(ModelBase):
@@ -39,7 +44,8 @@ class Meeting(ModelBase):
     university_id = Column(Integer, ForeignKey("university.id"), nullable=True)
     university = relationship("University")
 
-    creator_id = Column(Integer, ForeignKey("user.id"))
+    # 내 모임 목록(생성한 모임) 조회용
+    creator_id = Column(Integer, ForeignKey("user.id"), index=True)
     creator = relationship(
         "User", backref=backref("created_meetings", cascade="all, delete-orphan")
     )
@@ -79,7 +85,8 @@ class Meeting(ModelBase):
 
 
 class MeetingUser(ModelBase):
-    status = Column(String, nullable=True)
+    # 참가 인원 증감 판단을 위해 이전 status 값을 항상 history에 남김
+    status = column_property(Column(String, nullable=True), active_history=True)
 
     user_id = Column(Integer, ForeignKey("user.id"))
     meeting_id = Column(Integer, ForeignKey("meeting.id"))
@@ -137,6 +144,9 @@ class Review(ModelBase):
         "User", backref=backref("reviews", cascade="all, delete-orphan"), uselist=False
     )
 
+    # 내 모임 목록(PAST)에서 리뷰 작성한 모임 제외 (anti-join)
+    __table_args__ = (Index("ix_review_creator_meeting", "creator_id", "meeting_id"),)
+
     @property
     def creator_name(self):
         return self.creator.name
@@ -156,47 +166,53 @@ class Review(ModelBase):
 #     review = relationship("Review", back_populates="review_photos")
 
 
+def participants_counter_update(user_id: int, meeting_id: int, delta: int):
+    """
+    모임 참가 인원/한국인/외국인 수를 한 번의 UPDATE로 증감
+
+    유저의 is_korean 캐시를 사용하고, 아직 계산되지 않았으면 국적으로 판단
+    """
+    user = User.__table__
+    meeting = Meeting.__table__
+    is_korean = func.coalesce(
+        select(user.c.is_korean).where(user.c.id == user_id).scalar_subquery(),
+        korean_nationality_exists(user_id),
+    )
+    return (
+        update(meeting)
+        .where(meeting.c.id == meeting_id)
+        .values(
+            current_participants=meeting.c.current_participants + delta,
+            korean_count=meeting.c.korean_count + case((is_korean, delta), else_=0),
+            foreign_count=meeting.c.foreign_count + case((is_korean, 0), else_=delta),
+        )
+    )
+
+
 @event.listens_for(MeetingUser, "after_update")
 def increase_participants(mapper, connection, target):
+    # status가 APPROVE로 바뀐 경우에만 같은 트랜잭션에서 증가
+    history = inspect(target).attrs.status.history
+    if not history.has_changes() or target.status != ReultStatusEnum.APPROVE:
+        return
+    if ReultStatusEnum.APPROVE in history.deleted:
+        return
+
+    connection.execute(
+        participants_counter_update(
+            user_id=target.user_id, meeting_id=target.meeting_id, delta=1
+        )
+    )
+
 
-    session = SessionLocal()
-
-    if target.status == ReultStatusEnum.APPROVE:
-        try:
-            parti_user_nationality = target.user.user_nationality
-            nation_codes = [un.nationality.code for un in parti_user_nationality]
-
-            meeting = session.query(Meeting).get(target.meeting_id)
-            meeting.current_participants = meeting.current_participants + 1
-            if "kr" in nation_codes:
-                meeting.korean_count = meeting.korean_count + 1
-            else:
-                meeting.foreign_count = meeting.foreign_count + 1
-            session.commit()
-        except:
-            session.rollback()
-        finally:
-            session.close()
-
-
-if not settings.DEBUG:
-
-    @event.listens_for(MeetingUser, "after_delete")
-    def decrease_participants(mapper, connection, target):
-
-        session = SessionLocal()
-
-        parti_user_nationality = target.user.user_nationality
-        nation_codes = [un.nationality.code for un in parti_user_nationality]
-        meeting = session.query(Meeting).get(target.meeting_id)
-        try:
-            meeting.current_participants = meeting.current_participants - 1
-            if "kr" in nation_codes:
-                meeting.korean_count = meeting.korean_count - 1
-            else:
-                meeting.foreign_count = meeting.foreign_count - 1
-            session.commit()
-        except:
-            session.rollback()
-        finally:
-            session.close()
+@event.listens_for(MeetingUser, "after_delete")
+def decrease_participants(mapper, connection, target):
+    # 승인된 참가자가 삭제된 경우에만 감소
+    if target.status != ReultStatusEnum.APPROVE:
+        return
+
+    connection.execute(
+        participants_counter_update(
+            user_id=target.user_id, meeting_id=target.meeting_id, delta=-1
+        )
+    )
@@ -1,4 +1,15 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, Enum, ForeignKey, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    Date,
+    Enum,
+    ForeignKey,
+    Text,
+    Index,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from models.base import ModelBase
@@ -6,6 +17,7 @@ from models.base import ModelBase
 
 class Profile(ModelBase):
     profile_photo = Column(String, nullable=True)  # 이미지 URL 저장
+    # 중복 확인은 아래 lower(nick_name) unique index로
     nick_name = Column(String)
     context = Column(String, nullable=True)
     is_default_photo = Column(Boolean, default=False)
@@ -33,11 +45,17 @@ class Profile(ModelBase):
     )
 
 
+# 대소문자 구분 없이 닉네임 중복 방지 + 사용 여부 확인 조회용
+Index("ix_profile_nick_name_lower", func.lower(Profile.nick_name), unique=True)
+
+
 class UserUniversity(ModelBase):
     department = Column(String, nullable=True)
     education_status = Column(String, nullable=True)
 
     user_id = Column(Integer, nullable=True)
+    # FK 제약 없이 user_id만 채우는 관계 (회원가입 시 한 번의 flush로 저장하기 위함)
+    user = relationship("User", primaryjoin="foreign(UserUniversity.user_id) == User.id")
 
     university_id = Column(Integer, ForeignKey("university.id", ondelete="CASCADE"))
     university = relationship("University", backref="user_university")
@@ -73,6 +91,15 @@ class StudentVerification(ModelBase):
     profile_id = Column(Integer, ForeignKey("profile.id", ondelete="CASCADE"))
     profile = relationship("Profile", back_populates="student_verification")
 
+    # 상태별 심사 대기열 조회 (verification_status = ? order by created_time)
+    __table_args__ = (
+        Index(
+            "ix_student_verification_status_created",
+            "verification_status",
+            "created_time",
+        ),
+    )
+
     @property
     def user_name(self):
         return self.profile.user.name
@@ -83,12 +110,15 @@ class StudentVerification(ModelBase):
 
     @property
     def university(self):
-        return self.profile.user_university.university.kr_name
+        user_university = self.profile.user_university
+        return user_university.university.kr_name if user_university else None
 
     @property
     def department(self):
-        return self.profile.user_university.department
+        user_university = self.profile.user_university
+        return user_university.department if user_university else None
 
     @property
     def education_status(self):
-        return self.profile.user_university.education_status
+        user_university = self.profile.user_university
+        return user_university.education_status if user_university else None
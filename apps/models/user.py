@@ -8,9 +8,13 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     DateTime,
+    exists,
+    and_,
 )
 from sqlalchemy.orm import relationship, backref
 
+from models.utility import Nationality
+
 
 class User(ModelBase):
     email = Column(String, unique=True, index=True)
@@ -28,6 +32,10 @@ class User(ModelBase):
     deactive_time = Column(DateTime, default=None, nullable=True)
     deleted_data = Column(Date, nullable=True)
     is_admin = Column(Boolean, default=False)
+    # 국적에 한국(kr)이 포함되어 있는지 캐시, None이면 아직 계산되지 않음
+    is_korean = Column(Boolean, nullable=True)
+    # 비밀번호 변경/탈퇴 시 증가, 이전 버전으로 발급된 토큰은 거부
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     profile = relationship(
         "Profile", back_populates="user", uselist=False, cascade="all, delete-orphan"
@@ -59,6 +67,21 @@ class UserNationality(ModelBase):
     user = relationship("User", back_populates="user_nationality")
 
 
+def korean_nationality_exists(user_id):
+    """
+    user_id의 국적 중 한국(kr)이 있는지 확인하는 EXISTS 표현식
+    """
+    user_nationality = UserNationality.__table__
+    nationality = Nationality.__table__
+    return exists().where(
+        and_(
+            user_nationality.c.user_id == user_id,
+            user_nationality.c.nationality_id == nationality.c.id,
+            nationality.c.code == "kr",
+        )
+    )
+
+
 class EmailCertification(ModelBase):
     certification = Column(String, index=True)
     email = Column(String, index=True)
@@ -74,3 +74,36 @@ def meeting_time_alarm():
     finally:
         db.close()
     return None
+
+
+def nick_name_index_rebuild():
+    """
+    닉네임 사용 여부 Redis set을 DB 기준으로 다시 생성
+    """
+    db = SessionLocal()
+    count = 0
+    try:
+        count = crud.profile.rebuild_nick_name_index(db=db)
+    except Exception as e:
+        scheduler_logger.error(f"Error While nick_name_index_rebuild : {e}")
+    finally:
+        db.close()
+        if count < 0:
+            scheduler_logger.warning("nick_name index rebuild already running")
+        else:
+            scheduler_logger.warning(f"{count} nick_name(s) indexed")
+    return None
+
+
+def nick_name_pool_refill():
+    """
+    랜덤 닉네임 pool을 사용 가능한 닉네임으로 채움
+    """
+    db = SessionLocal()
+    try:
+        crud.profile.refill_nick_name_pool(db=db)
+    except Exception as e:
+        scheduler_logger.error(f"Error While nick_name_pool_refill : {e}")
+    finally:
+        db.close()
+    return None
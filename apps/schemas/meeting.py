@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 from pydantic import BaseModel, computed_field, Field, ConfigDict
 from enum import Enum
 from typing import Optional, List, Union
@@ -165,6 +166,8 @@ class MeetingSummaryResponse(CoreSchema, MeetingBase, MeetingCountBase):
 class MeetingListResponse(BaseModel):
     total_count: int
     meetings: Optional[List[MeetingSummaryResponse]] = []
+    # cursor 페이지네이션을 지원하는 목록에서만 채워짐
+    next_cursor: Optional[str] = None
 
 
 class MeetingUserLanguage(CoreSchema):
@@ -193,34 +196,42 @@ class CommentCreate(CommentBase):
 class MeetingDetailResponse(MeetingResponse):
     creator: Optional[UserResponse] = None
 
+    # computed field는 직렬화할 때마다 다시 계산되지 않도록 인스턴스에 캐시
+
     @computed_field
-    @property
+    @cached_property
     def topics(self) -> List[TopicResponse]:
         return [meeting_topic.topic for meeting_topic in self.meeting_topics]
 
     @computed_field
-    @property
+    @cached_property
     def languages(self) -> List[LanguageBase]:
         return [
             meeting_language.language for meeting_language in self.meeting_languages
         ]
 
     @computed_field
-    @property
+    @cached_property
     def users_languages(self) -> List[LanguageBase]:
-        user_languages = []
-        available_languages = [
-            meeting_user.user.profile.available_language_list
-            for meeting_user in self.meeting_users
+        """
+        참가자(모임장 + 승인된 유저)가 사용할 수 있는 언어 중 모임 언어에 포함된 것
+        """
+        spoken_language_ids = set()
+        for user in self.participants:
+            if not user or not user.profile:
+                continue
+            for available_language in user.profile.available_language_list or []:
+                if available_language.language:
+                    spoken_language_ids.add(available_language.language.id)
+
+        return [
+            language
+            for language in self.languages
+            if language and language.id in spoken_language_ids
         ]
-        for languages in available_languages:
-            for language in languages:
-                if language not in user_languages and language in self.languages:
-                    user_languages.append(language)
-        return user_languages
 
     @computed_field
-    @property
+    @cached_property
     def participants(self) -> List[UserResponse]:
         return [self.creator] + [
             instance.user
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from pydantic import ConfigDict, BaseModel, computed_field, Field
 
 from typing import Optional, List, Union
@@ -40,6 +40,14 @@ class StudentVerificationUpdate(BaseModel):
     verification_status: Optional[str] = ReultStatusEnum.PENDING.value
 
 
+class StudentVerificationQueueResponse(StudentVerificationBase):
+    created_time: Optional[datetime] = None
+    user_name: Optional[str] = None
+    university: Optional[str] = None
+    department: Optional[str] = None
+    education_status: Optional[str] = None
+
+
 class ProfileBase(CoreSchema):
     nick_name: Optional[str] = None
     profile_photo: Optional[Union[str, UploadFile]] = None
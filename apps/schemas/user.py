@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from pydantic import EmailStr, BaseModel, ConfigDict
 from enum import Enum
-from typing import Optional, List, Union
+from typing import Optional, List, Union, ClassVar
 
 from schemas.base import CoreSchema
 from schemas.profile import (
@@ -153,8 +153,19 @@ class TokenData(BaseModel):
     email: Optional[EmailStr] = None
 
 
+# 인증 시 캐시되는 최소한의 유저 정보
+class UserPrincipal(BaseModel):
+    id: int
+    is_active: bool = True
+    is_admin: bool = False
+    university_id: Optional[int] = None
+    token_version: int = 0
+
+
 class EmailCertificationIn(BaseModel):
     email: Optional[EmailStr] = None
+    # 인증 메일 언어 (kr, en)
+    language_code: str = "kr"
 
 
 class EmailCertificationCheck(BaseModel):
@@ -250,6 +261,9 @@ class UserSimpleResponse(CoreSchema):
     gender: Optional[str]
     user_nationality: Optional[List[UserNationalityBase]] = None
 
+    # profile_photo, nick_name 프로퍼티가 profile 관계를 사용
+    orm_eager_load: ClassVar[List[str]] = ["profile"]
+
     model_config = ConfigDict(from_attributes=True)
 
 
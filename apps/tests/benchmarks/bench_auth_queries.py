@@ -0,0 +1,111 @@
+"""
+인증 경로 조회 micro-benchmark
+
+    cd apps && python -m tests.benchmarks.bench_auth_queries
+
+매 요청 query 체인을 새로 만드는 이전 구현과 모듈 레벨에서 한 번 만든
+select() statement 를 재사용하는 현재 구현의 Python 측 오버헤드를 비교
+(DB 왕복 비용을 빼기 위해 in-memory sqlite 사용)
+"""
+import timeit
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from models.base import ModelBase
+from models.user import User
+from models.alarm import Alarm
+
+USER_COUNT = 100
+NUMBER = 2000
+
+
+def legacy_get_by_email(db, email):
+    return db.query(User).filter(User.email == email).first()
+
+
+def legacy_get_by_sns(db, sns_type, sns_id):
+    return (
+        db.query(User)
+        .filter(User.sns_id == sns_id)
+        .filter(User.sns_type == sns_type)
+        .first()
+    )
+
+
+def legacy_get(db, id):
+    return db.query(User).filter(User.id == id).first()
+
+
+def legacy_alarms(db, user_id, skip=0, limit=10):
+    query = (
+        db.query(Alarm)
+        .filter(Alarm.user_id == user_id)
+        .order_by(Alarm.is_read, Alarm.created_time.desc())
+    )
+    total_count = query.count()
+    return query.offset(skip).limit(limit).all(), total_count
+
+
+def setup_session():
+    engine = create_engine("sqlite://")
+    ModelBase.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for i in range(USER_COUNT):
+        db.add(
+            User(
+                email=f"user{i}@example.com",
+                name=f"user{i}",
+                birth=date(2000, 1, 1),
+                gender="male",
+                sns_type="kakao",
+                sns_id=f"sns{i}",
+            )
+        )
+    db.flush()
+    for i in range(10):
+        db.add(Alarm(user_id=1, title=f"title{i}", content="content"))
+    db.commit()
+    return db
+
+
+def main():
+    db = setup_session()
+    cases = [
+        (
+            "get_by_email",
+            lambda: legacy_get_by_email(db, "user50@example.com"),
+            lambda: crud.user.get_by_email(db, email="user50@example.com"),
+        ),
+        (
+            "get_by_sns",
+            lambda: legacy_get_by_sns(db, "kakao", "sns50"),
+            lambda: crud.user.get_by_sns(db, sns_type="kakao", sns_id="sns50"),
+        ),
+        (
+            "CRUDBase.get",
+            lambda: legacy_get(db, 50),
+            lambda: crud.user.get(db, 50),
+        ),
+        (
+            "alarm list",
+            lambda: legacy_alarms(db, 1),
+            lambda: crud.alarm.get_multi_with_user_id(db, user_id=1),
+        ),
+    ]
+    print(f"{'query':>14} | {'legacy (us)':>12} | {'compiled (us)':>13} | speedup")
+    for name, legacy, current in cases:
+        legacy_time = min(timeit.repeat(legacy, number=NUMBER, repeat=3))
+        current_time = min(timeit.repeat(current, number=NUMBER, repeat=3))
+        print(
+            f"{name:>14} | {legacy_time / NUMBER * 1e6:>12.1f} | "
+            f"{current_time / NUMBER * 1e6:>13.1f} | "
+            f"{legacy_time / current_time:.2f}x"
+        )
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
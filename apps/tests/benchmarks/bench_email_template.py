@@ -0,0 +1,56 @@
+"""
+인증 메일 템플릿 렌더링 micro-benchmark
+
+    cd apps && python -m tests.benchmarks.bench_email_template
+
+- per-call : 이전 구현, 호출마다 Environment 생성 + 템플릿 파싱/컴파일
+- cached   : 현재 구현, 모듈 레벨 Environment (+ bytecode cache) 재사용
+"""
+import timeit
+
+from jinja2 import Environment, FileSystemLoader
+
+from crud.user import (
+    EMAIL_TEMPLATES,
+    TEMPLATE_DIR,
+    precompile_email_templates,
+    render_template,
+)
+
+NUMBER = 500
+CONTEXT = {"certification": "123456", "s3_logo_url": "https://example.com/logo.png"}
+
+
+def legacy_render_template(filename: str, **kwargs):
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+    template = env.get_template(filename)
+    return template.render(**kwargs)
+
+
+def main():
+    precompile_email_templates()
+    print(f"{'template':>14} | {'per-call (us)':>13} | {'cached (us)':>11} | speedup")
+    for filename, _ in EMAIL_TEMPLATES.values():
+        assert legacy_render_template(filename, **CONTEXT) == render_template(
+            filename, **CONTEXT
+        )
+        legacy = min(
+            timeit.repeat(
+                lambda: legacy_render_template(filename, **CONTEXT),
+                number=NUMBER,
+                repeat=3,
+            )
+        )
+        cached = min(
+            timeit.repeat(
+                lambda: render_template(filename, **CONTEXT), number=NUMBER, repeat=3
+            )
+        )
+        print(
+            f"{filename:>14} | {legacy / NUMBER * 1e6:>13.1f} | "
+            f"{cached / NUMBER * 1e6:>11.1f} | {legacy / cached:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+모임 참가 승인 동시성 micro-benchmark (Postgres, 테스트 DB 사용)
+
+    cd apps && python -m tests.benchmarks.bench_join_approve
+
+스레드마다 별도 커넥션으로 같은 모임의 참가 요청을 동시에 승인하고
+처리량(req/s)과 승인 / 거절 개수를 출력
+meeting row lock 경합이 있으므로 sqlite가 아닌 실제 Postgres에서만 의미가 있다.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from core.config import settings
+from models.base import ModelBase
+from models.meeting import Meeting, MeetingUser
+from models.user import User
+from schemas.enum import ReultStatusEnum
+
+DATABASE_URL = f"postgresql+psycopg2://postgres:{settings.DB_ROOT_PASSWORD}@{settings.POSTGRES_HOST}:5432/{settings.TEST_DB}"
+
+REQUEST_COUNT = 200
+SEATS = 50
+WORKER_COUNTS = (1, 5, 10, 20)
+
+
+def setup(Session) -> list:
+    db = Session()
+    creator = User(email="bench-creator@example.com", name="creator")
+    db.add(creator)
+    db.flush()
+    meeting = Meeting(
+        name="bench",
+        meeting_time=datetime.now() + timedelta(days=1),
+        max_participants=SEATS,
+        current_participants=0,
+        korean_count=0,
+        foreign_count=0,
+        is_active=True,
+        creator_id=creator.id,
+    )
+    users = [
+        User(email=f"bench{i}@example.com", name=f"bench{i}")
+        for i in range(REQUEST_COUNT)
+    ]
+    db.add(meeting)
+    db.add_all(users)
+    db.flush()
+    join_requests = [
+        MeetingUser(
+            user_id=user.id,
+            meeting_id=meeting.id,
+            status=ReultStatusEnum.PENDING.value,
+        )
+        for user in users
+    ]
+    db.add_all(join_requests)
+    db.commit()
+    request_ids = [join_request.id for join_request in join_requests]
+    db.close()
+    return request_ids
+
+
+def run(engine, worker_count: int):
+    ModelBase.metadata.drop_all(bind=engine)
+    ModelBase.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    request_ids = setup(Session)
+
+    def approve(obj_id: int) -> bool:
+        db = Session()
+        try:
+            crud.meeting.join_request_approve(db=db, obj_id=obj_id)
+            return True
+        except HTTPException:
+            return False
+        finally:
+            db.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        results = list(executor.map(approve, request_ids))
+    elapsed = time.perf_counter() - started
+    return results.count(True), results.count(False), REQUEST_COUNT / elapsed
+
+
+def main():
+    engine = create_engine(DATABASE_URL, pool_size=max(WORKER_COUNTS), max_overflow=0)
+    print(f"{'threads':>7} | {'approved':>8} | {'rejected':>8} | req/s")
+    try:
+        for worker_count in WORKER_COUNTS:
+            approved, rejected, per_sec = run(engine, worker_count)
+            print(f"{worker_count:>7} | {approved:>8} | {rejected:>8} | {per_sec:.1f}")
+    finally:
+        ModelBase.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
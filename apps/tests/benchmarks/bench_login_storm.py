@@ -0,0 +1,106 @@
+"""
+로그인 폭주 중 GET 지연 micro-benchmark
+
+    cd apps && python -m tests.benchmarks.bench_login_storm
+
+요청 threadpool(기본 40 스레드)을 흉내 낸 executor에 로그인(bcrypt 검증)과
+가벼운 GET 요청을 섞어서 넣고, GET 요청의 p50/p99 지연과 로그인 처리량을 비교
+
+- inline : 이전 구현, 요청 스레드에서 바로 bcrypt 실행
+- bounded: 현재 구현, core.hashing 전용 executor + 대기열 초과 시 503
+"""
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from core import hashing
+
+REQUEST_THREADS = 40
+LOGIN_COUNT = 400
+GET_COUNT = 400
+GET_WORK_SECONDS = 0.002
+
+PASSWORD = "benchmark-password"
+HASHED = hashing.pwd_context.hash(PASSWORD)
+
+
+def inline_login():
+    hashing.pwd_context.verify(PASSWORD, HASHED)
+    return 200
+
+
+def bounded_login():
+    try:
+        hashing.verify_password(PASSWORD, HASHED)
+        return 200
+    except HTTPException as e:
+        return e.status_code
+
+
+def get_request():
+    time.sleep(GET_WORK_SECONDS)
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def run(login):
+    pool = ThreadPoolExecutor(max_workers=REQUEST_THREADS)
+    get_latencies = []
+    login_results = []
+    lock = threading.Lock()
+
+    def timed_get(submitted):
+        get_request()
+        with lock:
+            get_latencies.append(time.perf_counter() - submitted)
+
+    def timed_login():
+        result = login()
+        with lock:
+            login_results.append(result)
+
+    started = time.perf_counter()
+    futures = []
+    # 로그인 폭주가 먼저 들어오고 GET이 뒤섞여 들어오는 상황
+    for i in range(max(LOGIN_COUNT, GET_COUNT)):
+        if i < LOGIN_COUNT:
+            futures.append(pool.submit(timed_login))
+        if i < GET_COUNT:
+            futures.append(pool.submit(timed_get, time.perf_counter()))
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - started
+    pool.shutdown()
+
+    accepted = login_results.count(200)
+    return {
+        "get_p50_ms": statistics.median(get_latencies) * 1000,
+        "get_p99_ms": percentile(get_latencies, 0.99) * 1000,
+        "login_ok": accepted,
+        "login_rejected": len(login_results) - accepted,
+        "login_per_sec": accepted / elapsed,
+    }
+
+
+def main():
+    print(
+        f"{'mode':>8} | {'GET p50 (ms)':>12} | {'GET p99 (ms)':>12} | "
+        f"{'login ok':>8} | {'503':>5} | login/s"
+    )
+    for name, login in (("inline", inline_login), ("bounded", bounded_login)):
+        result = run(login)
+        print(
+            f"{name:>8} | {result['get_p50_ms']:>12.1f} | "
+            f"{result['get_p99_ms']:>12.1f} | {result['login_ok']:>8} | "
+            f"{result['login_rejected']:>5} | {result['login_per_sec']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
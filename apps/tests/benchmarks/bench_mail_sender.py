@@ -0,0 +1,81 @@
+"""
+인증 메일 발송 micro-benchmark (로컬 SMTP 서버 사용)
+
+    cd apps && python -m tests.benchmarks.bench_mail_sender
+
+- per-request: 이전 구현, 요청마다 SMTP 연결 + 로그인 후 발송 (요청이 발송 완료까지 대기)
+- pooled     : 현재 구현, core.mail.MailSender 큐에 넣고 바로 반환
+
+CONNECT_DELAY로 연결마다 드는 STARTTLS + 로그인 비용을 흉내 낸다.
+"""
+import smtplib
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from core.mail import MailSender
+from tests.fixtures.smtp_server import LocalSMTPServer
+
+MESSAGE_COUNT = 200
+CONNECT_DELAY = 0.05
+USER = "biskit@example.com"
+HTML = "<p>인증번호 123456</p>"
+
+
+def send_per_request(port: int):
+    msg = MIMEMultipart()
+    msg["From"] = USER
+    msg["To"] = "user@example.com"
+    msg["Subject"] = "BISKIT 이메일 인증"
+    msg.attach(MIMEText(HTML, "html"))
+    with smtplib.SMTP("127.0.0.1", port) as server:
+        server.login(USER, "password")
+        server.sendmail(USER, "user@example.com", msg.as_string())
+
+
+def bench_per_request():
+    server = LocalSMTPServer(connect_delay=CONNECT_DELAY).start()
+    started = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        send_per_request(server.port)
+    elapsed = time.perf_counter() - started
+    server.stop()
+    return elapsed / MESSAGE_COUNT, elapsed, server.connection_count
+
+
+def bench_pooled():
+    server = LocalSMTPServer(connect_delay=CONNECT_DELAY).start()
+    sender = MailSender(
+        host="127.0.0.1",
+        port=server.port,
+        user=USER,
+        password="password",
+        use_tls=False,
+        workers=2,
+    )
+    started = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        sender.enqueue("user@example.com", "BISKIT 이메일 인증", HTML)
+    enqueued = time.perf_counter() - started
+    sender.flush()
+    elapsed = time.perf_counter() - started
+    sender.stop()
+    server.stop()
+    return enqueued / MESSAGE_COUNT, elapsed, server.connection_count
+
+
+def main():
+    print(
+        f"{'mode':>12} | {'request wait (ms)':>17} | "
+        f"{'total (s)':>9} | {'msg/s':>7} | connections"
+    )
+    for name, bench in (("per-request", bench_per_request), ("pooled", bench_pooled)):
+        wait, elapsed, connections = bench()
+        print(
+            f"{name:>12} | {wait * 1000:>17.3f} | {elapsed:>9.2f} | "
+            f"{MESSAGE_COUNT / elapsed:>7.0f} | {connections}"
+        )
+
+
+if __name__ == "__main__":
+    main()
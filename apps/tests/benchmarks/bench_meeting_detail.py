@@ -0,0 +1,108 @@
+"""
+MeetingDetailResponse 직렬화 micro-benchmark
+
+    cd apps && python -m tests.benchmarks.bench_meeting_detail
+
+참가자 수별로 이전 users_languages 구현(리스트 membership 검사)과
+현재 구현(set 기반 1회 순회 + computed field 캐시)의 직렬화 시간을 비교
+"""
+import timeit
+from datetime import date, datetime
+from typing import List
+
+from pydantic import computed_field
+
+from schemas.meeting import MeetingDetailResponse
+from schemas.utility import LanguageBase
+
+LANGUAGE_COUNT = 30
+MEETING_LANGUAGE_COUNT = 10
+
+
+class LegacyMeetingDetailResponse(MeetingDetailResponse):
+    """
+    변경 전 구현: language in self.languages 마다 languages 리스트를 새로 생성
+    """
+
+    @computed_field
+    @property
+    def users_languages(self) -> List[LanguageBase]:
+        user_languages = []
+        available_languages = [
+            meeting_user.user.profile.available_language_list
+            for meeting_user in self.meeting_users
+        ]
+        for languages in available_languages:
+            for language in languages:
+                if language not in user_languages and language in [
+                    meeting_language.language
+                    for meeting_language in self.meeting_languages
+                ]:
+                    user_languages.append(language)
+        return user_languages
+
+
+def make_user(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "email": f"user{user_id}@example.com",
+        "name": f"user{user_id}",
+        "birth": date(2000, 1, 1),
+        "gender": "male",
+        "profile": {
+            "id": user_id,
+            "user_id": user_id,
+            "nick_name": f"nick{user_id}",
+            "available_language_list": [
+                {
+                    "id": user_id * 10 + offset,
+                    "level": "BASIC",
+                    "language": {"id": (user_id + offset) % LANGUAGE_COUNT + 1},
+                }
+                for offset in range(3)
+            ],
+        },
+    }
+
+
+def make_meeting(participants: int) -> dict:
+    return {
+        "id": 1,
+        "name": "benchmark",
+        "location": None,
+        "meeting_time": datetime.now(),
+        "max_participants": participants + 1,
+        "university_id": None,
+        "creator": make_user(0),
+        "meeting_tags": [],
+        "meeting_topics": [],
+        "meeting_languages": [
+            {"language": {"id": language_id}}
+            for language_id in range(1, MEETING_LANGUAGE_COUNT + 1)
+        ],
+        "meeting_users": [
+            {
+                "user": make_user(user_id),
+                "meeting_id": 1,
+                "status": "APPROVE",
+                "created_time": datetime.now(),
+            }
+            for user_id in range(1, participants + 1)
+        ],
+    }
+
+
+def bench(schema, payload: dict, number: int) -> float:
+    def run():
+        schema.model_validate(payload).model_dump()
+
+    return min(timeit.repeat(run, number=number, repeat=3)) / number * 1000
+
+
+if __name__ == "__main__":
+    print(f"{'participants':>12} {'legacy (ms)':>12} {'current (ms)':>13}")
+    for participants in (50, 100, 200):
+        payload = make_meeting(participants)
+        legacy = bench(LegacyMeetingDetailResponse, payload, number=20)
+        current = bench(MeetingDetailResponse, payload, number=20)
+        print(f"{participants:>12} {legacy:>12.3f} {current:>13.3f}")
@@ -0,0 +1,102 @@
+"""
+요청 제한(token bucket) 추가 비용 micro-benchmark
+
+    cd apps && python -m tests.benchmarks.bench_rate_limit
+
+RateLimitMiddleware가 요청마다 호출하는 throttle_request의 평균/p99 시간 측정
+
+- skip      : 제한이 설정되지 않은 경로 (dict 조회만)
+- ip        : IP 기준 제한 경로 (/v1/login)
+- user      : 토큰 유저 기준 제한 경로 (/v1/chat/alarm, JWT 서명 검증 포함)
+
+Redis에 연결되지 않으면 프로세스 내 버킷으로 측정한다.
+"""
+import statistics
+import time
+
+from jose import jwt
+from starlette.requests import Request
+
+from core.config import settings
+from core.rate_limit import rate_limiter, throttle_request
+from core.redis_driver import redis_driver
+
+REQUESTS = 20000
+FLOOD_REQUESTS = 1000
+
+TOKEN = jwt.encode(
+    {"sub": "bench@example.com", "uid": 1, "ver": 0},
+    settings.SECRET_KEY,
+    algorithm=settings.ALGORITHM,
+)
+
+
+def make_request(method: str, path: str, ip: str, token: str = None) -> Request:
+    headers = [(b"x-real-ip", ip.encode())]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "headers": headers,
+            "query_string": b"",
+            "client": (ip, 12345),
+        }
+    )
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def measure(method: str, path: str, token: str = None):
+    latencies = []
+    for i in range(REQUESTS):
+        # 매번 다른 IP로 보내서 버킷이 비지 않게 함 (허용 경로 비용 측정)
+        request = make_request(method, path, f"10.0.{i // 256 % 256}.{i % 256}", token)
+        started = time.perf_counter()
+        throttle_request(request)
+        latencies.append(time.perf_counter() - started)
+    return statistics.mean(latencies) * 1e6, percentile(latencies, 0.99) * 1e6
+
+
+def flood():
+    """
+    한 IP에서 로그인을 연속으로 보냈을 때 허용/거절 수
+    """
+    rate_limiter.clear()
+    request = make_request("POST", "/v1/login", "10.9.9.9")
+    rejected = sum(1 for _ in range(FLOOD_REQUESTS) if throttle_request(request))
+    return FLOOD_REQUESTS - rejected, rejected
+
+
+def main():
+    backend = "redis" if redis_driver.redis_client is not None else "local"
+    try:
+        redis_driver.redis_client.ping()
+    except Exception:
+        backend = "local"
+    print(f"backend: {backend}")
+
+    rate_limiter.clear()
+    print(f"{'mode':>6} | {'mean (us)':>9} | {'p99 (us)':>9}")
+    for name, method, path, token in (
+        ("skip", "GET", "/v1/meetings", None),
+        ("ip", "POST", "/v1/login", None),
+        ("user", "POST", "/v1/chat/alarm", TOKEN),
+    ):
+        mean, p99 = measure(method, path, token)
+        print(f"{name:>6} | {mean:>9.1f} | {p99:>9.1f}")
+
+    allowed, rejected = flood()
+    print(
+        f"flood {FLOOD_REQUESTS} logins from one IP: {allowed} allowed, {rejected} 429"
+    )
+    rate_limiter.clear()
+
+
+if __name__ == "__main__":
+    main()
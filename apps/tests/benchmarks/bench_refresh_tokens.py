@@ -0,0 +1,85 @@
+"""
+refresh 토큰 rotation 처리량 micro-benchmark (Redis 필요)
+
+    cd apps && python -m tests.benchmarks.bench_refresh_tokens
+
+- decode only : 이전 구현, 서명/만료 검증 후 access 토큰 재발급
+- rotation    : 현재 구현, 검증 + Lua CAS rotation + 새 refresh 토큰 발급
+family 수에 따른 Redis 메모리 사용량도 함께 출력
+"""
+import time
+
+from jose import jwt
+
+from core import token_store
+from core.config import settings
+from core.redis_driver import redis_driver
+from core.security import create_access_token, create_refresh_token
+
+USER_ID = 987654321
+ITERATIONS = 5000
+FAMILY_COUNT = 10000
+
+
+def token_data():
+    return {
+        "sub": "bench@example.com",
+        "auth_method": "email",
+        "uid": USER_ID,
+        "ver": 0,
+    }
+
+
+def decode(token):
+    return jwt.decode(
+        token, settings.REFRESH_SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+
+def bench_decode_only():
+    refresh_token = create_refresh_token(data={"sub": "bench@example.com"})
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        decode(refresh_token)
+        create_access_token(data=token_data())
+    return ITERATIONS / (time.perf_counter() - started)
+
+
+def bench_rotation():
+    refresh_token = create_refresh_token(data=token_data())
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        payload = decode(refresh_token)
+        jti = token_store.rotate(USER_ID, payload["fam"], payload["jti"])
+        create_access_token(data=token_data())
+        refresh_token = create_refresh_token(
+            data={**token_data(), "fam": payload["fam"], "jti": jti}
+        )
+    return ITERATIONS / (time.perf_counter() - started)
+
+
+def family_memory():
+    client = redis_driver.redis_client
+    before = client.info("memory")["used_memory"]
+    for _ in range(FAMILY_COUNT):
+        token_store.issue(USER_ID)
+    after = client.info("memory")["used_memory"]
+    return (after - before) / FAMILY_COUNT
+
+
+def main():
+    redis_driver.connect()
+    try:
+        redis_driver.redis_client.ping()
+    except Exception as e:
+        print(f"Redis is not available ({e})")
+        return
+
+    print(f"decode only : {bench_decode_only():>8.0f} refresh/s")
+    print(f"rotation    : {bench_rotation():>8.0f} refresh/s")
+    print(f"memory      : {family_memory():>8.0f} bytes/family")
+    token_store.revoke_user(USER_ID)
+
+
+if __name__ == "__main__":
+    main()
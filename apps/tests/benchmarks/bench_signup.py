@@ -0,0 +1,136 @@
+"""
+회원가입 micro-benchmark (in-memory sqlite)
+
+    cd apps && python -m tests.benchmarks.bench_signup
+
+- legacy : 이전 구현, 국적 id마다 조회 + 유저/국적/약관/학교/시스템 설정마다 commit
+- current: 현재 구현, 테이블당 한 번의 검증 쿼리 + 하나의 트랜잭션(한 번의 flush)
+
+sqlite는 네트워크 왕복이 없으므로 실제 DB에서의 차이는 statement 수에 더 가깝다.
+(Postgres에서는 국적 INSERT가 insertmanyvalues로 하나로 묶여 statement 수가 더 줄어든다)
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from crud.user import user_nationality, get_password_hash
+from database.query_counter import track_queries
+from models.base import ModelBase
+from models.utility import Nationality, University
+from schemas import user as user_schmea
+
+SIGNUP_COUNT = 50
+NATIONALITY_COUNT = 3
+
+
+def legacy_check_exists(db, obj_in):
+    if obj_in.email:
+        crud.user.get_by_email(db=db, email=obj_in.email)
+    crud.user.get_by_birth(db=db, name=obj_in.name, birth=obj_in.birth)
+    crud.utility.get(db=db, university_id=obj_in.university_id)
+    for id in obj_in.nationality_ids:
+        crud.utility.get(db=db, nationality_id=id)
+
+
+def legacy_register_user(db, obj_in):
+    user_in = user_schmea.UserCreate(
+        email=obj_in.email,
+        password=get_password_hash(obj_in.password),
+        name=obj_in.name,
+        birth=obj_in.birth,
+        gender=obj_in.gender,
+    )
+    new_user = crud.user.create(db=db, obj_in=user_in)
+    user_nationality.create_many(
+        db=db,
+        objs_in=[
+            user_schmea.UserNationalityCreate(nationality_id=id, user_id=new_user.id)
+            for id in obj_in.nationality_ids
+        ],
+        commit=False,
+    )
+    crud.user.refresh_is_korean(db=db, user_id=new_user.id)
+    db.commit()
+    crud.user.create_consent(
+        db=db,
+        obj_in=user_schmea.ConsentCreate(
+            terms_mandatory=obj_in.terms_mandatory,
+            terms_optional=obj_in.terms_optional,
+            terms_push=obj_in.terms_push,
+            user_id=new_user.id,
+        ),
+    )
+    crud.user.create_university(
+        db=db,
+        obj_in=user_schmea.UserUniversityCreate(
+            department=obj_in.department,
+            education_status=obj_in.education_status,
+            university_id=obj_in.university_id,
+            user_id=new_user.id,
+        ),
+    )
+    crud.system.create_with_default_value(db=db, user_id=new_user.id)
+    return new_user
+
+
+def current_signup(db, obj_in):
+    crud.signup.check_exists(db=db, obj_in=obj_in)
+    return crud.signup.register_user(db=db, obj_in=obj_in)
+
+
+def legacy_signup(db, obj_in):
+    legacy_check_exists(db, obj_in)
+    return legacy_register_user(db, obj_in)
+
+
+def make_register(prefix: str, i: int, nationality_ids):
+    return user_schmea.UserRegister(
+        email=f"{prefix}{i}@example.com",
+        password="password",
+        name=f"{prefix}{i}",
+        birth="2000-01-01",
+        gender="male",
+        nationality_ids=nationality_ids,
+        university_id=1,
+        department="학부",
+        education_status="재학",
+        terms_mandatory=True,
+        terms_optional=False,
+        terms_push=True,
+    )
+
+
+def run(signup, prefix: str):
+    engine = create_engine("sqlite://")
+    ModelBase.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all(
+        [Nationality(code=f"n{i}", kr_name=f"n{i}") for i in range(NATIONALITY_COUNT)]
+        + [University(kr_name="university")]
+    )
+    db.commit()
+    nationality_ids = list(range(1, NATIONALITY_COUNT + 1))
+
+    latencies, statements = [], []
+    for i in range(SIGNUP_COUNT):
+        obj_in = make_register(prefix, i, nationality_ids)
+        with track_queries() as stats:
+            started = time.perf_counter()
+            signup(db, obj_in)
+            latencies.append(time.perf_counter() - started)
+        statements.append(stats.count)
+    db.close()
+    return sum(latencies) / len(latencies), sum(statements) / len(statements)
+
+
+def main():
+    print(f"{'mode':>8} | {'latency (ms)':>12} | statements")
+    for name, signup in (("legacy", legacy_signup), ("current", current_signup)):
+        latency, statements = run(signup, name)
+        print(f"{name:>8} | {latency * 1000:>12.2f} | {statements:.1f}")
+
+
+if __name__ == "__main__":
+    main()
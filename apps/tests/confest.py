@@ -6,3 +6,4 @@ from .fixtures.utils import *
 from .fixtures.meeting_fixture import *
 from .fixtures.system_fixture import *
 from .fixtures.alarm_fixture import *
+from .fixtures.smtp_server import smtp_server
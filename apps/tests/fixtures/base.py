@@ -8,7 +8,11 @@ from sqlalchemy_utils import database_exists, create_database
 
 from main import app
 from core.config import settings
-from database.session import Base, get_db
+from core.principal import clear_principal_cache
+from core.profile_card import clear_profile_card_cache
+from core.rate_limit import rate_limiter
+from core.user_meetings_cache import clear_user_meetings_cache
+from database.session import Base, get_db, get_read_db
 from models.base import ModelBase
 
 
@@ -26,10 +30,19 @@ if not database_exists(engine.url):
 ModelBase.metadata.create_all(bind=engine)
 
 
+# fixture가 DB에 직접 넣은 닉네임은 Redis set에 없으므로 DB index로만 확인
+settings.NICK_NAME_INDEX_ENABLED = False
+
+
 @pytest.fixture(scope="function")
 def session():
     ModelBase.metadata.drop_all(bind=engine)
     ModelBase.metadata.create_all(bind=engine)
+    # 테이블을 새로 만들기 때문에 이전 테스트의 인증 캐시도 비움
+    clear_principal_cache()
+    clear_profile_card_cache()
+    rate_limiter.clear()
+    clear_user_meetings_cache()
 
     db = TestingSessionLocal()
     try:
@@ -48,6 +61,7 @@ def client(session):
 
     # app에서 사용하는 DB를 오버라이드하는 부분
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     def get_test_token():
         with TestClient(app) as client:
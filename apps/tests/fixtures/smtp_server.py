@@ -0,0 +1,95 @@
+"""
+테스트 / 벤치마크용 로컬 SMTP 서버
+
+실제 메일을 보내지 않고 받은 메일을 messages 리스트에 저장한다.
+STARTTLS는 지원하지 않으므로 MailSender(use_tls=False)로 연결한다.
+connect_delay로 연결마다 TLS handshake + 로그인 비용을 흉내 낼 수 있다.
+"""
+import socketserver
+import threading
+import time
+from typing import List, Tuple
+
+import pytest
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connection_count += 1
+        time.sleep(server.connect_delay)
+        self.reply("220 localhost ESMTP test server")
+
+        mail_from, rcpt_to = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb in ("EHLO", "HELO"):
+                self.wfile.write(b"250-localhost\r\n250 AUTH PLAIN LOGIN\r\n")
+            elif verb == "AUTH":
+                self.reply("235 Authentication successful")
+            elif verb == "MAIL":
+                mail_from, rcpt_to = command[10:].strip("<>"), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                rcpt_to.append(command[8:].strip("<>"))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b".\r\n", b".\n", b""):
+                        break
+                    data.append(data_line)
+                with server.lock:
+                    server.messages.append((mail_from, rcpt_to, b"".join(data)))
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            elif verb in ("NOOP", "RSET"):
+                self.reply("250 OK")
+            else:
+                self.reply("502 Command not implemented")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, connect_delay=0.0):
+        super().__init__((host, port), _SMTPHandler)
+        self.connect_delay = connect_delay
+        self.connection_count = 0
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture(scope="function")
+def smtp_server():
+    server = LocalSMTPServer().start()
+    yield server
+    server.stop()
@@ -106,7 +106,7 @@ def create_associations_for_user(
     profile = profile_models.Profile(
         user_id=user.id,
         profile_photo="test",
-        nick_name="test_nick",
+        nick_name=f"test_nick_{user.id}",
         context="introduction",
         is_default_photo=False,
     )
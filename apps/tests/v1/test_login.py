@@ -9,6 +9,15 @@ from tests.confest import (
     test_token,
 )
 
+from jose import jwt
+from starlette.requests import Request
+from passlib.context import CryptContext
+
+import crud
+from core import hashing, token_store
+from core.redis_driver import redis_driver
+from core.rate_limit import client_ip, rate_limit_rules
+from core.security import create_tokens_for_user
 from schemas import user as user_schmea
 from models import user as user_models
 from models import profile as profile_models
@@ -120,3 +129,169 @@ class TestLogin:
         )
 
         assert response.status_code == 200, response.content
+
+    def test_token_version_revocation(self, client, session, test_user):
+        tokens = create_tokens_for_user(test_user)
+        headers = {"Authorization": f"Bearer {tokens['token']}"}
+
+        response = client.get("/v1/users/me", headers=headers)
+        assert response.status_code == 200, response.content
+
+        # 비밀번호 변경 시 token_version 증가 -> 이전 토큰 거부
+        crud.user.update(
+            db=session, db_obj=test_user, obj_in={"password": "new_password@@"}
+        )
+        response = client.get("/v1/users/me", headers=headers)
+        assert response.status_code == 401, response.content
+
+        new_tokens = create_tokens_for_user(test_user)
+        response = client.get(
+            "/v1/users/me", headers={"Authorization": f"Bearer {new_tokens['token']}"}
+        )
+        assert response.status_code == 200, response.content
+
+    def test_certificate_token_revoked_after_password_change(
+        self, client, session, test_user
+    ):
+        cert_in = user_schmea.EmailCertificationCheck(
+            email=test_user.email, certification="123456"
+        )
+        crud.user.create_email_certification(db=session, obj_in=cert_in)
+        response = client.post(
+            "/v1/change-password/certificate/check",
+            json=json.loads(cert_in.model_dump_json()),
+        )
+        assert response.json()["result"] == "success", response.content
+        headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+        response = client.post(
+            "/v1/change-password",
+            json={"new_password": "new_password@@"},
+            headers=headers,
+        )
+        assert response.status_code == 200, response.content
+
+        # 비밀번호 변경 전에 발급된 토큰은 다시 쓸 수 없음
+        response = client.post(
+            "/v1/change-password",
+            json={"new_password": "other_password@@"},
+            headers=headers,
+        )
+        assert response.status_code == 401, response.content
+        response = client.get("/v1/token/validate", headers=headers)
+        assert response.status_code == 401, response.content
+
+    def test_login_rehash_on_cost_change(self, client, session, test_user):
+        # 이전 cost factor(rounds=4)로 저장된 해시
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("guswns95@@")
+        crud.user.update_where(
+            session, user_models.User.id == test_user.id, values={"password": old_hash}
+        )
+
+        login_schema = user_schmea.UserLogin(
+            email=test_user.email, password="guswns95@@"
+        )
+        response = client.post(
+            "/v1/login", json=json.loads(login_schema.model_dump_json())
+        )
+        assert response.status_code == 200, response.content
+
+        session.refresh(test_user)
+        assert test_user.password != old_hash
+        assert not hashing.pwd_context.needs_update(test_user.password)
+
+    def test_refresh_token_rotation(self, client, session, test_user):
+        tokens = create_tokens_for_user(test_user)
+        old_refresh = tokens["refresh_token"]
+
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {old_refresh}"}
+        )
+        assert response.status_code == 200, response.content
+        new_refresh = response.json()["refresh_token"]
+        assert new_refresh != old_refresh
+
+        # 이미 사용된 refresh 토큰 재사용 -> family 전체 폐기
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {old_refresh}"}
+        )
+        assert response.status_code == 401, response.content
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {new_refresh}"}
+        )
+        assert response.status_code == 401, response.content
+
+    def test_refresh_token_unstored_family(self, client, session, test_user):
+        tokens = create_tokens_for_user(test_user)
+        refresh = tokens["refresh_token"]
+        payload = jwt.get_unverified_claims(refresh)
+        # Redis 장애로 family가 저장되지 못한 상황
+        redis_driver.redis_client.delete(token_store._family_key(payload["fam"]))
+
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {refresh}"}
+        )
+        assert response.status_code == 200, response.content
+        new_refresh = response.json()["refresh_token"]
+
+        # 다시 등록된 family도 재사용 감지 / 로그아웃 폐기는 그대로
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {refresh}"}
+        )
+        assert response.status_code == 401, response.content
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {refresh}"}
+        )
+        assert response.status_code == 401, response.content
+        response = client.post(
+            "/v1/token/refresh", headers={"Authorization": f"Bearer {new_refresh}"}
+        )
+        assert response.status_code == 401, response.content
+
+    def test_client_ip_trusted_proxy(self):
+        def request(host):
+            headers = [(b"x-real-ip", b"198.51.100.7")]
+            return Request({"type": "http", "headers": headers, "client": (host, 1)})
+
+        # nginx(docker 네트워크)를 거친 요청만 X-Real-IP 사용
+        assert client_ip(request("172.18.0.5")) == "198.51.100.7"
+        assert client_ip(request("203.0.113.9")) == "203.0.113.9"
+
+    def test_login_rate_limit(self, client, test_user):
+        sns_login_schema = user_schmea.UserLogin(
+            sns_id=test_user.sns_id, sns_type=test_user.sns_type
+        )
+        json_data = json.loads(sns_login_schema.model_dump_json())
+        burst = rate_limit_rules[("POST", "/v1/login")].burst
+
+        for _ in range(burst):
+            response = client.post("/v1/login", json=json_data)
+            assert response.status_code == 200, response.content
+
+        # 버킷이 비면 DB를 조회하지 않고 429 + Retry-After
+        response = client.post("/v1/login", json=json_data)
+        assert response.status_code == 429, response.content
+        assert int(response.headers["Retry-After"]) >= 1
+
+    def test_register_user_unknown_nationality(
+        self, client, session, test_university, test_nationality
+    ):
+        nationality1, _ = test_nationality
+        schema_obj = user_schmea.UserRegister(
+            email="unknown_nationality@example.com",
+            password="string",
+            name="unknown_nationality",
+            birth="2001-01-01",
+            gender="male",
+            nationality_ids=[nationality1.id, 999999],
+            university_id=test_university.id,
+            terms_mandatory=True,
+        )
+
+        response = client.post(
+            "/v1/register", json=json.loads(schema_obj.model_dump_json())
+        )
+        assert response.status_code == 400, response.content
+
+        # 검증 실패 시 유저가 생성되지 않음
+        assert crud.user.get_by_email(session, email=schema_obj.email) is None
@@ -1,8 +1,17 @@
 import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
 from tests.confest import *
+from tests.fixtures.base import DATABASE_URL
+from models.meeting import Meeting, MeetingUser
+from models.user import User, UserNationality
 from schemas import meeting as meeting_schmea
 from schemas.enum import ReultStatusEnum
 
@@ -89,6 +98,23 @@ def test_join_meeting_request(
 
     assert response.status_code == 200, response.content
 
+    # 자리가 없으면 참가 요청도 거절 (승인과 같은 current < max 조건)
+    test_meeting.current_participants = test_meeting.max_participants
+    session.commit()
+    other_user = create_test_user(
+        session=session,
+        test_nationality=test_nationality,
+        test_university=test_university,
+        test_language=test_language,
+        is_sns=True,
+    )
+    response = client.post(
+        "v1/meeting/join/request",
+        json={"meeting_id": test_meeting.id, "user_id": other_user["id"]},
+    )
+
+    assert response.status_code == 400, response.content
+
 
 def test_join_meeting_approve(
     session, client, test_meeting, test_nationality, test_university, test_language
@@ -113,6 +139,73 @@ def test_join_meeting_approve(
     assert data["status"] == ReultStatusEnum.APPROVE
 
 
+def test_join_meeting_approve_concurrency(session, test_meeting, test_nationality):
+    """
+    동시에 많은 승인 요청이 들어와도 max_participants를 넘지 않는지 확인
+    """
+    nationality1, _ = test_nationality
+    request_count = 40
+    worker_count = 10
+    meeting_id = test_meeting.id
+    seats = test_meeting.max_participants - test_meeting.current_participants
+
+    users = [
+        User(email=f"stress{i}@gmail.com", name=f"stress{i}")
+        for i in range(request_count)
+    ]
+    session.add_all(users)
+    session.flush()
+    join_requests = []
+    for index, user in enumerate(users):
+        if index % 2 == 0:
+            session.add(UserNationality(user_id=user.id, nationality_id=nationality1.id))
+        join_requests.append(
+            MeetingUser(
+                user_id=user.id,
+                meeting_id=meeting_id,
+                status=ReultStatusEnum.PENDING.value,
+            )
+        )
+    session.add_all(join_requests)
+    session.commit()
+    request_ids = [join_request.id for join_request in join_requests]
+
+    # 스레드마다 별도 커넥션을 쓰도록 StaticPool이 아닌 engine 사용
+    stress_engine = create_engine(
+        DATABASE_URL, pool_size=worker_count, max_overflow=0
+    )
+    StressSession = sessionmaker(autocommit=False, autoflush=False, bind=stress_engine)
+
+    def approve(obj_id: int) -> bool:
+        db = StressSession()
+        try:
+            crud.meeting.join_request_approve(db=db, obj_id=obj_id)
+            return True
+        except HTTPException:
+            return False
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        results = list(executor.map(approve, request_ids))
+    stress_engine.dispose()
+
+    session.expire_all()
+    meeting = session.get(Meeting, meeting_id)
+    approved_count = (
+        session.query(MeetingUser)
+        .filter(
+            MeetingUser.meeting_id == meeting_id,
+            MeetingUser.status == ReultStatusEnum.APPROVE.value,
+        )
+        .count()
+    )
+
+    assert results.count(True) == seats
+    assert approved_count == seats
+    assert meeting.current_participants == meeting.max_participants
+
+
 def test_exit_meeting(
     session, client, test_meeting, test_language, test_nationality, test_university
 ):
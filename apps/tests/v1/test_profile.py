@@ -18,6 +18,10 @@ from tests.confest import (
     create_test_user,
 )
 
+import crud
+from core.config import settings
+from core.nick_name_index import add_nick_names, nick_name_in_set, rebuild_nick_names
+from core.nick_name_pool import generate_nick_names, pool_sizes, push_nick_names
 from schemas.enum import ReultStatusEnum, LanguageLevelEnum
 from schemas import profile as profile_schmea
 from models import profile as profile_models
@@ -47,6 +51,22 @@ def test_get_profile_photos(
     assert "nationalities" in data[0]
 
 
+def test_get_profile_photos_cache_invalidation(client, test_user, test_profile):
+    # 존재하지 않는 유저는 제외
+    params = {"user_ids": [test_user.id, 999999]}
+    response = client.get("v1/profile/photos", params=params)
+    assert response.status_code == 200, response.content
+    assert [card["user_id"] for card in response.json()] == [test_user.id]
+    assert response.json()[0]["profile_photo"] == "test"
+
+    # 사진 삭제 후에는 캐시된 card가 아니라 변경된 값 반환
+    response = client.delete(f"v1/profile/{test_user.id}/photo")
+    assert response.status_code == 200, response.content
+
+    response = client.get("v1/profile/photos", params=params)
+    assert response.json()[0]["profile_photo"] is None
+
+
 def test_check_nick_name(client, test_profile):
     nick_name = test_profile.nick_name
 
@@ -55,6 +75,60 @@ def test_check_nick_name(client, test_profile):
     assert response.status_code != 200
 
 
+def test_check_nick_name_index(client, session, test_profile, monkeypatch):
+    url = "v1/profile/nick-name"
+    old_nick_name = test_profile.nick_name
+
+    # 대소문자만 다른 닉네임도 사용 중
+    response = client.get(url, params={"nick_name": old_nick_name.upper()})
+    assert response.status_code == 409, response.content
+
+    monkeypatch.setattr(settings, "NICK_NAME_INDEX_ENABLED", True)
+    crud.profile.rebuild_nick_name_index(session)
+
+    response = client.get(url, params={"nick_name": "unused_nick"})
+    assert response.status_code == 200, response.content
+    response = client.get(url, params={"nick_name": old_nick_name})
+    assert response.status_code == 409, response.content
+
+    # 닉네임 변경 후 이전 닉네임은 다시 사용 가능
+    response = client.put(
+        f"/v1/profile/{test_profile.id}", json={"nick_name": "renamed_nick"}
+    )
+    assert response.status_code == 200, response.content
+    response = client.get(url, params={"nick_name": old_nick_name})
+    assert response.status_code == 200, response.content
+    response = client.get(url, params={"nick_name": "RENAMED_NICK"})
+    assert response.status_code == 409, response.content
+
+    # 다시 만드는 도중(DB 조회 이후) 추가된 닉네임도 교체 후 유지
+    def load_nick_names():
+        add_nick_names("joined_during_rebuild")
+        return ["renamed_nick"]
+
+    rebuild_nick_names(load_nick_names)
+    assert nick_name_in_set("joined_during_rebuild") is True
+    assert nick_name_in_set("renamed_nick") is True
+
+
+def test_random_nick_name(client, session):
+    crud.profile.refill_nick_name_pool(session)
+    # 다른 워커가 동시에 채워도 상한을 넘지 않음
+    sizes = pool_sizes()
+    assert all(size <= settings.NICK_NAME_POOL_SIZE for size in sizes.values())
+    assert push_nick_names("en", generate_nick_names("en", 10), sizes["en"]) == 0
+
+    response = client.get("v1/profile/random-nickname")
+    assert response.status_code == 200, response.content
+
+    data = response.json()
+    for nick_name in (data["kr_nick_name"], data["en_nick_name"]):
+        assert nick_name
+        # 닉네임 확인 API를 그대로 통과하는 값
+        response = client.get("v1/profile/nick-name", params={"nick_name": nick_name})
+        assert response.status_code == 200, response.content
+
+
 def test_student_varification(client, test_profile):
     user_id = test_profile.user_id
     student_card = "test_student_card"
@@ -85,6 +159,46 @@ def test_read_student_varification(client, test_profile):
     assert data.get("verification_status") == test_student_card.verification_status
 
 
+def test_read_student_cards_queue(
+    session, client, test_profile, test_nationality, test_university, test_language
+):
+    for _ in range(2):
+        create_test_user(session, test_nationality, test_university, test_language)
+    client.post(
+        "v1/student-card",
+        params={"user_id": test_profile.user_id, "student_card": "new_card"},
+    )
+
+    response = client.get("v1/student-cards", params={"status": "PENDING"})
+    pending = response.json()
+    assert response.headers["X-Total-Count"] == "1"
+    assert "X-Next-Cursor" not in response.headers
+    assert pending[0]["profile_id"] == test_profile.id
+    assert pending[0]["student_card"] == "new_card"
+
+    # limit이 없으면 이전과 같이 전체 목록
+    assert len(client.get("v1/student-cards").json()) == 3
+
+    url = "v1/student-cards"
+    response = client.get(url, params={"status": "APPROVE", "limit": 1})
+    first = response.json()
+    assert response.headers["X-Total-Count"] == "2"
+    ids = [card["id"] for card in first]
+    cursor = response.headers.get("X-Next-Cursor")
+    while cursor:
+        response = client.get(
+            url, params={"status": "APPROVE", "limit": 1, "cursor": cursor}
+        )
+        assert response.headers["X-Total-Count"] == "2"
+        ids += [card["id"] for card in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+    assert len(set(ids)) == 2
+    assert all(card["university"] for card in first)
+
+    response = client.get(url, params={"cursor": "invalid"})
+    assert response.status_code == 400, response.content
+
+
 def test_delete_profile_photo(client, test_profile):
     user_id = test_profile.user_id
 
@@ -154,6 +268,51 @@ def test_update_profile(client, test_profile):
     assert data["user_university"]["education_status"] == "졸업"
 
 
+def test_update_profile_nick_name_conflict(
+    client, session, test_profile, test_nationality, test_university, test_language
+):
+    other_user = create_test_user(
+        session, test_nationality, test_university, test_language
+    )
+    other_nick_name = f"test_nick_{other_user['id']}"
+
+    # 자기 닉네임 그대로 저장은 허용
+    response = client.put(
+        f"/v1/profile/{test_profile.id}",
+        json={"nick_name": test_profile.nick_name},
+    )
+    assert response.status_code == 200, response.content
+
+    # 다른 유저의 닉네임은 unique index 위반으로 409
+    response = client.put(
+        f"/v1/profile/{test_profile.id}", json={"nick_name": other_nick_name}
+    )
+    assert response.status_code == 409, response.content
+
+
+
+def test_is_nick_name_conflict(session, test_profile, test_user):
+    from sqlalchemy.exc import IntegrityError
+    from crud.profile import is_nick_name_conflict
+
+    # 대소문자만 다른 닉네임은 ix_profile_nick_name_lower 위반
+    session.add(
+        profile_models.Profile(
+            nick_name=test_profile.nick_name.upper(), user_id=test_user.id
+        )
+    )
+    with pytest.raises(IntegrityError) as exc_info:
+        session.commit()
+    session.rollback()
+    assert is_nick_name_conflict(exc_info.value)
+
+    # 다른 제약조건(FK) 위반은 닉네임 중복이 아님
+    session.add(profile_models.Profile(nick_name="fk_violation", user_id=-1))
+    with pytest.raises(IntegrityError) as exc_info:
+        session.commit()
+    session.rollback()
+    assert not is_nick_name_conflict(exc_info.value)
+
 def test_get_user_meetings_with_order_by(
     session, client, test_user, test_topic, test_tag, test_language, test_university
 ):
@@ -283,3 +442,60 @@ def test_get_user_meetings_with_status(
     approve_data = approve_response.json()
 
     assert approve_data["meetings"][0]["id"] == approve_test_meeting["id"]
+
+
+def test_get_user_meetings_cursor(
+    session,
+    client,
+    test_user,
+    test_topic,
+    test_tag,
+    test_language,
+    test_nationality,
+    test_university,
+):
+    now = datetime.now()
+    meetings = [
+        create_test_meeting(
+            session=session,
+            user_id=test_user.id,
+            test_topic=test_topic,
+            test_tag=test_tag,
+            test_language=test_language,
+            meeting_time=now + timedelta(days=day),
+            university_id=test_university.id,
+        )
+        for day in range(5)
+    ]
+    url = f"v1/profile/{test_user.id}/meetings"
+
+    first = client.get(url, params={"limit": 2}).json()
+    assert first["total_count"] == 5
+    assert first["next_cursor"]
+
+    ids = [meeting["id"] for meeting in first["meetings"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get(url, params={"limit": 2, "cursor": cursor}).json()
+        assert page["total_count"] == 5
+        ids += [meeting["id"] for meeting in page["meetings"]]
+        cursor = page["next_cursor"]
+    assert ids == [meeting["id"] for meeting in meetings]
+
+    response = client.get(url, params={"cursor": "invalid"})
+    assert response.status_code == 400, response.content
+
+    # 참가 신청하면 캐시된 목록이 무효화되어 바로 반영
+    other_user = create_test_user(
+        session, test_nationality, test_university, test_language
+    )
+    other_url = f"v1/profile/{other_user['id']}/meetings"
+    pending = client.get(other_url, params={"status": "PENDING"}).json()
+    assert pending["total_count"] == 0
+
+    create_test_meeting_user(
+        session=session, user_id=other_user["id"], meeting_id=meetings[0]["id"]
+    )
+    pending = client.get(other_url, params={"status": "PENDING"}).json()
+    assert pending["total_count"] == 1
+    assert pending["meetings"][0]["id"] == meetings[0]["id"]
@@ -1,7 +1,10 @@
 import json
 
+import crud
 from tests.confest import *
 from schemas import user as user_schmea
+from core.principal import principal_key, get_principal
+from core.mail import MailSender
 
 
 def test_read_current_user(client, test_token, test_user):
@@ -18,6 +21,47 @@ def test_read_current_user(client, test_token, test_user):
     assert data["email"] == test_email
 
 
+def test_current_user_principal_cache(client, session, test_token, test_user):
+    cache_key = principal_key("email", test_user.email)
+
+    response = client.get(
+        "v1/users/me", headers={"Authorization": f"Bearer {test_token}"}
+    )
+    assert response.status_code == 200, response.content
+    assert get_principal(cache_key).id == test_user.id
+
+    # 관리자 권한 변경 시 캐시 무효화
+    crud.user.made_admin(db=session, user_id=test_user.id)
+    assert get_principal(cache_key) is None
+
+    # 탈퇴한 유저의 토큰은 만료 전이어도 401
+    crud.user.deactive_user(db=session, user_id=test_user.id)
+    response = client.get(
+        "v1/users/me", headers={"Authorization": f"Bearer {test_token}"}
+    )
+    assert response.status_code == 401, response.content
+
+
+def test_principal_university_invalidation(
+    client, session, test_token, test_user, test_university
+):
+    cache_key = principal_key("email", test_user.email)
+    headers = {"Authorization": f"Bearer {test_token}"}
+
+    response = client.get("v1/token/validate", headers=headers)
+    assert response.status_code == 200, response.content
+    assert get_principal(cache_key).university_id == test_university.id
+
+    # 학교 삭제 후에는 principal도 다시 만들어야 함
+    user_university = crud.user.get_university(db=session, user_id=test_user.id)
+    crud.user.remove_university(db=session, id=user_university.id)
+    assert get_principal(cache_key) is None
+
+    response = client.get("v1/token/validate", headers=headers)
+    assert response.status_code == 200, response.content
+    assert get_principal(cache_key).university_id is None
+
+
 def test_delete_user(client, test_user, test_profile):
     user_id = test_user.id
     response = client.delete(f"v1/user/{user_id}")
@@ -115,3 +159,90 @@ def test_get_report_by_user(session, client, test_user):
     response = client.get(f"v1/user/{user_id}/report")
 
     assert response.status_code == 200, response.content
+
+
+def test_update_user_nationalities_only_touches_own_rows(
+    session, test_user, test_user_ios, test_nationality
+):
+    nationality1, nationality2 = test_nationality
+
+    crud.user.update_user_nationalities(
+        db=session, user_id=test_user.id, new_nationality_ids=[nationality1.id]
+    )
+
+    own = crud.user.read_nationalities(db=session, user_id=test_user.id)
+    other = crud.user.read_nationalities(db=session, user_id=test_user_ios.id)
+
+    assert [un.nationality_id for un in own] == [nationality1.id]
+    assert len(other) == 2
+
+
+def test_remove_nationality_refreshes_is_korean(
+    session, test_meeting, test_nationality, test_university, test_language
+):
+    nationality1, nationality2 = test_nationality
+    user = create_test_user(session, test_nationality, test_university, test_language)
+    crud.user.update_user_nationalities(
+        db=session,
+        user_id=user["id"],
+        new_nationality_ids=[nationality1.id, nationality2.id],
+    )
+    korean = next(
+        un
+        for un in crud.user.read_nationalities(db=session, user_id=user["id"])
+        if un.nationality_id == nationality1.id
+    )
+
+    # 한국 국적 삭제 후 승인하면 외국인 인원으로 집계
+    crud.user.remove_nationality(db=session, id=korean.id)
+    join_request = create_test_meeting_user(
+        session=session, user_id=user["id"], meeting_id=test_meeting.id
+    )
+    crud.meeting.join_request_approve(db=session, obj_id=join_request["id"])
+
+    session.refresh(test_meeting)
+    assert crud.user.get(db=session, id=user["id"]).is_korean is False
+    assert test_meeting.korean_count == 0
+    assert test_meeting.foreign_count == 2
+
+
+def test_email_certification(session):
+    email = "certification@example.com"
+    cert_in = user_schmea.EmailCertificationCheck(email=email, certification="123456")
+    crud.user.create_email_certification(db=session, obj_in=cert_in)
+
+    assert crud.user.get_email_certification(
+        session, email=email, certification="123456"
+    )
+    assert not crud.user.get_email_certification(
+        session, email=email, certification="000000"
+    )
+
+
+def test_mail_sender_reuses_connection(smtp_server):
+    sender = MailSender(
+        host="127.0.0.1",
+        port=smtp_server.port,
+        user="biskit@example.com",
+        password="password",
+        use_tls=False,
+        workers=1,
+    )
+    for i in range(5):
+        assert sender.enqueue(f"user{i}@example.com", "subject", "<p>body</p>")
+    sender.flush()
+    sender.stop()
+
+    assert len(smtp_server.messages) == 5
+    # 연결 한 번으로 모두 발송
+    assert smtp_server.connection_count == 1
+
+
+def test_email_template_language():
+    from crud.user import EMAIL_TEMPLATES, render_template
+
+    filename, subject = EMAIL_TEMPLATES["en"]
+    body = render_template(filename, certification="123456", s3_logo_url="logo")
+
+    assert subject == "BISKIT Email Certification"
+    assert "123456" in body and "Verification Code" in body
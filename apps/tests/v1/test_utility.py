@@ -0,0 +1,18 @@
+import pytest
+
+import crud
+from tests.confest import *
+from database.query_counter import track_queries, RepeatedQueryError
+
+
+def test_track_queries_groups_repeated_shapes(session, test_nationality):
+    nationality1, nationality2 = test_nationality
+
+    with track_queries() as stats:
+        for nationality in (nationality1, nationality2, nationality1):
+            crud.utility.get(db=session, nationality_id=nationality.id)
+
+    assert stats.count == 3
+    assert stats.repeated(threshold=2)[0][1] == 3
+    with pytest.raises(RepeatedQueryError):
+        stats.assert_no_repeats(threshold=2)